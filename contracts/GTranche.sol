@@ -163,13 +163,16 @@ contract GTranche is IGTranche, GERC1155, FixedTokensCurve, Owned {
 
         uint256 factor;
         uint256 trancheUtilisation;
+        // price all operations of the transaction from one oracle read
+        uint256[] memory prices = oracle.getPriceContext();
 
         // update value of current tranches - this prevents front-running of profits
         (trancheUtilisation, calcAmount, factor) = updateDistribution(
             _amount,
             _index,
             _tranche,
-            false
+            false,
+            prices
         );
 
         if (calcAmount < minDeposit) {
@@ -224,20 +227,23 @@ contract GTranche is IGTranche, GERC1155, FixedTokensCurve, Owned {
 
         uint256 factor;
         uint256 trancheUtilisation;
+        // price all operations of the transaction from one oracle read
+        uint256[] memory prices = oracle.getPriceContext();
 
         // update value of current tranches - this prevents front-running of losses
         (trancheUtilisation, calcAmount, factor) = updateDistribution(
             _amount,
             _index,
             _tranche,
-            true
+            true,
+            prices
         );
 
         if (!_tranche && trancheUtilisation > utilisationThreshold) {
             revert Errors.UtilisationTooHigh();
         }
 
-        yieldTokenAmounts = _calcTokenAmount(_index, calcAmount, false);
+        yieldTokenAmounts = _calcTokenAmount(_index, calcAmount, prices);
         tokenBalances[_index] -= yieldTokenAmounts;
         burn(_recipient, _tranche ? SENIOR : JUNIOR, calcAmount, factor);
         token.transfer(_recipient, yieldTokenAmounts);
@@ -276,6 +282,7 @@ contract GTranche is IGTranche, GERC1155, FixedTokensCurve, Owned {
     /// @param _index index of yield token
     /// @param _tranche senior or junior tranche being deposited/withdrawn
     /// @param _withdraw withdrawal or deposit
+    /// @param _prices price context of the transaction
     /// @return trancheUtilisation current utilisation of the two tranches (senior / junior)
     /// @return calcAmount value of tranche token in common denominator (USD)
     /// @return factor factor applied to the tranche token
@@ -283,7 +290,8 @@ contract GTranche is IGTranche, GERC1155, FixedTokensCurve, Owned {
         uint256 _amount,
         uint256 _index,
         bool _tranche,
-        bool _withdraw
+        bool _withdraw,
+        uint256[] memory _prices
     )
         internal
         returns (
@@ -296,7 +304,7 @@ contract GTranche is IGTranche, GERC1155, FixedTokensCurve, Owned {
             uint256[NO_OF_TRANCHES] memory _totalValue,
             int256 profit,
             int256 loss
-        ) = _pnlDistribution();
+        ) = _pnlDistribution(_prices);
         factor = _tranche
             ? factorWithAssets(_tranche ? SENIOR : JUNIOR, _totalValue[1])
             : factorWithAssets(_tranche ? SENIOR : JUNIOR, _totalValue[0]);
@@ -307,7 +315,7 @@ contract GTranche is IGTranche, GERC1155, FixedTokensCurve, Owned {
             if (_tranche) _totalValue[1] -= calcAmount;
             else _totalValue[0] -= calcAmount;
         } else {
-            calcAmount = _calcTokenValue(_index, _amount, true);
+            calcAmount = _calcTokenValue(_index, _amount, _prices);
             if (_tranche) _totalValue[1] += calcAmount;
             else _totalValue[0] += calcAmount;
         }
@@ -335,7 +343,9 @@ contract GTranche is IGTranche, GERC1155, FixedTokensCurve, Owned {
         )
     {
         int256[NO_OF_TRANCHES] memory _trancheBalances;
-        int256 totalValue = int256(_calcUnifiedValue());
+        int256 totalValue = int256(
+            _calcUnifiedValue(oracle.getPriceContext())
+        );
         _trancheBalances[0] = int256(trancheBalances[JUNIOR]);
         _trancheBalances[1] = int256(trancheBalances[SENIOR]);
         int256 lastTotal = _trancheBalances[0] + _trancheBalances[1];
@@ -365,7 +375,8 @@ contract GTranche is IGTranche, GERC1155, FixedTokensCurve, Owned {
     }
 
     /// @notice Calculate the changes in underlying token value and distribute profit
-    function _pnlDistribution()
+    /// @param _prices price context of the transaction
+    function _pnlDistribution(uint256[] memory _prices)
         internal
         returns (
             uint256[NO_OF_TRANCHES] memory newTrancheBalances,
@@ -374,7 +385,7 @@ contract GTranche is IGTranche, GERC1155, FixedTokensCurve, Owned {
         )
     {
         int256[NO_OF_TRANCHES] memory _trancheBalances;
-        int256 totalValue = int256(_calcUnifiedValue());
+        int256 totalValue = int256(_calcUnifiedValue(_prices));
         _trancheBalances[0] = int256(trancheBalances[JUNIOR]);
         _trancheBalances[1] = int256(trancheBalances[SENIOR]);
         int256 lastTotal = _trancheBalances[0] + _trancheBalances[1];
@@ -412,44 +423,45 @@ contract GTranche is IGTranche, GERC1155, FixedTokensCurve, Owned {
     /// @notice Calculate the price of the underlying yield token
     /// @param _index index of yield token
     /// @param _amount amount of yield tokens
-    /// @param _deposit is the transaction a deposit or a withdrawal
+    /// @param _prices price context of the transaction
+    /// @dev relies on the oracle pricing linearly, see IOracle.getPriceContext
     function _calcTokenValue(
         uint256 _index,
         uint256 _amount,
-        bool _deposit
+        uint256[] memory _prices
     ) internal view returns (uint256) {
         return
-            oracle.getSinglePrice(
-                _index,
-                getYieldTokenValue(_index, _amount),
-                _deposit
-            );
+            (getYieldTokenValue(_index, _amount) * _prices[_index]) /
+            DEFAULT_FACTOR;
     }
 
     /// @notice Calculate the number of yield token for the given amount
     /// @param _index index of yield token
     /// @param _amount amount to convert to yield tokens
-    /// @param _deposit is the transaction a deposit or a withdrawal
+    /// @param _prices price context of the transaction
     function _calcTokenAmount(
         uint256 _index,
         uint256 _amount,
-        bool _deposit
+        uint256[] memory _prices
     ) internal view returns (uint256) {
         return
             getYieldTokenAmount(
                 _index,
-                oracle.getTokenAmount(_index, _amount, _deposit)
+                (_amount * DEFAULT_FACTOR) / _prices[_index]
             );
     }
 
     /// @notice Calculate the value of all underlying yield tokens
-    function _calcUnifiedValue() internal view returns (uint256 totalValue) {
+    /// @param _prices price context of the transaction
+    function _calcUnifiedValue(uint256[] memory _prices)
+        internal
+        view
+        returns (uint256 totalValue)
+    {
         uint256[NO_OF_TOKENS] memory yieldTokenValues = getYieldTokenValues();
-        uint256[] memory tokenValues = new uint256[](NO_OF_TOKENS);
         for (uint256 i; i < NO_OF_TOKENS; ++i) {
-            tokenValues[i] = yieldTokenValues[i];
+            totalValue += (yieldTokenValues[i] * _prices[i]) / DEFAULT_FACTOR;
         }
-        totalValue = oracle.getTotalValue(tokenValues);
     }
 
     /*//////////////////////////////////////////////////////////////
@@ -3,6 +3,7 @@ pragma solidity 0.8.10;
 
 import {ERC20} from "./solmate/src/tokens/ERC20.sol";
 import {SafeTransferLib} from "./solmate/src/utils/SafeTransferLib.sol";
+import {SafeCastLib} from "./solmate/src/utils/SafeCastLib.sol";
 import {Math} from "@openzeppelin/contracts/utils/math/Math.sol";
 import {Owned} from "./solmate/src/auth/Owned.sol";
 import {ReentrancyGuard} from "./solmate/src/utils/ReentrancyGuard.sol";
@@ -28,6 +29,7 @@ import {StrategyQueue} from "./utils/StrategyQueue.sol";
 /// stablecoins following the EIP-4626 Standard
 contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
     using SafeTransferLib for ERC20;
+    using SafeCastLib for uint256;
 
     /*//////////////////////////////////////////////////////////////
                         CONSTANTS & IMMUTABLES
@@ -41,16 +43,20 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
                     STORAGE VARIABLES & TYPES
     //////////////////////////////////////////////////////////////*/
 
+    // Packed into two slots, the fields used by harvests and withdrawals
+    // share the first one. debtRatio is bounded by PERCENTAGE_DECIMAL_FACTOR.
+    // GVault isn't upgradeable and no migration path is provided, vaults
+    // deployed before the packing keep the six slot layout
     struct StrategyParams {
         bool active;
-        uint256 debtRatio;
-        uint256 lastReport;
-        uint256 totalDebt;
-        uint256 totalGain;
-        uint256 totalLoss;
+        uint16 debtRatio;
+        uint64 lastReport;
+        uint128 totalDebt;
+        uint128 totalGain;
+        uint128 totalLoss;
     }
 
-    mapping(address => StrategyParams) public strategies;
+    mapping(address => StrategyParams) internal _strategies;
     uint256 public vaultAssets;
 
     // Slow release of profit
@@ -127,6 +133,29 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
                             GETTERS
     //////////////////////////////////////////////////////////////*/
 
+    /// @notice Get the params of a strategy, widened from their packed storage
+    /// @param _strategy target strategy
+    function strategies(address _strategy)
+        external
+        view
+        returns (
+            bool active,
+            uint256 debtRatio,
+            uint256 lastReport,
+            uint256 totalDebt,
+            uint256 totalGain,
+            uint256 totalLoss
+        )
+    {
+        StrategyParams storage stratData = _strategies[_strategy];
+        active = stratData.active;
+        debtRatio = stratData.debtRatio;
+        lastReport = stratData.lastReport;
+        totalDebt = stratData.totalDebt;
+        totalGain = stratData.totalGain;
+        totalLoss = stratData.totalLoss;
+    }
+
     /// @notice Get number of strategies in underlying vault
     /// @return number of strategies in the withdrawal queue
     function getNoOfStrategies() external view returns (uint256) {
@@ -135,7 +164,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
 
     /// @notice Helper function for strategy to get debt from vault
     function getStrategyDebt() external view returns (uint256) {
-        return strategies[msg.sender].totalDebt;
+        return _strategies[msg.sender].totalDebt;
     }
 
     /// @notice Get total invested in strategy
@@ -146,7 +175,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
         view
         returns (uint256 amount)
     {
-        return strategies[nodes[_index].strategy].totalDebt;
+        return _strategies[nodes[_index].strategy].totalDebt;
     }
 
     /// @notice Helper function for strategy to get harvest data from vault
@@ -159,7 +188,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
             uint256
         )
     {
-        StrategyParams storage stratData = strategies[msg.sender];
+        StrategyParams storage stratData = _strategies[msg.sender];
         return (stratData.active, stratData.totalDebt, stratData.lastReport);
     }
 
@@ -503,7 +532,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
         external
         onlyOwner
     {
-        if (!strategies[_strategy].active) revert Errors.StrategyNotActive();
+        if (!_strategies[_strategy].active) revert Errors.StrategyNotActive();
         _setDebtRatio(_strategy, _debtRatio);
     }
 
@@ -515,14 +544,14 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
         onlyOwner
     {
         if (_strategy == ZERO_ADDRESS) revert Errors.ZeroAddress();
-        if (strategies[_strategy].active) revert Errors.StrategyActive();
+        if (_strategies[_strategy].active) revert Errors.StrategyActive();
         if (address(this) != IStrategy(_strategy).vault())
             revert Errors.IncorrectVaultOnStrategy();
 
-        StrategyParams storage newStrat = strategies[_strategy];
+        StrategyParams storage newStrat = _strategies[_strategy];
         newStrat.active = true;
         _setDebtRatio(_strategy, _debtRatio);
-        newStrat.lastReport = block.timestamp;
+        newStrat.lastReport = block.timestamp.safeCastTo64();
 
         _push(_strategy);
     }
@@ -532,7 +561,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
     /// @param _strategy address of old strategy
     /// @dev Should be called when all the debt has been paid back to the vault
     function removeStrategy(address _strategy) external onlyOwner {
-        if (!strategies[_strategy].active) revert Errors.StrategyNotActive();
+        if (!_strategies[_strategy].active) revert Errors.StrategyNotActive();
         _revokeStrategy(_strategy);
         _removeStrategy(_strategy);
     }
@@ -540,8 +569,8 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
     /// @notice remove strategy from the withdrawal queue
     /// @param _strategy address of strategy to remove
     function _removeStrategy(address _strategy) internal {
-        if (strategies[_strategy].active) revert Errors.StrategyActive();
-        if (strategies[_strategy].totalDebt > 0)
+        if (_strategies[_strategy].active) revert Errors.StrategyActive();
+        if (_strategies[_strategy].totalDebt > 0)
             revert Errors.StrategyDebtNotZero();
 
         _pop(_strategy);
@@ -549,7 +578,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
 
     /// @notice Remove strategy from vault adapter
     function revokeStrategy() external {
-        if (!strategies[msg.sender].active) revert Errors.StrategyNotActive();
+        if (!_strategies[msg.sender].active) revert Errors.StrategyNotActive();
         _revokeStrategy(msg.sender);
     }
 
@@ -595,7 +624,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
     /// @notice Helper function to get strategy's total debt to the vault
     /// @dev here to simplify strategy's life when trying to get the totalDebt
     function strategyDebt() external view returns (uint256) {
-        return strategies[msg.sender].totalDebt;
+        return _strategies[msg.sender].totalDebt;
     }
 
     /// @notice Report back any gains/losses from a (strategy) harvest, vault adapter
@@ -611,7 +640,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
         uint256 _debtPayment,
         bool _emergency
     ) external returns (uint256) {
-        StrategyParams storage _strategy = strategies[msg.sender];
+        StrategyParams storage _strategy = _strategies[msg.sender];
         if (!_strategy.active) revert Errors.StrategyNotActive();
         if (asset.balanceOf(msg.sender) < _debtPayment)
             revert Errors.IncorrectStrategyAccounting();
@@ -620,8 +649,8 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
             _reportLoss(msg.sender, _loss);
         }
         if (_gain > 0) {
-            _strategy.totalGain += _gain;
-            _strategy.totalDebt += _gain;
+            _strategy.totalGain = (_strategy.totalGain + _gain).safeCastTo128();
+            _strategy.totalDebt = (_strategy.totalDebt + _gain).safeCastTo128();
             vaultTotalDebt += _gain;
         }
 
@@ -633,7 +662,8 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
         uint256 debtPayment = Math.min(_debtPayment, debt);
 
         if (debtPayment > 0) {
-            _strategy.totalDebt = _strategy.totalDebt - debtPayment;
+            _strategy.totalDebt = (_strategy.totalDebt - debtPayment)
+                .safeCastTo128();
             vaultTotalDebt -= debtPayment;
             debt -= debtPayment;
         }
@@ -641,7 +671,8 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
         uint256 credit = _creditAvailable(msg.sender);
 
         if (credit > 0) {
-            _strategy.totalDebt += credit;
+            _strategy.totalDebt = (_strategy.totalDebt + credit)
+                .safeCastTo128();
             vaultTotalDebt += credit;
         }
 
@@ -673,7 +704,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
         }
 
         lastReport = block.timestamp;
-        _strategy.lastReport = lastReport;
+        _strategy.lastReport = lastReport.safeCastTo64();
 
         if (_emergency) {
             _removeStrategy(msg.sender);
@@ -721,7 +752,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
                 if (_assets <= vaultBalance) break;
                 uint256 amountNeeded = _assets - vaultBalance;
 
-                StrategyParams storage _strategyData = strategies[_strategy];
+                StrategyParams storage _strategyData = _strategies[_strategy];
                 amountNeeded = Math.min(amountNeeded, _strategyData.totalDebt);
                 // If nothing is needed or strategy has no assets, continue
                 if (amountNeeded > 0) {
@@ -734,7 +765,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
                         _reportLoss(_strategy, loss);
                     }
                     // Remove withdrawn amount from strategy and vault debts
-                    _strategyData.totalDebt -= withdrawn;
+                    _strategyData.totalDebt -= withdrawn.safeCastTo128();
                     vaultTotalDebt -= withdrawn;
                     vaultBalance += withdrawn;
                     emit LogWithdrawalFromStrategy(
@@ -784,7 +815,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
         view
         returns (uint256)
     {
-        StrategyParams memory _strategyData = strategies[_strategy];
+        StrategyParams storage _strategyData = _strategies[_strategy];
         uint256 vaultTotalAssets = _totalAssets();
         uint256 vaultDebtLimit = (vaultDebtRatio * vaultTotalAssets) /
             PERCENTAGE_DECIMAL_FACTOR;
@@ -811,12 +842,12 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
     /// @param _strategy target strategy
     /// @param _loss amount of loss realized
     function _reportLoss(address _strategy, uint256 _loss) internal {
-        StrategyParams storage strategy = strategies[_strategy];
+        StrategyParams storage strategy = _strategies[_strategy];
         // Loss can only be up the amount of debt issued to strategy
         if (strategy.totalDebt < _loss) revert Errors.StrategyLossTooHigh();
         // Add loss to strategy and remove loss from strategyDebt
-        strategy.totalLoss += _loss;
-        strategy.totalDebt -= _loss;
+        strategy.totalLoss = (strategy.totalLoss + _loss).safeCastTo128();
+        strategy.totalDebt -= _loss.safeCastTo128();
         vaultTotalDebt -= _loss;
     }
 
@@ -828,7 +859,7 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
         view
         returns (uint256, uint256)
     {
-        StrategyParams storage strategy = strategies[_strategy];
+        StrategyParams storage strategy = _strategies[_strategy];
         uint256 _debtRatio = strategy.debtRatio;
         uint256 strategyDebtLimit = (_debtRatio * _totalAssets()) /
             PERCENTAGE_DECIMAL_FACTOR;
@@ -856,11 +887,12 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
     /// @dev See setDebtRatio functions
     function _setDebtRatio(address _strategy, uint256 _debtRatio) internal {
         uint256 _vaultDebtRatio = vaultDebtRatio -
-            strategies[_strategy].debtRatio +
+            _strategies[_strategy].debtRatio +
             _debtRatio;
         if (_vaultDebtRatio > PERCENTAGE_DECIMAL_FACTOR)
             revert Errors.VaultDebtRatioTooHigh();
-        strategies[_strategy].debtRatio = _debtRatio;
+        // bounded by the vault debt ratio check above
+        _strategies[_strategy].debtRatio = uint16(_debtRatio);
         vaultDebtRatio = _vaultDebtRatio;
         emit LogNewDebtRatio(_strategy, _debtRatio, _vaultDebtRatio);
     }
@@ -878,9 +910,9 @@ contract GVault is Constants, ERC4626, StrategyQueue, Owned, ReentrancyGuard {
     /// @notice Remove strategy from vault
     /// @param _strategy address of strategy
     function _revokeStrategy(address _strategy) internal {
-        vaultDebtRatio -= strategies[_strategy].debtRatio;
-        strategies[_strategy].debtRatio = 0;
-        strategies[_strategy].active = false;
+        vaultDebtRatio -= _strategies[_strategy].debtRatio;
+        _strategies[_strategy].debtRatio = 0;
+        _strategies[_strategy].active = false;
     }
 
     /// @notice Vault adapters total assets including loose assets and debts
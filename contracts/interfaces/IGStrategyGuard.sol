@@ -26,6 +26,35 @@ interface IGStrategyGuard {
     /// @notice run strategy harvest
     function harvest() external;
 
+    /// @notice run harvest on every strategy that needs to be harvested
+    function bulkHarvest() external returns (uint256);
+
+    /// @notice run harvest on the strategies at the given queue positions
+    function bulkHarvestIndexes(uint256[] calldata indexes)
+        external
+        returns (uint256);
+
+    /// @notice queue positions of strategies that need setStopLossPrimer
+    function stopLossPrimerUpdates() external view returns (uint256[] memory);
+
+    /// @notice sets timer of the strategies at the given queue positions
+    function setStopLossPrimerIndexes(uint256[] calldata indexes) external;
+
+    /// @notice queue positions of strategies that need endStopLossPrimer
+    function stopLossPrimerEnds() external view returns (uint256[] memory);
+
+    /// @notice resets timer of the strategies at the given queue positions
+    function endStopLossPrimerIndexes(uint256[] calldata indexes) external;
+
+    /// @notice queue positions of strategies that need executeStopLoss
+    function stopLossExecutions() external view returns (uint256[] memory);
+
+    /// @notice run stop loss of the strategies at the given queue positions
+    function executeStopLossIndexes(uint256[] calldata indexes) external;
+
+    /// @notice queue positions of strategies that need a harvest
+    function harvestableStrategies() external view returns (uint256[] memory);
+
     /// @notice Check if any strategy with loss can be unlocked
     function canUnlockStrategy()
         external
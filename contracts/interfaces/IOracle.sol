@@ -25,4 +25,13 @@ interface IOracle {
         external
         view
         returns (uint256);
+
+    /// @notice Value of 1E18 of each underlying token in common denominator
+    /// @dev The tranche prices every amount within a transaction as
+    ///     amount * price / 1E18 from this context, in place of
+    ///     getSinglePrice, getTokenAmount and getTotalValue. Oracles must
+    ///     therefore price linearly in the amount and the same way for
+    ///     deposits and withdrawals, a relation that doesn't price linearly
+    ///     and symmetrically can't be used with GTranche
+    function getPriceContext() external view returns (uint256[] memory);
 }
@@ -55,4 +55,14 @@ contract MockCurveOracle is Relation {
     ) external view override returns (uint256) {
         return (_amount * DEFAULT_FACTOR) / getVirtualPrice();
     }
+
+    function getPriceContext()
+        external
+        view
+        override
+        returns (uint256[] memory prices)
+    {
+        prices = new uint256[](1);
+        prices[0] = getVirtualPrice();
+    }
 }
@@ -89,4 +89,18 @@ contract CurveOracle is Relation {
         }
         return total;
     }
+
+    /// @notice Get the value of one unit of each underlying token in common
+    ///     denominator, lets the caller price all its operations within a
+    ///     transaction from a single virtual price read
+    /// @return prices value of 1E18 of each underlying token
+    function getPriceContext()
+        external
+        view
+        override
+        returns (uint256[] memory prices)
+    {
+        prices = new uint256[](1);
+        prices[0] = getVirtualPrice();
+    }
 }
@@ -36,6 +36,12 @@ import {IOracle} from "../interfaces/IOracle.sol";
 ///         - Single price: What is the value of token x in a common denominator
 ///         - token amount: How much of token x do I get from common denominator y
 ///         - total value: What is the combined value of all underlying tokens in a common denominator
+///         - price context: The value of one unit (1E18) of each underlying token in the
+///             common denominator, read once per transaction by the tranche and used for
+///             all of its pricing within that transaction. The tranche scales it linearly
+///             and ignores the deposit/withdrawal direction, so a relation must price
+///             linearly and symmetrically for its single price, token amount and total
+///             value to agree with the context
 abstract contract Relation is IOracle {
     uint256 constant DEFAULT_FACTOR = 1_000_000_000_000_000_000;
 
@@ -66,4 +72,11 @@ abstract contract Relation is IOracle {
         virtual
         override
         returns (uint256);
+
+    function getPriceContext()
+        external
+        view
+        virtual
+        override
+        returns (uint256[] memory);
 }
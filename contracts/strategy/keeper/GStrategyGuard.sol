@@ -54,6 +54,16 @@ contract GStrategyGuard is IGStrategyGuard {
         string reason,
         bytes lowLevelData
     );
+    event LogStopLossFailure(
+        address strategy,
+        string reason,
+        bytes lowLevelData
+    );
+    event LogStrategyHarvestResult(
+        address indexed strategy,
+        uint256 index,
+        HarvestResult result
+    );
     event LogDebtThresholdSet(uint256 debtThreshold, uint256 oldThreshold);
     event LogGasThresholdSet(uint256 gasThreshold, uint256 oldThreshold);
 
@@ -80,6 +90,13 @@ contract GStrategyGuard is IGStrategyGuard {
         uint64 primerTimestamp; // The time at which the health threshold was broken
     }
 
+    // Outcome of a bulk harvest for a single strategy
+    enum HarvestResult {
+        HARVESTED, // runHarvest succeeded
+        FAILED, // runHarvest reverted, see LogStrategyHarvestFailure
+        LOSS_LOCKED // loss recorded, harvest locked until unlocked
+    }
+
     address[] public strategies;
 
     // maps a strategy to its stop loss data
@@ -212,15 +229,8 @@ contract GStrategyGuard is IGStrategyGuard {
     function canUpdateStopLoss() external view returns (bool result) {
         uint256 strategiesLength = strategies.length;
         for (uint256 i; i < strategiesLength; ++i) {
-            address strategy = strategies[i];
-            if (strategy == address(0)) continue;
-            if (IStrategy(strategy).canStopLoss()) {
-                if (
-                    strategyCheck[strategy].primerTimestamp == 0 &&
-                    strategyCheck[strategy].active
-                ) {
-                    result = true;
-                }
+            if (_canUpdateStopLoss(strategies[i])) {
+                result = true;
             }
         }
     }
@@ -229,15 +239,8 @@ contract GStrategyGuard is IGStrategyGuard {
     function canEndStopLoss() external view returns (bool result) {
         uint256 strategiesLength = strategies.length;
         for (uint256 i; i < strategiesLength; ++i) {
-            address strategy = strategies[i];
-            if (strategy == address(0)) continue;
-            if (!IStrategy(strategy).canStopLoss()) {
-                if (
-                    strategyCheck[strategy].primerTimestamp != 0 &&
-                    strategyCheck[strategy].active
-                ) {
-                    result = true;
-                }
+            if (_canEndStopLoss(strategies[i])) {
+                result = true;
             }
         }
     }
@@ -245,22 +248,96 @@ contract GStrategyGuard is IGStrategyGuard {
     /// @notice Check if stop loss needs to be executed
     function canExecuteStopLossPrimer() external view returns (bool result) {
         uint256 strategiesLength = strategies.length;
-        address strategy;
-        uint64 primerTimestamp;
         for (uint256 i; i < strategiesLength; i++) {
-            strategy = strategies[i];
-            primerTimestamp = strategyCheck[strategy].primerTimestamp;
-            if (primerTimestamp == 0) continue;
-            if (IStrategy(strategy).canStopLoss()) {
-                if (
-                    block.timestamp - primerTimestamp >=
-                    strategyCheck[strategy].timeLimit &&
-                    strategyCheck[strategy].active
-                ) {
-                    result = true;
-                }
+            if (_canExecuteStopLoss(strategies[i])) {
+                result = true;
+            }
+        }
+    }
+
+    /// @notice Positions in the strategy queue of the strategies that need
+    ///     their stop loss primer set, see setStopLossPrimerIndexes
+    function stopLossPrimerUpdates() external view returns (uint256[] memory) {
+        return _indexes(_canUpdateStopLoss);
+    }
+
+    /// @notice Positions in the strategy queue of the strategies that need
+    ///     their stop loss primer reset, see endStopLossPrimerIndexes
+    function stopLossPrimerEnds() external view returns (uint256[] memory) {
+        return _indexes(_canEndStopLoss);
+    }
+
+    /// @notice Positions in the strategy queue of the strategies that need
+    ///     their stop loss executed, see executeStopLossIndexes
+    function stopLossExecutions() external view returns (uint256[] memory) {
+        return _indexes(_canExecuteStopLoss);
+    }
+
+    /// @notice Positions in the strategy queue of the strategies that need
+    ///     to be harvested, see bulkHarvestIndexes
+    function harvestableStrategies() external view returns (uint256[] memory) {
+        return _indexes(_canHarvest);
+    }
+
+    /// @notice Positions in the strategy queue of the strategies that pass a check
+    /// @param check per strategy check
+    function _indexes(function(address) view returns (bool) check)
+        internal
+        view
+        returns (uint256[] memory indexes)
+    {
+        uint256 strategiesLength = strategies.length;
+        uint256[] memory matches = new uint256[](strategiesLength);
+        uint256 noOfMatches;
+        for (uint256 i; i < strategiesLength; ++i) {
+            if (check(strategies[i])) {
+                matches[noOfMatches] = i;
+                ++noOfMatches;
             }
         }
+        indexes = new uint256[](noOfMatches);
+        for (uint256 i; i < noOfMatches; ++i) {
+            indexes[i] = matches[i];
+        }
+    }
+
+    /// @notice Check if the stop loss primer of a strategy needs to be set
+    /// @param strategy the target strategy
+    function _canUpdateStopLoss(address strategy) internal view returns (bool) {
+        if (strategy == address(0)) return false;
+        if (
+            strategyCheck[strategy].primerTimestamp != 0 ||
+            !strategyCheck[strategy].active
+        ) return false;
+        return IStrategy(strategy).canStopLoss();
+    }
+
+    /// @notice Check if the stop loss primer of a strategy needs to be reset
+    /// @param strategy the target strategy
+    function _canEndStopLoss(address strategy) internal view returns (bool) {
+        if (strategy == address(0)) return false;
+        if (
+            strategyCheck[strategy].primerTimestamp == 0 ||
+            !strategyCheck[strategy].active
+        ) return false;
+        return !IStrategy(strategy).canStopLoss();
+    }
+
+    /// @notice Check if the stop loss of a strategy needs to be executed
+    /// @param strategy the target strategy
+    function _canExecuteStopLoss(address strategy)
+        internal
+        view
+        returns (bool)
+    {
+        uint64 primerTimestamp = strategyCheck[strategy].primerTimestamp;
+        if (primerTimestamp == 0 || strategy == address(0)) return false;
+        if (
+            block.timestamp - primerTimestamp <
+            strategyCheck[strategy].timeLimit ||
+            !strategyCheck[strategy].active
+        ) return false;
+        return IStrategy(strategy).canStopLoss();
     }
 
     /// @notice Check if any strategy with loss can be unlocked
@@ -373,6 +450,73 @@ contract GStrategyGuard is IGStrategyGuard {
         }
     }
 
+    /// @notice Set the stop loss primer of the strategies at the given positions
+    ///     of the strategy queue that need it
+    /// @param _indexes positions of the strategies in the strategy queue
+    /// @dev strategies are checked again, indexes past the end of the queue are skipped
+    function setStopLossPrimerIndexes(uint256[] calldata _indexes) external {
+        if (!keepers[msg.sender]) revert GuardErrors.NotKeeper();
+        uint256 strategiesLength = strategies.length;
+        for (uint256 i; i < _indexes.length; ++i) {
+            if (_indexes[i] >= strategiesLength) continue;
+            address strategy = strategies[_indexes[i]];
+            if (!_canUpdateStopLoss(strategy)) continue;
+            strategyCheck[strategy].primerTimestamp = uint64(block.timestamp);
+            emit LogStopLossEscalated(strategy);
+        }
+    }
+
+    /// @notice Reset the stop loss primer of the strategies at the given positions
+    ///     of the strategy queue that need it
+    /// @param _indexes positions of the strategies in the strategy queue
+    /// @dev strategies are checked again, indexes past the end of the queue are skipped
+    function endStopLossPrimerIndexes(uint256[] calldata _indexes) external {
+        if (!keepers[msg.sender]) revert GuardErrors.NotKeeper();
+        uint256 strategiesLength = strategies.length;
+        for (uint256 i; i < _indexes.length; ++i) {
+            if (_indexes[i] >= strategiesLength) continue;
+            address strategy = strategies[_indexes[i]];
+            if (!_canEndStopLoss(strategy)) continue;
+            strategyCheck[strategy].primerTimestamp = 0;
+            emit LogStopLossDescalated(strategy, true);
+        }
+    }
+
+    /// @notice Execute the stop loss of the strategies at the given positions
+    ///     of the strategy queue that need it
+    /// @param _indexes positions of the strategies in the strategy queue
+    /// @dev strategies are checked again, indexes past the end of the queue are skipped.
+    ///     A reverting stop loss is logged and doesn't stop the rest of the batch
+    function executeStopLossIndexes(uint256[] calldata _indexes) external {
+        if (!keepers[msg.sender]) revert GuardErrors.NotKeeper();
+        uint256 strategiesLength = strategies.length;
+        for (uint256 i; i < _indexes.length; ++i) {
+            if (_indexes[i] >= strategiesLength) continue;
+            address strategy = strategies[_indexes[i]];
+            if (!_canExecuteStopLoss(strategy)) continue;
+            _executeStopLoss(strategy);
+        }
+    }
+
+    /// @notice Execute the stop loss of a strategy, catching reverts
+    /// @param strategy the target strategy
+    function _executeStopLoss(address strategy) internal {
+        bool success;
+        try IStrategy(strategy).stopLoss() returns (bool result) {
+            success = result;
+        } catch Error(string memory reason) {
+            emit LogStopLossFailure(strategy, reason, "");
+        } catch (bytes memory lowLevelData) {
+            emit LogStopLossFailure(strategy, "", lowLevelData);
+        }
+        emit LogStopLossExecuted(strategy, success);
+        if (success) {
+            strategyCheck[strategy].primerTimestamp = 0;
+            strategyCheck[strategy].active = false;
+            emit LogStopLossDescalated(strategy, false);
+        }
+    }
+
     /// @notice Function that converts _amount of ETH to USD using CL ETH/USD pricefeed
     /// @notice It also scales the price to 18 decimals as ETH/USD feed has non 18 decimals
     /// @param _amount the amount of ETH to convert
@@ -446,24 +590,27 @@ contract GStrategyGuard is IGStrategyGuard {
     function canHarvest() external view returns (bool result) {
         uint256 strategiesLength = strategies.length;
         for (uint256 i; i < strategiesLength; ++i) {
-            address strategy = strategies[i];
-            if (strategy == address(0)) continue;
-            // Skip locked strategies
-            if (
-                !strategyCheck[strategy].canHarvestWithLoss &&
-                strategyCheck[strategy].lossStartBlock > 0
-            ) continue;
-            if (
-                IStrategy(strategy).canHarvest() &&
-                _profitOrLossExceeded(IStrategy(strategy))
-            ) {
-                if (strategyCheck[strategy].active) {
-                    result = true;
-                }
+            if (_canHarvest(strategies[i])) {
+                result = true;
             }
         }
     }
 
+    /// @notice Check if a strategy needs to be harvested
+    /// @param strategy the target strategy
+    function _canHarvest(address strategy) internal view returns (bool) {
+        if (strategy == address(0)) return false;
+        // Skip locked strategies
+        if (
+            !strategyCheck[strategy].canHarvestWithLoss &&
+            strategyCheck[strategy].lossStartBlock > 0
+        ) return false;
+        return
+            IStrategy(strategy).canHarvest() &&
+            _profitOrLossExceeded(IStrategy(strategy)) &&
+            strategyCheck[strategy].active;
+    }
+
     /// @notice Unlock canHarvestWithLoss for strategy
     /// @param strategy the target strategy
     function unlockLoss(address strategy) external {
@@ -513,4 +660,66 @@ contract GStrategyGuard is IGStrategyGuard {
             }
         }
     }
+
+    /// @notice Harvest every strategy that needs to be harvested
+    /// @return harvested number of strategies harvested
+    function bulkHarvest() external returns (uint256 harvested) {
+        if (!keepers[msg.sender]) revert GuardErrors.NotKeeper();
+        uint256 strategiesLength = strategies.length;
+        for (uint256 i; i < strategiesLength; ++i) {
+            if (_bulkHarvest(i)) ++harvested;
+        }
+    }
+
+    /// @notice Harvest the strategies at the given positions of the strategy
+    ///     queue that need to be harvested
+    /// @param _indexes positions of the strategies in the strategy queue
+    /// @return harvested number of strategies harvested
+    /// @dev strategies are checked again, indexes past the end of the queue are skipped
+    function bulkHarvestIndexes(uint256[] calldata _indexes)
+        external
+        returns (uint256 harvested)
+    {
+        if (!keepers[msg.sender]) revert GuardErrors.NotKeeper();
+        uint256 strategiesLength = strategies.length;
+        for (uint256 i; i < _indexes.length; ++i) {
+            if (_indexes[i] >= strategiesLength) continue;
+            if (_bulkHarvest(_indexes[i])) ++harvested;
+        }
+    }
+
+    /// @notice Harvest the strategy at position i of the strategy queue if it
+    ///     needs to be harvested, a failing harvest doesn't revert the batch
+    /// @param i position of the strategy in the strategy queue
+    /// @return true if the strategy was harvested
+    function _bulkHarvest(uint256 i) internal returns (bool) {
+        address strategy = strategies[i];
+        if (!_canHarvest(strategy)) return false;
+        // Record the start block of the loss and don't allow to run with canHarvestWithLoss unless
+        // It's explicitly allowed
+        if (
+            !strategyCheck[strategy].canHarvestWithLoss &&
+            _getExcessDebt(IStrategy(strategy)) > 0
+        ) {
+            strategyCheck[strategy].lossStartBlock = block.number;
+            emit LogStrategyHarvestResult(
+                strategy,
+                i,
+                HarvestResult.LOSS_LOCKED
+            );
+            return false;
+        }
+        try IStrategy(strategy).runHarvest() {
+            // Reset loss related storage variables so next time we can do checks again
+            _resetLossStartBlock(strategy);
+            emit LogStrategyHarvestResult(strategy, i, HarvestResult.HARVESTED);
+            return true;
+        } catch Error(string memory reason) {
+            emit LogStrategyHarvestFailure(strategy, reason, "");
+        } catch (bytes memory lowLevelData) {
+            emit LogStrategyHarvestFailure(strategy, "", lowLevelData);
+        }
+        emit LogStrategyHarvestResult(strategy, i, HarvestResult.FAILED);
+        return false;
+    }
 }
@@ -96,4 +96,92 @@ contract GStopLossResolver is Owned {
             execPayload = abi.encodeWithSelector(executor.harvest.selector);
         }
     }
+
+    /// @notice returns correct payload to gelato to harvest every strategy
+    /// that needs to be harvested in one transaction
+    function taskStrategyBulkHarvest()
+        external
+        view
+        returns (bool canExec, bytes memory execPayload)
+    {
+        IGStrategyGuard executor = IGStrategyGuard(stopLossExecutor);
+        if (executor.canHarvest()) {
+            canExec = true;
+            execPayload = abi.encodeWithSelector(
+                executor.bulkHarvest.selector
+            );
+        }
+    }
+
+    /// @notice returns payload to gelato to set the stop loss primer of every
+    /// strategy that needs it, targeting them by strategy queue position
+    function taskUpdateStopLossPrimerIndexes()
+        external
+        view
+        returns (bool canExec, bytes memory execPayload)
+    {
+        IGStrategyGuard executor = IGStrategyGuard(stopLossExecutor);
+        uint256[] memory indexes = executor.stopLossPrimerUpdates();
+        if (indexes.length > 0) {
+            canExec = true;
+            execPayload = abi.encodeWithSelector(
+                executor.setStopLossPrimerIndexes.selector,
+                indexes
+            );
+        }
+    }
+
+    /// @notice returns payload to gelato to reset the stop loss primer of every
+    /// strategy that needs it, targeting them by strategy queue position
+    function taskStopStopLossPrimerIndexes()
+        external
+        view
+        returns (bool canExec, bytes memory execPayload)
+    {
+        IGStrategyGuard executor = IGStrategyGuard(stopLossExecutor);
+        uint256[] memory indexes = executor.stopLossPrimerEnds();
+        if (indexes.length > 0) {
+            canExec = true;
+            execPayload = abi.encodeWithSelector(
+                executor.endStopLossPrimerIndexes.selector,
+                indexes
+            );
+        }
+    }
+
+    /// @notice returns payload to gelato to execute the stop loss of every
+    /// strategy that needs it, targeting them by strategy queue position
+    function taskTriggerStopLossIndexes()
+        external
+        view
+        returns (bool canExec, bytes memory execPayload)
+    {
+        IGStrategyGuard executor = IGStrategyGuard(stopLossExecutor);
+        uint256[] memory indexes = executor.stopLossExecutions();
+        if (indexes.length > 0) {
+            canExec = true;
+            execPayload = abi.encodeWithSelector(
+                executor.executeStopLossIndexes.selector,
+                indexes
+            );
+        }
+    }
+
+    /// @notice returns payload to gelato to harvest every strategy that needs
+    /// it, targeting them by strategy queue position
+    function taskStrategyHarvestIndexes()
+        external
+        view
+        returns (bool canExec, bytes memory execPayload)
+    {
+        IGStrategyGuard executor = IGStrategyGuard(stopLossExecutor);
+        uint256[] memory indexes = executor.harvestableStrategies();
+        if (indexes.length > 0) {
+            canExec = true;
+            execPayload = abi.encodeWithSelector(
+                executor.bulkHarvestIndexes.selector,
+                indexes
+            );
+        }
+    }
 }
@@ -0,0 +1,135 @@
+// SPDX-License-Identifier: AGPLv3
+pragma solidity 0.8.10;
+
+import {GTranche} from "../GTranche.sol";
+import {GVault} from "../GVault.sol";
+
+//  ________  ________  ________
+//  |\   ____\|\   __  \|\   __  \
+//  \ \  \___|\ \  \|\  \ \  \|\  \
+//   \ \  \  __\ \   _  _\ \  \\\  \
+//    \ \  \|\  \ \  \\  \\ \  \\\  \
+//     \ \_______\ \__\\ _\\ \_______\
+//      \|_______|\|__|\|__|\|_______|
+
+// gro protocol: https://github.com/groLabs/GSquared
+
+/// @title GLens
+/// @notice GLens - Read only view of the GTranche and GVault state
+///
+///     Aggregates the tranche and vault views used by frontends and monitoring
+///     into a single struct, allowing off-chain clients to refresh the full
+///     protocol state with one eth_call per block. Holds no state and has no
+///     privileged functions, a single deployment can serve any tranche/vault pair.
+contract GLens {
+    uint256 internal constant NO_OF_TRANCHES = 2;
+    uint256 internal constant JUNIOR = 0;
+    uint256 internal constant SENIOR = 1;
+
+    struct TrancheState {
+        uint256[NO_OF_TRANCHES] trancheBalances;
+        uint256[NO_OF_TRANCHES] pnlBalances;
+        int256 profit;
+        int256 loss;
+        uint256 utilisation;
+        uint256 utilisationThreshold;
+        uint256[NO_OF_TRANCHES] factors;
+        uint256[NO_OF_TRANCHES] pricePerShare;
+        uint256[NO_OF_TRANCHES] totalSupply;
+    }
+
+    struct StrategyState {
+        address strategy;
+        bool active;
+        uint256 debtRatio;
+        uint256 lastReport;
+        uint256 totalDebt;
+        uint256 totalGain;
+        uint256 totalLoss;
+    }
+
+    struct VaultState {
+        uint256 totalAssets;
+        uint256 realizedTotalAssets;
+        uint256 pricePerShare;
+        uint256 totalSupply;
+        uint256 vaultDebtRatio;
+        uint256 vaultTotalDebt;
+        uint256 lockedProfit;
+        uint256 lastReport;
+        StrategyState[] strategies;
+    }
+
+    struct ProtocolState {
+        uint256 blockNumber;
+        uint256 timestamp;
+        TrancheState tranche;
+        VaultState vault;
+    }
+
+    /// @notice Get the full state of a tranche and its underlying vault
+    /// @param _tranche GTranche to read
+    /// @param _vault GVault to read
+    function getState(GTranche _tranche, GVault _vault)
+        external
+        view
+        returns (ProtocolState memory state)
+    {
+        state.blockNumber = block.number;
+        state.timestamp = block.timestamp;
+        state.tranche = getTrancheState(_tranche);
+        state.vault = getVaultState(_vault);
+    }
+
+    /// @notice Get the accounting and pricing state of a tranche
+    /// @param _tranche GTranche to read
+    function getTrancheState(GTranche _tranche)
+        public
+        view
+        returns (TrancheState memory state)
+    {
+        (state.pnlBalances, state.profit, state.loss) = _tranche
+            .pnlDistribution();
+        state.utilisation = _tranche.utilisation();
+        state.utilisationThreshold = _tranche.utilisationThreshold();
+        for (uint256 i; i < NO_OF_TRANCHES; ++i) {
+            state.trancheBalances[i] = _tranche.trancheBalances(i);
+            state.factors[i] = _tranche.factor(i);
+            state.pricePerShare[i] = _tranche.getPricePerShare(i);
+            state.totalSupply[i] = _tranche.totalSupply(i);
+        }
+    }
+
+    /// @notice Get the asset state of a vault and all strategies in its
+    ///     withdrawal queue, in order of withdrawal priority
+    /// @param _vault GVault to read
+    function getVaultState(GVault _vault)
+        public
+        view
+        returns (VaultState memory state)
+    {
+        state.totalAssets = _vault.totalAssets();
+        state.realizedTotalAssets = _vault.realizedTotalAssets();
+        state.pricePerShare = _vault.getPricePerShare();
+        state.totalSupply = _vault.totalSupply();
+        state.vaultDebtRatio = _vault.vaultDebtRatio();
+        state.vaultTotalDebt = _vault.vaultTotalDebt();
+        state.lockedProfit = _vault.lockedProfit();
+        state.lastReport = _vault.lastReport();
+
+        uint256 noOfStrategies = _vault.getNoOfStrategies();
+        state.strategies = new StrategyState[](noOfStrategies);
+        for (uint256 i; i < noOfStrategies; ++i) {
+            StrategyState memory strategy = state.strategies[i];
+            strategy.strategy = _vault.withdrawalQueueAt(i);
+            (
+                strategy.active,
+                strategy.debtRatio,
+                strategy.lastReport,
+                strategy.totalDebt,
+                strategy.totalGain,
+                strategy.totalLoss
+            ) = _vault.strategies(strategy.strategy);
+        }
+    }
+}
@@ -1,7 +1,7 @@
 #!/bin/bash
 
 unset options
-options=("setup" "migrate" "harvest" "deploy strategy" "Quit")
+options=("setup" "migrate" "migrate batch" "harvest" "keeper" "deploy strategy" "Quit")
 select opt in "${options[@]}"
 do
     case $opt in
@@ -9,6 +9,10 @@ do
 	    read -p 'check trigger): ' trigger
             (cd ..; brownie run scripts/scripts/harvest.py trigger --network $ETH_NETWORK)
             ;;
+        "keeper")
+	    read -p 'check trigger): ' trigger
+            (cd ..; brownie run scripts/scripts/keeper.py main $trigger --network $ETH_NETWORK)
+            ;;
         "setup")
             (cd ..; rm -r build)
             (cd ..; brownie run scripts/scripts/setup.py deploy --network $ETH_NETWORK)
@@ -20,6 +24,13 @@ do
             (cd ..; brownie run scripts/scripts/setup.py schedule_migration --network $ETH_NETWORK)
             (cd ..; brownie run scripts/scripts/setup.py migrate $min_3crv $min_shares --network $ETH_NETWORK)
             ;;
+        "migrate batch")
+	    read -p 'min 3Crv amount (1M == 1E24): ' min_3crv
+	    read -p 'min Shares amount (1M == 1E24): ' min_shares
+            (cd ..; brownie run scripts/scripts/setup.py harvest_all --network $ETH_NETWORK)
+            (cd ..; brownie run scripts/scripts/setup.py schedule_migration_batch --network $ETH_NETWORK)
+            (cd ..; brownie run scripts/scripts/setup.py migrate $min_3crv $min_shares true --network $ETH_NETWORK)
+            ;;
         "deploy strategy")
 	    read -p 'convex pid: ' pid
 	    read -p 'strategy debt ratio: ' debt_ratio
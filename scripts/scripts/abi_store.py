@@ -0,0 +1,128 @@
+import json
+import os
+from distutils.util import strtobool
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from brownie import Contract
+
+from . import addresses
+
+# bump when the layout of stored entries changes, older entries are refetched
+STORE_VERSION = 1
+STORE_PATH = Path(
+    os.getenv("ABI_STORE_PATH", Path(__file__).resolve().parents[2] / "abis")
+)
+# never fall back to the block explorer, missing entries raise instead
+OFFLINE = strtobool(os.getenv("ABI_STORE_OFFLINE", "false"))
+
+
+class MissingABIError(Exception):
+    pass
+
+
+def _entry_path(address) -> Path:
+    return STORE_PATH / f"{address.lower()}.json"
+
+
+def load(address) -> Optional[dict]:
+    """Stored name and ABI of a contract, None if it isn't in the store"""
+    path = _entry_path(address)
+    if not path.exists():
+        return None
+    with open(path) as entry_file:
+        entry = json.load(entry_file)
+    if entry.get("version") != STORE_VERSION:
+        return None
+    return entry
+
+
+def save(address, name, abi):
+    STORE_PATH.mkdir(parents=True, exist_ok=True)
+    entry = {"version": STORE_VERSION, "name": name, "address": address, "abi": abi}
+    with open(_entry_path(address), "w") as entry_file:
+        json.dump(entry, entry_file, indent=2, sort_keys=True)
+
+
+def contract(address):
+    """Contract(address) that resolves the ABI from the local store first
+
+    Falls back to brownie's explorer lookup for addresses that aren't stored
+    yet and writes the result through to the store, unless ABI_STORE_OFFLINE
+    is set.
+    """
+    entry = load(address)
+    if entry is not None:
+        return Contract.from_abi(entry["name"], address, entry["abi"], persist=False)
+    if OFFLINE:
+        raise MissingABIError(
+            f"{address} isn't in the ABI store {STORE_PATH}, run "
+            "scripts/scripts/abi_store.py with network access to add it"
+        )
+    return fetch(address)
+
+
+def known_addresses() -> Dict[str, str]:
+    """Mainnet addresses the scripts and tests look up by address"""
+    known = {}
+    for name, value in vars(addresses).items():
+        if isinstance(value, str) and value.startswith("0x") and len(value) == 42:
+            known[name] = value
+    for i, value in enumerate(addresses.CHAINLINK_AGG_ADDRESSES):
+        known[f"CHAINLINK_AGG_{i}"] = value
+    for pool, data in addresses.convex_pools.items():
+        for key in ["LP_TOKEN", "REWARDS"]:
+            known[f"{pool}_{key}"] = data[key]
+    return known
+
+
+def missing() -> Dict[str, str]:
+    """Known addresses that aren't in the store, by name"""
+    return {
+        name: address
+        for name, address in known_addresses().items()
+        if load(address) is None
+    }
+
+
+def fetch(address):
+    """Fetch a contract from the block explorer into the store"""
+    fetched = Contract.from_explorer(address)
+    save(address, fetched._name, fetched.abi)
+    return fetched
+
+
+def prefetch(refresh="false") -> List[str]:
+    """Fetch every known address into the store, run with network access
+
+    Also follows the vault adapters to their vaults, which are resolved on
+    chain by the migration scripts.
+    """
+    refresh = strtobool(refresh)
+    targets = {address.lower(): name for name, address in known_addresses().items()}
+    for adapter in [
+        addresses.DAI_VAULT_ADAPTOR_ADDRESS,
+        addresses.USDC_VAULT_ADAPTOR_ADDRESS,
+        addresses.USDT_VAULT_ADAPTOR_ADDRESS,
+    ]:
+        targets[contract(adapter).vault().lower()] = f"vault of {adapter}"
+
+    fetched = []
+    for address, name in targets.items():
+        if not refresh and load(address) is not None:
+            continue
+        try:
+            entry = fetch(address)
+        except Exception as e:
+            print(f"{name} {address}: fetch failed, {e}")
+            continue
+        fetched.append(address)
+        print(f"{name} {address}: stored {entry._name}")
+    return fetched
+
+
+def main(refresh="false"):
+    fetched = prefetch(refresh)
+    print(f"stored {len(fetched)} contracts in {STORE_PATH}")
+    for name, address in missing().items():
+        print(f"{name} {address}: still missing")
@@ -25,6 +25,8 @@ BASED_ADDRESS = "0xBa5ED108abA290BBdFDD88A0F022E2357349566a"
 
 TIMELOCK_ADDRESS = "0x1aebe9147766936906ab56ec0693306da3539824"
 
+CL_ETH_USD_ADDRESS = "0x5f4eC3Df9cbd43714FE2740f5E3616155c5b8419"
+
 CHAINLINK_AGG_ADDRESSES = [
     "0xaed0c38402a5d19df6e4c03f4e2dced6e29c1ee9",
     "0x8fffffd4afb6115b954bd326cbe7b4ba576818f6",
@@ -38,6 +40,8 @@ USDC_STRATEGY_2 = "0x8b335D3E266389Ae08A2F22b01D33813d40ED8Fd"
 USDT_STRATEGY_1 = "0xDE5a25415C637b52d59Ef980b29a5fDa8dC3C70B"
 
 CONVEX_DEPOSIT = "0xF403C135812408BFbE8713b5A23a04b3D48AAE31"
+CVX_ADDRESS = "0x4e3FBD56CD56c3e72c1403e103b45Db9da5B9D2B"
+USDC_ETH_V3_ADDRESS = "0x88e6A0c2dDD26FEEb64F039a2c41296FcB3f5640"
 
 convex_pools = {
     "LUSD": {
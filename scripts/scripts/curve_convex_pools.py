@@ -1,31 +1,33 @@
 import os
 from distutils.util import strtobool
 
-from brownie import Contract, ConvexStrategy, StopLossLogic
+from brownie import ConvexStrategy, StopLossLogic
 
+from .abi_store import contract
 from .addresses import *
+from .deployer import Ref, call_step, deploy_step
 from .tokens import *
 
 PUBLISH_SOURCE = strtobool(os.getenv("PUBLISH_SOURCE"))
 
 
 def curve_pools(address_curve):
-    return Contract(address_curve)
+    return contract(address_curve)
 
 
 def convex_deposit():
-    return Contract(CONVEX_DEPOSIT)
+    return contract(CONVEX_DEPOSIT)
 
 
 def convex_pool():
     def _convex_pool(address_convex):
-        return Contract(address_convex)
+        return contract(address_convex)
 
     yield _convex_pool
 
 
 def curve_3pool():
-    yield Contract(THREE_POOL_TOKEN)
+    yield contract(THREE_POOL_TOKEN)
 
 
 def setup_strategy_in_vault(strategy, vault, admin, debt=10000):
@@ -52,6 +54,31 @@ def generate_strategy(admin, pid, lp, vault, snl, amount=2000, connect=True):
     return strategy_convex
 
 
+def strategy_steps(name, admin, pid, lp, vault, snl, amount=2000, connect=True):
+    """Deployment steps of generate_strategy, vault and snl are step names"""
+    steps = [
+        deploy_step(name, ConvexStrategy, Ref(vault), admin, pid, lp),
+        call_step(f"{name}.setKeeper", Ref(name), "setKeeper", admin),
+        call_step(f"{name}.setStopLossLogic", Ref(name), "setStopLossLogic", Ref(snl)),
+    ]
+    if connect:
+        steps += [
+            call_step(
+                f"{name}.addStrategy", Ref(vault), "addStrategy", Ref(name), amount
+            ),
+            call_step(
+                f"{name}.runHarvest",
+                Ref(name),
+                "runHarvest",
+                after=(f"{name}.setKeeper", f"{name}.addStrategy"),
+            ),
+            call_step(
+                f"{name}.setStrategy", Ref(snl), "setStrategy", Ref(name), 1e18, 400
+            ),
+        ]
+    return steps
+
+
 def test_snl(admin):
     test_snl = admin.deploy(StopLossLogic, publish_source=PUBLISH_SOURCE)
     return test_snl
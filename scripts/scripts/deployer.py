@@ -0,0 +1,290 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import rlp
+from brownie import Contract, web3
+from eth_utils import keccak, to_canonical_address, to_checksum_address
+
+
+class DeploymentError(Exception):
+    pass
+
+
+class Ref(NamedTuple):
+    """Placeholder for the address of a contract deployed by an earlier step"""
+
+    step: str
+
+
+class Step(NamedTuple):
+    """A single deployment or contract call
+
+    target is a contract container to deploy when method is None, otherwise a
+    Ref to the deployed contract method is called on. Refs in args are
+    replaced with addresses and make the step depend on the referenced step.
+    """
+
+    name: str
+    target: Any
+    method: Optional[str]
+    args: Tuple
+    after: Tuple[str, ...] = ()
+    gas_limit: Optional[int] = None
+
+
+def deploy_step(name, container, *args, after=(), gas_limit=None) -> Step:
+    return Step(name, container, None, args, tuple(after), gas_limit)
+
+
+def call_step(name, target, method, *args, after=(), gas_limit=None) -> Step:
+    return Step(name, target, method, args, tuple(after), gas_limit)
+
+
+def create_address(sender, nonce) -> str:
+    """Address of a contract created by sender at nonce"""
+    encoded = rlp.encode([to_canonical_address(sender), nonce])
+    return to_checksum_address(keccak(encoded)[12:])
+
+
+def digest(*parts: str) -> str:
+    """sha256 of hex strings, bytecode may hold unlinked library placeholders"""
+    data = "".join(part[2:] if part[:2] == "0x" else part for part in parts)
+    return hashlib.sha256(data.lower().encode()).hexdigest()
+
+
+def _refs(value):
+    if isinstance(value, Ref):
+        yield value.step
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _refs(item)
+
+
+def _resolve(value, addresses):
+    if isinstance(value, Ref):
+        return addresses[value.step]
+    if isinstance(value, (list, tuple)):
+        return type(value)(_resolve(item, addresses) for item in value)
+    return value
+
+
+def dependencies(steps: List[Step]) -> Dict[str, Tuple[str, ...]]:
+    """Dependency graph of the steps, validated to be acyclic"""
+    names = [step.name for step in steps]
+    if len(set(names)) != len(names):
+        raise DeploymentError("duplicate step names")
+    graph = {}
+    for step in steps:
+        deps = list(_refs(step.target)) + list(_refs(step.args)) + list(step.after)
+        for dep in deps:
+            if dep not in names:
+                raise DeploymentError(f"{step.name} depends on unknown step {dep}")
+        graph[step.name] = tuple(dict.fromkeys(deps))
+
+    # depth first search, a step seen again while still on the path is a cycle
+    done, path = set(), set()
+
+    def visit(name):
+        if name in done:
+            return
+        if name in path:
+            raise DeploymentError(f"dependency cycle through {name}")
+        path.add(name)
+        for dep in graph[name]:
+            visit(dep)
+        path.remove(name)
+        done.add(name)
+
+    for name in names:
+        visit(name)
+    return graph
+
+
+def chain_key() -> str:
+    """Chain id and genesis block hash of the connected network"""
+    genesis = web3.eth.get_block(0).hash
+    return f"{web3.eth.chain_id}:{genesis.hex()}"
+
+
+class Manifest:
+    """Record of finished deployment steps, written as soon as a step is mined
+
+    Steps are recorded per chain, keyed by chain id and genesis block hash,
+    and by name. They store a digest of what was sent: the contract bytecode
+    plus encoded constructor args for deployments, the target and calldata
+    for calls. A redeployed contract can land at the address it had before
+    (a fork reset replays the same deployer nonces), so the digest alone
+    can't tell that a call went to an earlier incarnation of it; the engine
+    reruns every step that depends on a step it sent.
+
+    Args:
+        path: manifest file, shared by all chains
+        chain: key of the chain the steps are sent to, defaults to the
+            connected network
+    """
+
+    def __init__(self, path, chain=None):
+        self.path = path
+        self.chain = chain or chain_key()
+        self.chains = {}
+        if os.path.exists(path):
+            with open(path) as manifest_file:
+                self.chains = json.load(manifest_file)
+        self.steps = self.chains.setdefault(self.chain, {})
+
+    def get(self, name, digest) -> Optional[dict]:
+        """Recorded step if it was sent with the same digest"""
+        record = self.steps.get(name)
+        if record and record["digest"] == digest:
+            return record
+        return None
+
+    def record(self, name, digest, tx, address=None):
+        self.steps[name] = {"digest": digest, "tx": tx, "address": address}
+        # write to a temporary file first so a crash never leaves a torn manifest
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as manifest_file:
+            json.dump(self.chains, manifest_file, indent=4)
+        os.replace(tmp_path, self.path)
+
+
+class DeploymentEngine:
+    """Broadcast a DAG of deployment steps from a single account
+
+    Nonces are assigned locally as steps are sent and contract addresses are
+    derived from the deployer nonce, so dependent steps can reference them
+    before the deployment is mined. A step is sent as soon as its dependencies
+    are mined, or as soon as they are sent when it has an explicit gas limit
+    (the nonce order then guarantees it executes after them). Receipts are
+    only waited on when no further step can be sent.
+
+    With a manifest, steps already recorded with the same digest are skipped,
+    deployments only when their contract still has code on chain, so a rerun
+    picks up at the first missing or changed step. Steps depending on a step
+    sent in the current run are never skipped.
+    """
+
+    def __init__(self, account, steps: List[Step], publish_source=False, manifest=None):
+        self.account = account
+        self.steps = steps
+        self.graph = dependencies(steps)
+        self.publish_source = publish_source
+        self.manifest = manifest
+        self.digests = {}
+        self.skipped = set()
+        self.addresses = {}
+        self.handles = {}
+        self.receipts = {}
+        self.nonce = None
+
+    def _digest(self, step: Step, args) -> str:
+        if step.method is None:
+            return digest(step.target.deploy.encode_input(*args))
+        target = self._handle(step.target.step)
+        calldata = getattr(target, step.method).encode_input(*args)
+        return digest(target.address, calldata)
+
+    def _skip(self, step: Step, args) -> bool:
+        """Check the manifest for a finished step with the same digest"""
+        self.digests[step.name] = self._digest(step, args)
+        if self.manifest is None:
+            return False
+        # a dependency sent again may be a new contract at a recorded address
+        if any(dep in self.receipts for dep in self.graph[step.name]):
+            return False
+        record = self.manifest.get(step.name, self.digests[step.name])
+        if record is None:
+            return False
+        if step.method is None:
+            if not web3.eth.get_code(record["address"]):
+                return False
+            self.addresses[step.name] = record["address"]
+        print(f"{step.name} already done in {record['tx']}, skipping")
+        return True
+
+    def _send(self, step: Step, args):
+        tx_params = {
+            "from": self.account,
+            "nonce": self.nonce,
+            "required_confs": 0,
+        }
+        if step.gas_limit:
+            tx_params["gas_limit"] = step.gas_limit
+        if step.method is None:
+            print(f"deploying {step.name} ({step.target._name}), nonce {self.nonce}")
+            tx = self.account.deploy(
+                step.target,
+                *args,
+                nonce=self.nonce,
+                required_confs=0,
+                gas_limit=step.gas_limit,
+            )
+            self.addresses[step.name] = create_address(self.account.address, self.nonce)
+        else:
+            target = self._handle(step.target.step)
+            print(f"{step.name}: {step.method}, nonce {self.nonce}")
+            tx = getattr(target, step.method)(*args, tx_params)
+        self.receipts[step.name] = tx
+        self.nonce += 1
+        return tx
+
+    def _handle(self, name):
+        # the contract may not be mined yet, so skip the bytecode check of .at()
+        if name not in self.handles:
+            step = next(step for step in self.steps if step.name == name)
+            self.handles[name] = Contract.from_abi(
+                step.target._name, self.addresses[name], step.target.abi, persist=False
+            )
+        return self.handles[name]
+
+    def _ready(self, step: Step, sent, mined) -> bool:
+        deps = self.graph[step.name]
+        if all(dep in mined for dep in deps):
+            return True
+        return bool(step.gas_limit) and all(dep in sent for dep in deps)
+
+    def run(self) -> Dict[str, str]:
+        """Send all steps and return the deployed addresses by step name"""
+        self.nonce = web3.eth.get_transaction_count(self.account.address, "pending")
+        sent, mined = set(), set()
+        while True:
+            for step in self.steps:
+                if step.name not in sent and self._ready(step, sent, mined):
+                    args = _resolve(step.args, self.addresses)
+                    if self._skip(step, args):
+                        self.skipped.add(step.name)
+                        mined.add(step.name)
+                    else:
+                        self._send(step, args)
+                    sent.add(step.name)
+            if len(mined) == len(self.steps):
+                break
+            pending = sorted((self.receipts[name].nonce, name) for name in sent - mined)
+            if not pending:
+                raise DeploymentError("no step can be sent")
+            # transactions are mined in nonce order, wait on the oldest one
+            name = pending[0][1]
+            tx = self.receipts[name]
+            tx.wait(1)
+            if tx.status != 1:
+                raise DeploymentError(f"{name} failed: {tx.txid}")
+            mined.add(name)
+            if self.manifest is not None:
+                self.manifest.record(
+                    name, self.digests[name], tx.txid, self.addresses.get(name)
+                )
+
+        if self.publish_source:
+            for step in self.steps:
+                if step.method is None and step.name not in self.skipped:
+                    step.target.publish_source(
+                        step.target.at(self.addresses[step.name])
+                    )
+        return dict(self.addresses)
+
+    def contract(self, name):
+        """Deployed contract of a step, once the engine has run"""
+        step = next(step for step in self.steps if step.name == name)
+        return step.target.at(self.addresses[name])
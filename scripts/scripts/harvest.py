@@ -4,6 +4,8 @@ from distutils.util import strtobool
 from brownie import *
 from brownie import ConvexStrategy, GVault, accounts, web3
 
+from .snapshot import StrategySnapshot, read_snapshots
+
 # Load contract addresses
 with open("mainnet_fork_deployments.json") as json_file:
     contract_data = json.load(json_file)
@@ -12,27 +14,44 @@ with open("mainnet_fork_deployments.json") as json_file:
 gVault = GVault.at(contract_data["GVault"])
 
 
+def select_strategies(strategy=None):
+    """Get the deployed strategies to sweep, optionally filtered by name"""
+    if strategy:
+        return {k: v for k, v in contract_data.items() if strategy in k}
+    return {k: v for k, v in contract_data.items() if "convex" in k}
+
+
+def print_snapshot(snapshot: StrategySnapshot):
+    print(
+        f"strategy {snapshot.name}:{snapshot.address}, \
+        can harvest: {snapshot.can_harvest}, block: {snapshot.block}"
+    )
+    print(
+        f"debt: {snapshot.total_debt}, \
+        estimated: {snapshot.estimated_total_assets}, \
+        diff: {snapshot.pnl}"
+    )
+    print(
+        f"debt: {snapshot.total_debt}, \
+        profit: {snapshot.total_gain}, \
+        loss: {snapshot.total_loss}, \
+        excess debt: {snapshot.excess_debt}, \
+        credit: {snapshot.credit_available}"
+    )
+
+
+def scan(strategy=None, block=None):
+    """Print the harvest state of all strategies without sending transactions"""
+    snapshots = read_snapshots(gVault, select_strategies(strategy), block)
+    for snapshot in snapshots:
+        print_snapshot(snapshot)
+    return snapshots
+
+
 def harvest(checkTrigger, strategy=None):
     checkTrigger = strtobool(checkTrigger)
     admin = accounts[0]
     print("attempting harvest...")
-    if strategy:
-        strategies = {k: v for k, v in contract_data.items() if strategy in k}
-    else:
-        strategies = {k: v for k, v in contract_data.items() if "convex" in k}
-    for pool, strat_address in strategies.items():
-        strat = ConvexStrategy.at(strat_address)
-        strategy_data = gVault.strategies(strat.address)
-        print(f"strategy {pool}:{strat.address}, can harvest: {strat.canHarvest()}")
-        print(
-            f"debt: {strategy_data[3]}, \
-            estimated: {strat.estimatedTotalAssets()}, \
-            diff: {strat.estimatedTotalAssets() - strategy_data[3]}"
-        )
-        print(
-            f"debt: {strategy_data[3]}, \
-            profit: {strategy_data[4]}, \
-            loss: {strategy_data[5]}"
-        )
-        if strat.canHarvest({"from": admin}) or not checkTrigger:
-            strat.runHarvest({"from": admin})
+    for snapshot in scan(strategy):
+        if snapshot.can_harvest or not checkTrigger:
+            ConvexStrategy.at(snapshot.address).runHarvest({"from": admin})
@@ -0,0 +1,255 @@
+import json
+import re
+import sqlite3
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from brownie import GRouter, GTranche, GVault, web3
+from requests.exceptions import Timeout
+
+# events indexed per deployed contract
+INDEXED_EVENTS = {
+    "GTranche": ["LogNewTrancheBalance", "LogNewPnL"],
+    "GVault": [
+        "LogStrategyHarvestReport",
+        "LogStrategyTotalChanges",
+        "LogWithdrawalFromStrategy",
+    ],
+    "GRouter": ["LogDeposit"],
+}
+CONTAINERS = {"GTranche": GTranche, "GVault": GVault, "GRouter": GRouter}
+
+# block range of the first log query and the bounds of the adaptive range
+INITIAL_CHUNK = 2_000
+MAX_CHUNK = 100_000
+# ranges returning more logs than this are halved, fewer are doubled
+TARGET_LOGS = 1_000
+# blocks behind the head that aren't indexed yet, to stay clear of reorgs
+CONFIRMATIONS = 5
+
+
+class IndexedEvent(NamedTuple):
+    """Decoded log of an indexed event"""
+
+    name: str
+    address: str
+    block: int
+    tx_hash: str
+    log_index: int
+    args: Dict
+
+
+def _signature(event_abi) -> str:
+    types = ",".join(i["type"] for i in event_abi["inputs"])
+    return f"{event_abi['name']}({types})"
+
+
+def _column_type(abi_type) -> str:
+    # uint256 values don't fit in sqlite integers, store them as text
+    size = re.fullmatch(r"u?int(\d+)", abi_type)
+    if abi_type == "bool" or (size and int(size.group(1)) < 64):
+        return "INTEGER"
+    return "TEXT"
+
+
+def _column_value(abi_type, value):
+    if abi_type.endswith("]"):
+        return json.dumps([str(v) for v in value])
+    if _column_type(abi_type) == "INTEGER":
+        return int(value)
+    return str(value)
+
+
+class EventDecoder:
+    """Topic lookup and decoding of the indexed events of a contract
+
+    Args:
+        abi: contract ABI
+        names: events of the ABI to index
+    """
+
+    def __init__(self, abi, names):
+        events = {i["name"]: i for i in abi if i["type"] == "event"}
+        self.abis = {name: events[name] for name in names}
+        self.contract = web3.eth.contract(abi=abi)
+        self.topics = {
+            web3.keccak(text=_signature(event_abi)).hex(): name
+            for name, event_abi in self.abis.items()
+        }
+
+    def decode(self, log) -> IndexedEvent:
+        topic = log["topics"][0]
+        name = self.topics[topic.hex() if isinstance(topic, bytes) else topic]
+        decoded = self.contract.events[name]().processLog(log)
+        return IndexedEvent(
+            name,
+            log["address"],
+            log["blockNumber"],
+            log["transactionHash"].hex(),
+            log["logIndex"],
+            dict(decoded["args"]),
+        )
+
+
+class EventStore:
+    """Local store of indexed events backed by sqlite
+
+    Every event has its own table with a column per argument, next to a
+    cursor table holding the last indexed block of every contract.
+    """
+
+    def __init__(self, path="events.db"):
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS cursors (
+                address TEXT PRIMARY KEY,
+                name TEXT,
+                block INTEGER
+            )"""
+        )
+        self.abis = {}
+
+    def register(self, event_abi):
+        name = event_abi["name"]
+        columns = ", ".join(
+            f"{i['name']} {_column_type(i['type'])}" for i in event_abi["inputs"]
+        )
+        self.db.execute(
+            f"""CREATE TABLE IF NOT EXISTS {name} (
+                address TEXT,
+                block INTEGER,
+                tx_hash TEXT,
+                log_index INTEGER,
+                {columns},
+                PRIMARY KEY (tx_hash, log_index)
+            )"""
+        )
+        self.abis[name] = event_abi
+
+    def cursor(self, address) -> Optional[int]:
+        """Last indexed block of a contract, None if it hasn't been indexed"""
+        row = self.db.execute(
+            "SELECT block FROM cursors WHERE address = ?", (address.lower(),)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def write(self, name, address, events: List[IndexedEvent], block):
+        """Write events and advance the cursor of the contract in one transaction"""
+        with self.db:
+            for event in events:
+                inputs = self.abis[event.name]["inputs"]
+                self.db.execute(
+                    f"INSERT OR REPLACE INTO {event.name} VALUES "
+                    f"({', '.join('?' * (len(inputs) + 4))})",
+                    [event.address, event.block, event.tx_hash, event.log_index]
+                    + [_column_value(i["type"], event.args[i["name"]]) for i in inputs],
+                )
+            self.db.execute(
+                "INSERT OR REPLACE INTO cursors VALUES (?, ?, ?)",
+                (address.lower(), name, block),
+            )
+
+    def rows(self, name, from_block=0) -> List[tuple]:
+        return self.db.execute(
+            f"SELECT * FROM {name} WHERE block >= ? ORDER BY block, log_index",
+            (from_block,),
+        ).fetchall()
+
+
+def get_logs(address, topics, from_block, to_block) -> List:
+    return web3.eth.get_logs(
+        {
+            "address": address,
+            "topics": [topics],
+            "fromBlock": from_block,
+            "toBlock": to_block,
+        }
+    )
+
+
+class Indexer:
+    """Incremental log indexer of the deployed GTranche, GVault and GRouter
+
+    Logs are pulled from the block after each contract's cursor in block
+    ranges that adapt to the log density and shrink when the node refuses a
+    range, so reruns only fetch new blocks.
+
+    Args:
+        contracts: mapping of contract name (see INDEXED_EVENTS) to address
+        store: EventStore the events are written to
+        start_block: first block to index for contracts without a cursor
+        confirmations: blocks behind the head left unindexed by run
+        fetch: get_logs(address, topics, from_block, to_block) override
+        abis: mapping of contract name to ABI, the project ABIs by default
+    """
+
+    def __init__(
+        self,
+        contracts: Dict[str, str],
+        store: EventStore,
+        start_block=0,
+        confirmations=CONFIRMATIONS,
+        fetch: Callable = get_logs,
+        abis: Optional[Dict] = None,
+    ):
+        self.contracts = contracts
+        self.store = store
+        self.start_block = start_block
+        self.confirmations = confirmations
+        self.fetch = fetch
+        self.decoders = {}
+        for name in contracts:
+            abi = abis[name] if abis else CONTAINERS[name].abi
+            decoder = EventDecoder(abi, INDEXED_EVENTS[name])
+            for event_abi in decoder.abis.values():
+                store.register(event_abi)
+            self.decoders[name] = decoder
+        self.chunks = {name: INITIAL_CHUNK for name in contracts}
+
+    def _fetch(self, name, from_block, to_block):
+        """Logs of a range and the range end, shrinks the range until it's served"""
+        topics = list(self.decoders[name].topics)
+        while True:
+            try:
+                logs = self.fetch(self.contracts[name], topics, from_block, to_block)
+                return logs, to_block
+            except (ValueError, Timeout):
+                # too many results or a range the node won't serve
+                if to_block == from_block:
+                    raise
+                to_block = from_block + (to_block - from_block) // 2
+                self.chunks[name] = max(self.chunks[name] // 2, 1)
+
+    def index(self, name, to_block) -> int:
+        """Index a contract up to to_block, returns the number of new events"""
+        address = self.contracts[name]
+        cursor = self.store.cursor(address)
+        from_block = self.start_block if cursor is None else cursor + 1
+        indexed = 0
+        while from_block <= to_block:
+            end = min(from_block + self.chunks[name] - 1, to_block)
+            logs, end = self._fetch(name, from_block, end)
+            events = [self.decoders[name].decode(log) for log in logs]
+            self.store.write(name, address, events, end)
+            indexed += len(events)
+            if len(logs) > TARGET_LOGS:
+                self.chunks[name] = max(self.chunks[name] // 2, 1)
+            elif len(logs) < TARGET_LOGS // 2:
+                self.chunks[name] = min(self.chunks[name] * 2, MAX_CHUNK)
+            from_block = end + 1
+        return indexed
+
+    def run(self, to_block=None) -> Dict[str, int]:
+        """Index every contract up to to_block, the confirmed head by default"""
+        if to_block is None:
+            to_block = web3.eth.block_number - self.confirmations
+        return {name: self.index(name, to_block) for name in self.contracts}
+
+
+def main(db="events.db", start_block="0", confirmations=str(CONFIRMATIONS)):
+    with open("mainnet_fork_deployments.json") as json_file:
+        contract_data = json.load(json_file)
+    contracts = {name: contract_data[name] for name in INDEXED_EVENTS}
+    indexer = Indexer(contracts, EventStore(db), int(start_block), int(confirmations))
+    for name, indexed in indexer.run().items():
+        cursor = indexer.store.cursor(contracts[name])
+        print(f"{name}: {indexed} new events, indexed up to block {cursor}")
@@ -0,0 +1,158 @@
+import asyncio
+import json
+from distutils.util import strtobool
+from functools import partial
+
+from brownie import GVault, accounts, web3
+
+from .prioritiser import prioritise
+from .read_cache import ReadCache
+from .snapshot import read_snapshots, strategy_handles
+
+# brownie TransactionReceipt status for transactions that are not mined yet
+PENDING = -1
+
+
+class Keeper:
+    """Long running harvest keeper
+
+    Keeps contract handles warm between blocks, reads the state of all strategies
+    once per new block and pushes harvests through a single nonce managed queue,
+    so transactions can be broadcast without waiting on the previous receipt.
+    """
+
+    def __init__(self, vault, strategies, account, check_trigger=True, gas_budget=None):
+        self.vault = vault
+        self.strategies = strategies
+        self.handles = {
+            strat.address: strat for strat in strategy_handles(strategies).values()
+        }
+        self.account = account
+        self.check_trigger = check_trigger
+        # when set, only the most valuable harvests that fit the budget are sent
+        self.gas_budget = gas_budget
+        self.queue = None
+        # strategy address => receipt of the harvest that is in flight
+        self.in_flight = {}
+        self.nonce = None
+        # view calls of a block are shared between the readers of that block
+        self.cache = ReadCache()
+
+    async def _run(self, fn, *args, **kwargs):
+        """Run a blocking brownie/web3 call without stalling the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(fn, *args, **kwargs))
+
+    async def _sync_nonce(self):
+        self.nonce = await self._run(
+            web3.eth.get_transaction_count, self.account.address, "pending"
+        )
+
+    async def blocks(self, poll_interval=1.0):
+        """Yield the number, hash and parent hash of the current block and then
+        of every new head, a block replacing one at the same height is yielded
+        again
+        """
+        block_filter = await self._run(web3.eth.filter, "latest")
+        head = await self._run(web3.eth.get_block, "latest")
+        yield head.number, head.hash, head.parentHash
+        while True:
+            block_hashes = await self._run(block_filter.get_new_entries)
+            if block_hashes:
+                head = await self._run(web3.eth.get_block, block_hashes[-1])
+                yield head.number, head.hash, head.parentHash
+            await asyncio.sleep(poll_interval)
+
+    async def tick(self, block, block_hash=None, parent_hash=None):
+        """Read strategy state at block and queue the strategies that need a harvest
+
+        block_hash and parent_hash are reported to the read cache, which drops
+        the reads of blocks that were reorged out, however deep the reorg.
+        """
+        await self._run(self.cache.new_block, block, block_hash, parent_hash)
+        self.in_flight = {
+            address: tx
+            for address, tx in self.in_flight.items()
+            if tx is None or tx.status == PENDING
+        }
+        if self.gas_budget:
+            plan = await self._run(
+                prioritise,
+                self.vault,
+                self.strategies,
+                self.account,
+                gas_budget=self.gas_budget,
+                block=block,
+                check_trigger=self.check_trigger,
+                handles=self.handles,
+                cache=self.cache,
+            )
+            snapshots = [candidate.snapshot for candidate in plan]
+        else:
+            snapshots = await self._run(
+                read_snapshots, self.vault, self.strategies, block, self.cache
+            )
+        for snapshot in snapshots:
+            if snapshot.address in self.in_flight:
+                continue
+            if snapshot.can_harvest or not self.check_trigger:
+                print(f"block {block}: queue harvest {snapshot.name}")
+                self.in_flight[snapshot.address] = None
+                await self.queue.put(snapshot.address)
+
+    async def submit(self):
+        """Broadcast queued harvests with locally assigned nonces"""
+        if self.nonce is None:
+            await self._sync_nonce()
+        while True:
+            address = await self.queue.get()
+            try:
+                tx = await self._run(
+                    self.handles[address].runHarvest,
+                    {"from": self.account, "nonce": self.nonce, "required_confs": 0},
+                )
+                self.in_flight[address] = tx
+                self.nonce += 1
+                print(f"sent harvest {address}: {tx.txid}")
+            except Exception as e:
+                # the transaction wasn't broadcast, resync in case our nonce is stale
+                print(f"harvest {address} failed: {e}")
+                self.in_flight.pop(address, None)
+                await self._sync_nonce()
+            finally:
+                self.queue.task_done()
+
+    async def run(self, max_blocks=None, poll_interval=1.0):
+        """Run the keeper, optionally stopping after max_blocks blocks"""
+        # created here so the queue is bound to the running event loop
+        self.queue = asyncio.Queue()
+        submitter = asyncio.create_task(self.submit())
+        processed = 0
+        try:
+            async for block, block_hash, parent_hash in self.blocks(poll_interval):
+                await self.tick(block, block_hash, parent_hash)
+                await self.queue.join()
+                processed += 1
+                if max_blocks and processed >= max_blocks:
+                    break
+        finally:
+            submitter.cancel()
+
+
+def main(checkTrigger="true", strategy=None, poll_interval="1", gasBudget="0"):
+    with open("mainnet_fork_deployments.json") as json_file:
+        contract_data = json.load(json_file)
+    strategies = {
+        k: v
+        for k, v in contract_data.items()
+        if (strategy in k if strategy else "convex" in k)
+    }
+    keeper = Keeper(
+        GVault.at(contract_data["GVault"]),
+        strategies,
+        accounts[0],
+        strtobool(checkTrigger),
+        int(gasBudget),
+    )
+    print(f"keeper running for {', '.join(strategies)}")
+    asyncio.run(keeper.run(poll_interval=float(poll_interval)))
@@ -0,0 +1,153 @@
+import json
+from typing import List, NamedTuple, Optional, Tuple
+
+from brownie import GLens, GTranche, GVault, web3
+
+from .read_cache import ReadCache
+
+
+class TrancheState(NamedTuple):
+    """GTranche state, junior and senior values are indexed by tranche id"""
+
+    tranche_balances: Tuple[int, int]
+    # tranche balances with the unrealised pnl distributed
+    pnl_balances: Tuple[int, int]
+    profit: int
+    loss: int
+    utilisation: int
+    utilisation_threshold: int
+    factors: Tuple[int, int]
+    price_per_share: Tuple[int, int]
+    total_supply: Tuple[int, int]
+
+
+class StrategyState(NamedTuple):
+    """GVault.strategies of a strategy in the withdrawal queue"""
+
+    address: str
+    active: bool
+    debt_ratio: int
+    last_report: int
+    total_debt: int
+    total_gain: int
+    total_loss: int
+
+
+class VaultState(NamedTuple):
+    total_assets: int
+    realized_total_assets: int
+    price_per_share: int
+    total_supply: int
+    vault_debt_ratio: int
+    vault_total_debt: int
+    locked_profit: int
+    last_report: int
+    # in order of withdrawal priority
+    strategies: List[StrategyState]
+
+
+class ProtocolState(NamedTuple):
+    """Full GTranche and GVault state at a block, as returned by GLens"""
+
+    block: int
+    timestamp: int
+    tranche: TrancheState
+    vault: VaultState
+
+
+def _ints(values) -> Tuple[int, ...]:
+    return tuple(int(v) for v in values)
+
+
+def decode_state(raw) -> ProtocolState:
+    """Convert the GLens.getState return value into a ProtocolState"""
+    block, timestamp, tranche, vault = raw
+    (
+        balances,
+        pnl_balances,
+        profit,
+        loss,
+        utilisation,
+        threshold,
+        factors,
+        pps,
+        supply,
+    ) = tranche
+    *vault_values, strategies = vault
+    return ProtocolState(
+        int(block),
+        int(timestamp),
+        TrancheState(
+            _ints(balances),
+            _ints(pnl_balances),
+            int(profit),
+            int(loss),
+            int(utilisation),
+            int(threshold),
+            _ints(factors),
+            _ints(pps),
+            _ints(supply),
+        ),
+        VaultState(
+            *_ints(vault_values),
+            [
+                StrategyState(str(address), bool(active), *_ints(values))
+                for address, active, *values in strategies
+            ],
+        ),
+    )
+
+
+class LensClient:
+    """Reads the full GTranche/GVault state with a single eth_call
+
+    Args:
+        lens: deployed GLens contract
+        tranche: address of the GTranche to read
+        vault: address of the GVault to read
+        cache: ReadCache shared with other readers of the same blocks
+    """
+
+    def __init__(self, lens, tranche, vault, cache: Optional[ReadCache] = None):
+        self.lens = lens
+        self.tranche = str(tranche)
+        self.vault = str(vault)
+        self.cache = cache
+
+    def read(self, block=None) -> ProtocolState:
+        """State at block, defaults to the latest block"""
+        block = int(block) if block is not None else web3.eth.block_number
+        if self.cache is not None:
+            raw = self.cache.call(
+                self.lens.getState, self.tranche, self.vault, block=block
+            )
+        else:
+            raw = self.lens.getState(self.tranche, self.vault, block_identifier=block)
+        return decode_state(raw)
+
+
+def main(block=None):
+    with open("mainnet_fork_deployments.json") as json_file:
+        contract_data = json.load(json_file)
+    client = LensClient(
+        GLens.at(contract_data["GLens"]),
+        GTranche.at(contract_data["GTranche"]),
+        GVault.at(contract_data["GVault"]),
+    )
+    state = client.read(block)
+    tranche, vault = state.tranche, state.vault
+    print(f"block {state.block}")
+    print(
+        f"junior: {tranche.pnl_balances[0] / 1e18:.2f}, "
+        f"senior: {tranche.pnl_balances[1] / 1e18:.2f}, "
+        f"utilisation: {tranche.utilisation / 1e4:.2%}"
+    )
+    print(
+        f"vault assets: {vault.total_assets / 1e18:.2f}, "
+        f"pps: {vault.price_per_share / 1e18:.6f}"
+    )
+    for strategy in vault.strategies:
+        print(
+            f"  {strategy.address}: debt {strategy.total_debt / 1e18:.2f}, "
+            f"ratio {strategy.debt_ratio}, active {strategy.active}"
+        )
@@ -0,0 +1,152 @@
+import time
+from typing import Tuple
+
+import numpy as np
+
+# PnLFixedRate constants
+DEFAULT_DECIMALS = 10_000
+YEAR_IN_SECONDS = 31556952
+DEFAULT_RATE = 200
+# GTranche.utilisationThreshold default
+DEFAULT_UTILISATION_THRESHOLD = 10_000
+
+# products have to stay below this to be evaluated in int64
+INT64_BOUND = 2**62
+
+
+def _largest(array) -> int:
+    return int(np.max(np.abs(array))) if array.size else 0
+
+
+def int_arrays(amount, junior, senior, rate, time_diff, *extra):
+    """Broadcast the model inputs to 1-d or wider integer arrays of a common dtype
+
+    int64 is used when every intermediate value of the model fits in it,
+    otherwise the arrays hold python ints (object dtype), which is exact for
+    the full int256 range at a fraction of the speed.
+    """
+    # 0-d object arrays decay to python ints in arithmetic, keep at least 1-d
+    arrays = np.broadcast_arrays(
+        *[
+            np.atleast_1d(value)
+            for value in (amount, junior, senior, rate, time_diff, *extra)
+        ]
+    )
+    amount, junior, senior, rate, time_diff = arrays[:5]
+    # senior * rate * time diff is the largest product the model evaluates
+    bound = (
+        _largest(senior)
+        * max(_largest(rate), DEFAULT_DECIMALS)
+        * (_largest(time_diff) + 1)
+        + _largest(amount)
+        + _largest(junior)
+        + 1
+    )
+    dtype = np.int64 if bound < INT64_BOUND else object
+    return [array.astype(dtype) for array in arrays]
+
+
+def sdiv(a, b):
+    """Solidity int256 division, rounding towards zero"""
+    quotient = abs(a) // abs(b)
+    return np.where((a < 0) != (b < 0), -quotient, quotient)
+
+
+def calc_rate(senior_balance, rate, time_diff):
+    """Mirror of PnLFixedRate._calc_rate"""
+    return sdiv(senior_balance * rate * time_diff, DEFAULT_DECIMALS * YEAR_IN_SECONDS)
+
+
+def distribute_loss(amount, junior, senior, rate, time_diff) -> Tuple:
+    """Mirror of PnLFixedRate.distributeLoss, returns (junior, senior) losses"""
+    amount, junior, senior, rate, time_diff = int_arrays(
+        amount, junior, senior, rate, time_diff
+    )
+    senior_profit = calc_rate(senior, rate, time_diff)
+    wiped = amount + senior_profit > junior
+    junior_loss = np.where(wiped, junior, amount + senior_profit)
+    # the senior tranche experiences negative loss == fixed rate profit
+    senior_loss = np.where(wiped, amount - junior, -senior_profit)
+    return junior_loss, senior_loss
+
+
+def distribute_profit(
+    amount,
+    junior,
+    senior,
+    rate,
+    time_diff,
+    utilisation_threshold=DEFAULT_UTILISATION_THRESHOLD,
+) -> Tuple:
+    """Mirror of PnLFixedRate.distributeProfit, returns (junior, senior) profits"""
+    amount, junior, senior, rate, time_diff, utilisation_threshold = int_arrays(
+        amount, junior, senior, rate, time_diff, utilisation_threshold
+    )
+    utilisation = sdiv(senior * DEFAULT_DECIMALS, junior + 1)
+    fixed = utilisation < utilisation_threshold
+    senior_profit = np.where(fixed, calc_rate(senior, rate, time_diff), 0)
+    # if the rate distribution is greater than the profit, the junior tranche
+    # experiences negative profit, e.g. a loss
+    capped = fixed & (junior < senior_profit - amount)
+    junior_profit = np.where(
+        capped, -junior, np.where(fixed, amount - senior_profit, amount)
+    )
+    senior_profit = np.where(capped, amount + junior, senior_profit)
+    return junior_profit, senior_profit
+
+
+def distribute_assets(
+    loss,
+    amount,
+    junior,
+    senior,
+    rate,
+    time_diff,
+    utilisation_threshold=DEFAULT_UTILISATION_THRESHOLD,
+) -> Tuple:
+    """Mirror of PnLFixedRate.distributeAssets for a mix of profits and losses"""
+    loss = np.asarray(loss, dtype=bool)
+    loss_amounts = distribute_loss(amount, junior, senior, rate, time_diff)
+    profit_amounts = distribute_profit(
+        amount, junior, senior, rate, time_diff, utilisation_threshold
+    )
+    return tuple(
+        np.where(loss, on_loss, on_profit)
+        for on_loss, on_profit in zip(loss_amounts, profit_amounts)
+    )
+
+
+def random_scenarios(size, seed=0, max_balance=10**6, max_days=365):
+    """Random tranche states as int64 arrays
+
+    Balances are in whole units, small enough for the model to run in int64.
+    """
+    rng = np.random.default_rng(seed)
+    return dict(
+        loss=rng.random(size) < 0.5,
+        amount=rng.integers(0, max_balance // 100, size),
+        junior=rng.integers(1, max_balance, size),
+        senior=rng.integers(0, max_balance, size),
+        rate=rng.integers(0, DEFAULT_DECIMALS + 1, size),
+        time_diff=rng.integers(0, max_days * 86400, size),
+    )
+
+
+def main(size="1000000", exact="false"):
+    """Time the model over random scenarios
+
+    With exact, balances are scaled to 18 decimals as on chain, which takes
+    them out of the int64 range and evaluates the model with python ints.
+    """
+    scenarios = random_scenarios(int(size))
+    if exact.lower() in ("true", "1"):
+        scenarios = {
+            key: value.astype(object) * 10**18
+            if key in ("amount", "junior", "senior")
+            else value
+            for key, value in scenarios.items()
+        }
+    start = time.perf_counter()
+    distribute_assets(**scenarios)
+    elapsed = time.perf_counter() - start
+    print(f"{int(size)} scenarios in {elapsed:.3f}s, {int(size) / elapsed:,.0f}/s")
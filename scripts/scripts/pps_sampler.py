@@ -0,0 +1,265 @@
+import json
+import sqlite3
+from bisect import bisect
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import requests
+from brownie import GTranche, GVault, multicall, web3
+
+# roughly a day of mainnet blocks
+BLOCKS_PER_DAY = 7200
+# JSON-RPC requests sent per HTTP batch
+BATCH_SIZE = 500
+YEAR_IN_SECONDS = 31556952
+
+# sampled values: field => (contract, function, args)
+FIELDS = {
+    "junior_pps": ("tranche", "getPricePerShare", (0,)),
+    "senior_pps": ("tranche", "getPricePerShare", (1,)),
+    "junior_factor": ("tranche", "factor", (0,)),
+    "senior_factor": ("tranche", "factor", (1,)),
+    "vault_pps": ("vault", "getPricePerShare", ()),
+    "vault_total_assets": ("vault", "totalAssets", ()),
+}
+
+
+class PriceSample(NamedTuple):
+    """Share prices and factors of GTranche and GVault at a block"""
+
+    block: int
+    timestamp: int
+    junior_pps: int
+    senior_pps: int
+    junior_factor: int
+    senior_factor: int
+    vault_pps: int
+    vault_total_assets: int
+    # linear interpolation between the neighbouring samples
+    interpolated: bool = False
+
+
+def interpolate(blocks: List[int], samples: Dict[int, Optional[PriceSample]]):
+    """Fill missing samples linearly from their neighbours
+
+    Missing samples before the first or after the last read sample can't be
+    interpolated and are dropped.
+    """
+    known = sorted(b for b in blocks if samples.get(b) is not None)
+    series = []
+    for block in sorted(blocks):
+        sample = samples.get(block)
+        if sample is not None:
+            series.append(sample)
+            continue
+        i = bisect(known, block)
+        if i == 0 or i == len(known):
+            continue
+        low, high = samples[known[i - 1]], samples[known[i]]
+        values = [
+            a + (b - a) * (block - low.block) // (high.block - low.block)
+            for a, b in zip(low[1:-1], high[1:-1])
+        ]
+        series.append(PriceSample(block, *values, interpolated=True))
+    return series
+
+
+def apy(series: List[PriceSample], field="vault_pps") -> float:
+    """Annualised growth of a price between the first and last sample"""
+    first, last = series[0], series[-1]
+    years = (last.timestamp - first.timestamp) / YEAR_IN_SECONDS
+    start, end = getattr(first, field), getattr(last, field)
+    if not years or not start:
+        return 0.0
+    return (end / start) ** (1 / years) - 1
+
+
+class SampleCache:
+    """Samples keyed by block number, backed by sqlite"""
+
+    def __init__(self, path="pps_samples.db"):
+        self.db = sqlite3.connect(path)
+        columns = ", ".join(f"{field} TEXT" for field in FIELDS)
+        self.db.execute(
+            f"""CREATE TABLE IF NOT EXISTS samples (
+                block INTEGER PRIMARY KEY,
+                timestamp INTEGER,
+                {columns}
+            )"""
+        )
+
+    def read(self, blocks: List[int]) -> Dict[int, PriceSample]:
+        samples = {}
+        # stay below sqlite's limit on query parameters
+        for i in range(0, len(blocks), 500):
+            chunk = blocks[i : i + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.db.execute(
+                f"SELECT * FROM samples WHERE block IN ({placeholders})", chunk
+            ).fetchall()
+            for block, timestamp, *values in rows:
+                samples[block] = PriceSample(block, timestamp, *map(int, values))
+        return samples
+
+    def write(self, samples: List[PriceSample]):
+        # uint256 values don't fit in sqlite integers, store them as text
+        with self.db:
+            self.db.executemany(
+                f"INSERT OR REPLACE INTO samples VALUES "
+                f"({', '.join('?' * (len(FIELDS) + 2))})",
+                [
+                    (s.block, s.timestamp, *[str(v) for v in s[2:-1]])
+                    for s in samples
+                    if not s.interpolated
+                ],
+            )
+
+
+class PriceSampler:
+    """Reads PriceSamples at many historical blocks in few requests
+
+    Every value at every block is an eth_call, these are sent together with
+    the block headers as JSON-RPC batches of batch_size requests. Nodes that
+    don't accept batches are read with one multicall per block instead.
+    Samples are cached by block, a read only requests the blocks that
+    aren't cached yet.
+
+    Args:
+        tranche: GTranche contract
+        vault: GVault contract
+        cache: SampleCache, samples are only kept in memory without one
+        batch_size: JSON-RPC requests per batch, 0 to always use multicall
+        post: post(payload) -> responses override of the batch transport
+    """
+
+    def __init__(
+        self,
+        tranche,
+        vault,
+        cache: Optional[SampleCache] = None,
+        batch_size=BATCH_SIZE,
+        post: Optional[Callable] = None,
+    ):
+        contracts = {"tranche": tranche, "vault": vault}
+        self.calls = {
+            field: (contracts[name], getattr(contracts[name], function), args)
+            for field, (name, function, args) in FIELDS.items()
+        }
+        self.cache = cache
+        self.memory = {}
+        self.batch_size = batch_size
+        self.post = post or self._post
+        # requests sent to the node, a batch counts as one
+        self.requests = 0
+
+    def _post(self, payload) -> List[Dict]:
+        response = requests.post(web3.provider.endpoint_uri, json=payload, timeout=120)
+        response.raise_for_status()
+        return response.json()
+
+    def _payload(self, blocks) -> List[Dict]:
+        payload = []
+        for block in blocks:
+            payload.append(
+                {
+                    "jsonrpc": "2.0",
+                    "id": len(payload),
+                    "method": "eth_getBlockByNumber",
+                    "params": [hex(block), False],
+                }
+            )
+            for contract, function, args in self.calls.values():
+                tx = {"to": contract.address, "data": function.encode_input(*args)}
+                payload.append(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": len(payload),
+                        "method": "eth_call",
+                        "params": [tx, hex(block)],
+                    }
+                )
+        return payload
+
+    def _read_batched(self, blocks) -> Dict[int, Optional[PriceSample]]:
+        payload = self._payload(blocks)
+        results = {}
+        for i in range(0, len(payload), self.batch_size):
+            responses = self.post(payload[i : i + self.batch_size])
+            self.requests += 1
+            if not isinstance(responses, list):
+                raise ValueError(f"batch request refused: {responses}")
+            results.update({r["id"]: r.get("result") for r in responses})
+
+        samples = {}
+        width = len(self.calls) + 1
+        for i, block in enumerate(blocks):
+            header = results.get(i * width)
+            values = []
+            for j, (_, function, _) in enumerate(self.calls.values()):
+                result = results.get(i * width + j + 1)
+                # reverted calls, e.g. before deployment, come back as errors
+                values.append(
+                    None if result in (None, "0x") else function.decode_output(result)
+                )
+            if header is None or None in values:
+                samples[block] = None
+                continue
+            timestamp = int(header["timestamp"], 16)
+            samples[block] = PriceSample(block, timestamp, *map(int, values))
+        return samples
+
+    def _read_multicall(self, block) -> Optional[PriceSample]:
+        with multicall(block_identifier=block):
+            values = [function(*args) for _, function, args in self.calls.values()]
+        self.requests += 2
+        if None in values:
+            return None
+        timestamp = web3.eth.get_block(block).timestamp
+        return PriceSample(block, timestamp, *map(int, values))
+
+    def read(self, blocks: List[int]) -> Dict[int, Optional[PriceSample]]:
+        """Samples at blocks, None where the values couldn't be read"""
+        samples = {b: self.memory[b] for b in blocks if b in self.memory}
+        missing = [b for b in blocks if b not in samples]
+        if self.cache is not None and missing:
+            samples.update(self.cache.read(missing))
+            missing = [b for b in blocks if b not in samples]
+        if missing:
+            fetched = None
+            if self.batch_size:
+                try:
+                    fetched = self._read_batched(missing)
+                except (requests.RequestException, ValueError) as e:
+                    print(f"batched read failed, falling back to multicall: {e}")
+            if fetched is None:
+                fetched = {b: self._read_multicall(b) for b in missing}
+            samples.update(fetched)
+            if self.cache is not None:
+                self.cache.write([s for s in fetched.values() if s is not None])
+        self.memory.update({b: s for b, s in samples.items() if s is not None})
+        return samples
+
+    def series(self, start, end, interval=BLOCKS_PER_DAY) -> List[PriceSample]:
+        """Samples every interval blocks from start to end, gaps interpolated"""
+        blocks = list(range(int(start), int(end) + 1, int(interval)))
+        return interpolate(blocks, self.read(blocks))
+
+
+def main(start, end=None, interval=str(BLOCKS_PER_DAY), db="pps_samples.db"):
+    with open("mainnet_fork_deployments.json") as json_file:
+        contract_data = json.load(json_file)
+    sampler = PriceSampler(
+        GTranche.at(contract_data["GTranche"]),
+        GVault.at(contract_data["GVault"]),
+        SampleCache(db),
+    )
+    end = int(end) if end else web3.eth.block_number
+    series = sampler.series(int(start), end, int(interval))
+    if not series:
+        print("no samples in range")
+        return
+    print(
+        f"{len(series)} samples from block {series[0].block} to {series[-1].block} "
+        f"in {sampler.requests} requests"
+    )
+    for field in ["junior_pps", "vault_pps"]:
+        print(f"{field} apy: {apy(series, field):.2%}")
@@ -0,0 +1,233 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from distutils.util import strtobool
+from typing import Dict, List, NamedTuple, Optional
+
+from brownie import GVault, accounts, interface, multicall, web3
+
+from .addresses import CL_ETH_USD_ADDRESS, THREE_POOL_ADDRESS
+from .resolver import TARGET_DECIMALS, convert_eth_to_usd
+from .snapshot import StrategySnapshot, read_snapshots, strategy_handles
+
+# roughly the share of a block we are willing to fill with harvests
+DEFAULT_GAS_BUDGET = 10_000_000
+
+
+class Prices(NamedTuple):
+    """ETH/USD and 3crv prices the guard values harvests with"""
+
+    eth_usd_price: int
+    eth_usd_decimals: int
+    virtual_price: int
+
+
+class HarvestCandidate(NamedTuple):
+    """A strategy harvest valued in USD (18 decimals)"""
+
+    snapshot: StrategySnapshot
+    gas: int
+    profit: int
+    profit_usd: int
+    gas_cost_usd: int
+    excess_debt: int
+    # the guard harvests on excess debt regardless of the profit
+    debt_triggered: bool
+
+    @property
+    def net_usd(self) -> int:
+        return self.profit_usd - self.gas_cost_usd
+
+
+def read_prices(block=None) -> Prices:
+    """Read the chainlink ETH/USD feed and 3pool virtual price in one call"""
+    eth_usd = interface.AggregatorV3Interface(CL_ETH_USD_ADDRESS)
+    three_pool = interface.ICurve3Pool(THREE_POOL_ADDRESS)
+    with multicall(block_identifier=block):
+        round_data = eth_usd.latestRoundData()
+        decimals = eth_usd.decimals()
+        virtual_price = three_pool.get_virtual_price()
+    return Prices(
+        eth_usd_price=int(round_data[1]) if round_data else 0,
+        eth_usd_decimals=int(decimals or 0),
+        virtual_price=int(virtual_price or 0),
+    )
+
+
+def expected_profit(snapshot: StrategySnapshot) -> int:
+    """Profit in 3crv a harvest realises, as GStrategyGuard._profitOrLossExceeded
+    counts it: gain over debt plus the credit the vault will hand out
+    """
+    profit = max(snapshot.estimated_total_assets - snapshot.total_debt, 0)
+    return profit + snapshot.credit_available
+
+
+def expected_excess_debt(snapshot: StrategySnapshot) -> int:
+    """Debt in 3crv a harvest pays back or realises as loss, as
+    GStrategyGuard._profitOrLossExceeded counts it
+    """
+    loss = max(snapshot.total_debt - snapshot.estimated_total_assets, 0)
+    return snapshot.excess_debt + loss
+
+
+def estimate_harvest_gas(handles, account) -> Dict[str, Optional[int]]:
+    """eth_estimateGas runHarvest for all strategies concurrently
+
+    Args:
+        handles: mapping of strategy address to contract object
+        account: account the harvests will be sent from
+
+    Returns None for strategies where the harvest would revert.
+    """
+
+    def estimate(strategy):
+        try:
+            return strategy.runHarvest.estimate_gas({"from": account})
+        except Exception as e:
+            print(f"gas estimate {strategy.address} failed: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(len(handles), 1)) as executor:
+        return dict(zip(handles, executor.map(estimate, handles.values())))
+
+
+def value_candidates(
+    snapshots: List[StrategySnapshot],
+    gas: Dict[str, Optional[int]],
+    prices: Prices,
+    gas_price: int,
+    debt_threshold: int = 0,
+) -> List[HarvestCandidate]:
+    """Value each harvest the way the guard does, in USD with 18 decimals
+
+    Harvests with excess debt over debt_threshold are flagged debt_triggered,
+    the guard runs them whatever their profit.
+    """
+    candidates = []
+    for snapshot in snapshots:
+        harvest_gas = gas.get(snapshot.address)
+        if harvest_gas is None:
+            continue
+        profit = expected_profit(snapshot)
+        excess_debt = expected_excess_debt(snapshot)
+        candidates.append(
+            HarvestCandidate(
+                snapshot=snapshot,
+                gas=harvest_gas,
+                profit=profit,
+                profit_usd=prices.virtual_price * profit // 10**TARGET_DECIMALS,
+                gas_cost_usd=convert_eth_to_usd(prices, gas_price * harvest_gas),
+                excess_debt=excess_debt,
+                debt_triggered=excess_debt > debt_threshold,
+            )
+        )
+    return candidates
+
+
+def plan_harvests(
+    candidates: List[HarvestCandidate], gas_budget: int
+) -> List[HarvestCandidate]:
+    """Pick the harvests worth the most net of gas that fit in the gas budget
+
+    Debt triggered harvests go first, largest excess debt first, as they
+    realise losses and pay back debt the guard harvests for. The rest are
+    ranked by net value, harvests that don't pay for their own gas are
+    dropped. Harvests that don't fit the remaining budget are skipped so
+    smaller harvests further down can still fill it.
+    """
+    debt = sorted(
+        (c for c in candidates if c.debt_triggered),
+        key=lambda c: c.excess_debt,
+        reverse=True,
+    )
+    profit = sorted(
+        (c for c in candidates if not c.debt_triggered and c.net_usd > 0),
+        key=lambda c: c.net_usd,
+        reverse=True,
+    )
+    plan = []
+    for candidate in debt + profit:
+        if candidate.gas > gas_budget:
+            continue
+        plan.append(candidate)
+        gas_budget -= candidate.gas
+    return plan
+
+
+def prioritise(
+    vault,
+    strategies,
+    account,
+    gas_budget=DEFAULT_GAS_BUDGET,
+    gas_price=None,
+    block=None,
+    check_trigger=True,
+    handles=None,
+    cache=None,
+    debt_threshold=0,
+) -> List[HarvestCandidate]:
+    """Read, value and rank the harvests of all strategies
+
+    Args:
+        vault: GVault the strategies report to
+        strategies: mapping of strategy name to strategy address
+        account: account the harvests will be sent from
+        gas_budget: total gas the plan may use
+        gas_price: gas price to value gas with, defaults to the node gas price
+        block: block to read state at, defaults to the latest block
+        check_trigger: only consider strategies where canHarvest is true
+        handles: warm strategy handles keyed by address
+        cache: ReadCache shared with other readers of the same blocks
+        debt_threshold: excess debt over which the guard harvests regardless
+            of profit, GStrategyGuard.debtThreshold
+    """
+    snapshots = read_snapshots(vault, strategies, block, cache)
+    eligible = [s for s in snapshots if s.can_harvest or not check_trigger]
+    if not eligible:
+        return []
+    if handles is None:
+        handles = {s.address: s for s in strategy_handles(strategies).values()}
+    gas = estimate_harvest_gas(
+        {s.address: handles[s.address] for s in eligible}, account
+    )
+    gas_price = web3.eth.gas_price if gas_price is None else gas_price
+    candidates = value_candidates(
+        eligible, gas, read_prices(block), gas_price, debt_threshold
+    )
+    return plan_harvests(candidates, gas_budget)
+
+
+def print_plan(plan: List[HarvestCandidate]):
+    for candidate in plan:
+        print(
+            f"strategy {candidate.snapshot.name}:{candidate.snapshot.address}, \
+            gas: {candidate.gas}, \
+            profit: {candidate.profit_usd / 1e18:.2f} USD, \
+            gas cost: {candidate.gas_cost_usd / 1e18:.2f} USD, \
+            net: {candidate.net_usd / 1e18:.2f} USD, \
+            excess debt: {candidate.excess_debt / 1e18:.2f} 3crv"
+        )
+
+
+def main(
+    gasBudget=str(DEFAULT_GAS_BUDGET), strategy=None, submit="false", debtThreshold="0"
+):
+    with open("mainnet_fork_deployments.json") as json_file:
+        contract_data = json.load(json_file)
+    strategies = {
+        k: v
+        for k, v in contract_data.items()
+        if (strategy in k if strategy else "convex" in k)
+    }
+    admin = accounts[0]
+    plan = prioritise(
+        GVault.at(contract_data["GVault"]),
+        strategies,
+        admin,
+        int(gasBudget),
+        debt_threshold=int(debtThreshold),
+    )
+    print_plan(plan)
+    if strtobool(submit):
+        handles = strategy_handles(strategies)
+        for candidate in plan:
+            handles[candidate.snapshot.name].runHarvest({"from": admin})
@@ -0,0 +1,156 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from brownie import multicall, web3
+
+# blocks kept in the cache, older blocks are evicted first
+DEFAULT_MAX_BLOCKS = 16
+
+
+def _unwrap(value):
+    # multicall results are proxies, failed calls wrap None
+    return getattr(value, "__wrapped__", value)
+
+
+def _block_hash(block):
+    return web3.eth.get_block(block).hash
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return str(value).lower() if isinstance(value, str) else value
+
+
+class ReadCache:
+    """Memoised view calls keyed by (contract, selector, args, block)
+
+    Values of a block never change, so every view call is only sent once per
+    block no matter how many readers ask for it. The cache holds the
+    max_blocks most recently used blocks; blocks that are reorged out are
+    dropped when the new head is reported through new_block.
+
+    Args:
+        max_blocks: number of blocks kept in the cache
+    """
+
+    def __init__(self, max_blocks=DEFAULT_MAX_BLOCKS):
+        self.max_blocks = max_blocks
+        # block number => {call key: value}
+        self.blocks = OrderedDict()
+        # block number => block hash the cached values were read at
+        self.hashes = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(method, args) -> Hashable:
+        return (method._address.lower(), method.signature, _freeze(args))
+
+    def _entries(self, block) -> Dict:
+        if block in self.blocks:
+            self.blocks.move_to_end(block)
+            return self.blocks[block]
+        self.blocks[block] = {}
+        while len(self.blocks) > self.max_blocks:
+            evicted, _ = self.blocks.popitem(last=False)
+            self.hashes.pop(evicted, None)
+            self.evictions += 1
+        return self.blocks[block]
+
+    def new_block(self, number, block_hash=None, parent_hash=None, get_hash=None):
+        """Report a new head, drops cached blocks that were reorged out
+
+        Cached blocks above number are dropped, as is a cached block at number
+        that was read at a different block_hash. A parent_hash that differs
+        from the hash recorded for number - 1 means the reorg goes deeper, so
+        the older recorded hashes are re-checked with get_hash, newest first,
+        until one still matches. Every cached block from the oldest mismatch
+        upward is dropped.
+
+        Args:
+            number: number of the new head
+            block_hash: hash of the new head
+            parent_hash: hash of the parent of the new head
+            get_hash: block number => canonical block hash, defaults to
+                fetching the block from the node
+        """
+        number = int(number)
+        get_hash = get_hash or _block_hash
+        first_stale = number + 1
+        known = self.hashes.get(number)
+        if known is not None and known != block_hash:
+            first_stale = number
+        if parent_hash is not None:
+            for block in sorted((b for b in self.hashes if b < number), reverse=True):
+                canonical = parent_hash if block == number - 1 else get_hash(block)
+                if canonical == self.hashes[block]:
+                    break
+                first_stale = block
+        for block in [b for b in self.blocks if b >= first_stale]:
+            del self.blocks[block]
+            self.evictions += 1
+        for block in [b for b in self.hashes if b >= first_stale]:
+            del self.hashes[block]
+        if block_hash is not None:
+            self.hashes[number] = block_hash
+
+    def read(
+        self, calls: Dict[Any, Tuple[Callable, tuple]], block=None
+    ) -> Dict[Any, Any]:
+        """Values of view calls at block, misses are read in one multicall
+
+        Args:
+            calls: mapping of name to (contract method, args)
+            block: block to read at, defaults to the latest block
+
+        Failed calls resolve to None and aren't cached.
+        """
+        block = int(block) if block is not None else web3.eth.block_number
+        entries = self._entries(block)
+        results = {}
+        missing = {}
+        for name, (method, args) in calls.items():
+            key = self.key(method, args)
+            if key in entries:
+                self.hits += 1
+                results[name] = entries[key]
+            else:
+                self.misses += 1
+                missing[name] = (key, method, args)
+        if missing:
+            with multicall(block_identifier=block):
+                pending = {
+                    name: method(*args) for name, (_, method, args) in missing.items()
+                }
+            for name, (key, _, _) in missing.items():
+                value = _unwrap(pending[name])
+                results[name] = value
+                if value is not None:
+                    entries[key] = value
+        return results
+
+    def call(self, method, *args, block=None):
+        """Value of a single view call at block"""
+        return self.read({None: (method, args)}, block)[None]
+
+    def stats(self) -> Dict[str, Any]:
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "evictions": self.evictions,
+            "blocks": len(self.blocks),
+            "entries": sum(len(entries) for entries in self.blocks.values()),
+        }
+
+
+def cached_read(cache: Optional[ReadCache], calls, block):
+    """Read calls through cache, or in a plain multicall without one"""
+    if cache is not None:
+        return cache.read(calls, block)
+    with multicall(block_identifier=block):
+        pending = {name: method(*args) for name, (method, args) in calls.items()}
+    return {name: _unwrap(value) for name, value in pending.items()}
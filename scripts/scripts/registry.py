@@ -0,0 +1,28 @@
+class Registry:
+    """Lazily resolved, memoised contract and account handles
+
+    Handles are registered with a factory and only resolved, once, the first
+    time they are accessed, so scripts only pay the RPC and explorer lookups
+    for the handles they use.
+    """
+
+    def __init__(self):
+        self._factories = {}
+        self._handles = {}
+
+    def register(self, name, factory):
+        self._factories[name] = factory
+        self._handles.pop(name, None)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in self._handles:
+            if name not in self._factories:
+                raise AttributeError(f"no handle registered for {name}")
+            self._handles[name] = self._factories[name]()
+        return self._handles[name]
+
+    def resolved(self):
+        """Names of the handles that have been resolved so far"""
+        return list(self._handles)
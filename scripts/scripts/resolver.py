@@ -0,0 +1,432 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from brownie import Contract, ConvexStrategy, GStrategyGuard, interface, multicall, web3
+
+from .read_cache import ReadCache, cached_read
+
+ZERO = "0x0000000000000000000000000000000000000000"
+TARGET_DECIMALS = 18
+# upper bound on the number of strategies probed per aggregated call
+PROBE_SIZE = 16
+
+
+class GuardStrategy(NamedTuple):
+    """Raw inputs the guard reads for a single strategy"""
+
+    index: int
+    address: str
+    active: bool
+    can_harvest_with_loss: bool
+    loss_start_block: int
+    time_limit: int
+    primer_timestamp: int
+    can_stop_loss: bool
+    can_harvest: bool
+    estimated_total_assets: int
+    total_debt: int
+    excess_debt: int
+    credit_available: int
+
+
+class GuardState(NamedTuple):
+    """Everything the resolver tasks depend on, read at a single block"""
+
+    block: int
+    timestamp: int
+    gas_price: int
+    gas_threshold: int
+    debt_threshold: int
+    loss_block_threshold: int
+    eth_usd_price: int
+    eth_usd_decimals: int
+    virtual_price: int
+    strategies: List[GuardStrategy]
+
+
+class Decision(NamedTuple):
+    """Outcome of a resolver task
+
+    strategy is the strategy the guard call in payload acts on, triggers
+    lists every strategy that satisfies the check on its own. A reverted
+    decision means the on chain check would revert at this block.
+    """
+
+    task: str
+    can_exec: bool
+    payload: Optional[Tuple] = None
+    strategy: Optional[str] = None
+    triggers: Tuple[str, ...] = ()
+    reverted: bool = False
+
+
+class GuardReader:
+    """Reads guard state in two aggregated calls per block
+
+    Strategy and vault handles are cached between blocks, a strategy's vault
+    is immutable so it's only resolved the first time the strategy shows up.
+    With a cache, reads are shared with other readers of the same block.
+    """
+
+    def __init__(self, guard, cache: Optional[ReadCache] = None):
+        self.guard = guard
+        self.cache = cache
+        self.vaults = {}
+        self.strategy_handles = {}
+        self.oracles = None
+
+    def _vault(self, address):
+        if address not in self.vaults:
+            strategy = self._strategy(address)
+            self.vaults[address] = Contract.from_abi(
+                "GVault", strategy.vault(), interface.IGVault.abi, persist=False
+            )
+        return self.vaults[address]
+
+    def _strategy(self, address):
+        if address not in self.strategy_handles:
+            self.strategy_handles[address] = Contract.from_abi(
+                "Strategy", address, ConvexStrategy.abi, persist=False
+            )
+        return self.strategy_handles[address]
+
+    def _oracles(self):
+        if self.oracles is None:
+            self.oracles = (
+                interface.AggregatorV3Interface(self.guard.CL_ETH_USD()),
+                interface.ICurve3Pool(self.guard.THREE_CURVE_POOL()),
+            )
+        return self.oracles
+
+    def strategies(self, block) -> List[str]:
+        """Read the guard strategy queue, including removed (zero) entries"""
+        queue = []
+        while True:
+            with multicall(block_identifier=block):
+                probe = [
+                    self.guard.strategies(i)
+                    for i in range(len(queue), len(queue) + PROBE_SIZE)
+                ]
+            # reading past the end of the array reverts, which resolves to None
+            for address in probe:
+                if address is None:
+                    return queue
+                queue.append(str(address))
+
+    def read(self, block=None, gas_price=0) -> GuardState:
+        """Read the inputs of all resolver tasks at block
+
+        Args:
+            block: block to read state at, defaults to the latest block
+            gas_price: tx.gasprice the checks are evaluated with, eth_call
+                without a gas price runs the guard with 0
+        """
+        block = int(block) if block else web3.eth.block_number
+        queue = self.strategies(block)
+        live = [address for address in set(queue) if address != ZERO]
+        for address in live:
+            self._vault(address)
+        eth_usd, three_pool = self._oracles()
+
+        calls = {
+            "gas_threshold": (self.guard.gasThreshold, ()),
+            "debt_threshold": (self.guard.debtThreshold, ()),
+            "loss_block_threshold": (self.guard.LOSS_BLOCK_THRESHOLD, ()),
+            "round_data": (eth_usd.latestRoundData, ()),
+            "decimals": (eth_usd.decimals, ()),
+            "virtual_price": (three_pool.get_virtual_price, ()),
+        }
+        for address in live:
+            strategy, vault = self._strategy(address), self._vault(address)
+            calls[address, 0] = (self.guard.strategyCheck, (address,))
+            calls[address, 1] = (strategy.canStopLoss, ())
+            calls[address, 2] = (strategy.canHarvest, ())
+            calls[address, 3] = (strategy.estimatedTotalAssets, ())
+            calls[address, 4] = (vault.strategies, (address,))
+            calls[address, 5] = (vault.excessDebt, (address,))
+            calls[address, 6] = (vault.creditAvailable, (address,))
+        results = cached_read(self.cache, calls, block)
+        thresholds = (
+            results["gas_threshold"],
+            results["debt_threshold"],
+            results["loss_block_threshold"],
+        )
+        prices = (results["round_data"], results["decimals"], results["virtual_price"])
+        pending = {
+            address: tuple(results[address, i] for i in range(7)) for address in live
+        }
+
+        strategies = []
+        for index, address in enumerate(queue):
+            if address == ZERO:
+                strategies.append(
+                    GuardStrategy(
+                        index, address, False, False, 0, 0, 0, False, False, 0, 0, 0, 0
+                    )
+                )
+                continue
+            check, stop_loss, harvest, assets, params, excess, credit = pending[address]
+            active, with_loss, loss_start, time_limit, primer = check
+            strategies.append(
+                GuardStrategy(
+                    index=index,
+                    address=address,
+                    active=bool(active),
+                    can_harvest_with_loss=bool(with_loss),
+                    loss_start_block=int(loss_start),
+                    time_limit=int(time_limit),
+                    primer_timestamp=int(primer),
+                    can_stop_loss=bool(stop_loss),
+                    can_harvest=bool(harvest),
+                    estimated_total_assets=int(assets or 0),
+                    total_debt=int(params[3]) if params else 0,
+                    excess_debt=int(excess[0]) if excess else 0,
+                    credit_available=int(credit or 0),
+                )
+            )
+
+        gas_threshold, debt_threshold, loss_block_threshold = thresholds
+        round_data, decimals, virtual_price = prices
+        return GuardState(
+            block=block,
+            timestamp=web3.eth.get_block(block).timestamp,
+            gas_price=int(gas_price),
+            gas_threshold=int(gas_threshold),
+            debt_threshold=int(debt_threshold),
+            loss_block_threshold=int(loss_block_threshold),
+            eth_usd_price=int(round_data[1]) if round_data else 0,
+            eth_usd_decimals=int(decimals or 0),
+            virtual_price=int(virtual_price or 0),
+            strategies=strategies,
+        )
+
+
+def get_excess_debt(strategy: GuardStrategy) -> int:
+    """Mirror of GStrategyGuard._getExcessDebt"""
+    if strategy.estimated_total_assets > strategy.total_debt:
+        return 0
+    return strategy.excess_debt + strategy.total_debt - strategy.estimated_total_assets
+
+
+def convert_eth_to_usd(state: GuardState, amount: int) -> int:
+    """Mirror of GStrategyGuard._convertETHToUSD"""
+    eth_price_in_wei = state.eth_usd_price * 10 ** (
+        TARGET_DECIMALS - state.eth_usd_decimals
+    )
+    return amount * eth_price_in_wei // 10**TARGET_DECIMALS
+
+
+def profit_or_loss_exceeded(state: GuardState, strategy: GuardStrategy) -> bool:
+    """Mirror of GStrategyGuard._profitOrLossExceeded"""
+    can_harvest = False
+    assets = strategy.estimated_total_assets
+    debt = strategy.total_debt
+    excess_debt = strategy.excess_debt
+    profit = 0
+    if assets > debt:
+        profit = assets - debt
+    else:
+        excess_debt += debt - assets
+    if excess_debt > state.debt_threshold:
+        can_harvest = True
+    profit += strategy.credit_available
+    gas_used_for_harvest_in_usd = convert_eth_to_usd(
+        state, state.gas_price * state.gas_threshold
+    )
+    profit_in_usd = state.virtual_price * profit // 10**TARGET_DECIMALS
+    if profit_in_usd > gas_used_for_harvest_in_usd:
+        can_harvest = True
+    return can_harvest
+
+
+def _live(state: GuardState):
+    return (s for s in state.strategies if s.address != ZERO)
+
+
+def _decision(task, selector, triggers, target=None) -> Decision:
+    if not triggers:
+        return Decision(task, False)
+    target = target or triggers[0]
+    return Decision(task, True, (selector,), target, tuple(triggers))
+
+
+def _indexed_decision(task, selector, strategies: List[GuardStrategy]) -> Decision:
+    """Decision of a task whose payload targets strategies by queue position"""
+    if not strategies:
+        return Decision(task, False)
+    indexes = tuple(s.index for s in strategies)
+    triggers = tuple(s.address for s in strategies)
+    return Decision(task, True, (selector, indexes), triggers[0], triggers)
+
+
+def needs_primer(state: GuardState, s: GuardStrategy) -> bool:
+    """Mirror of GStrategyGuard._canUpdateStopLoss"""
+    return s.can_stop_loss and s.primer_timestamp == 0 and s.active
+
+
+def needs_primer_reset(state: GuardState, s: GuardStrategy) -> bool:
+    """Mirror of GStrategyGuard._canEndStopLoss"""
+    return not s.can_stop_loss and s.primer_timestamp != 0 and s.active
+
+
+def needs_stop_loss(state: GuardState, s: GuardStrategy) -> bool:
+    """Mirror of GStrategyGuard._canExecuteStopLoss"""
+    return (
+        s.primer_timestamp != 0
+        and s.can_stop_loss
+        and state.timestamp - s.primer_timestamp >= s.time_limit
+        and s.active
+    )
+
+
+def needs_harvest(state: GuardState, s: GuardStrategy) -> bool:
+    """Mirror of GStrategyGuard._canHarvest"""
+    # locked strategies are skipped until their loss is unlocked
+    return (
+        (s.can_harvest_with_loss or s.loss_start_block == 0)
+        and s.can_harvest
+        and profit_or_loss_exceeded(state, s)
+        and s.active
+    )
+
+
+def _matching(state: GuardState, check) -> List[GuardStrategy]:
+    return [s for s in _live(state) if check(state, s)]
+
+
+def update_stop_loss_primer(state: GuardState) -> Decision:
+    """Mirror of taskUpdateStopLossPrimer / canUpdateStopLoss"""
+    triggers = [s.address for s in _matching(state, needs_primer)]
+    return _decision("taskUpdateStopLossPrimer", "setStopLossPrimer", triggers)
+
+
+def stop_stop_loss_primer(state: GuardState) -> Decision:
+    """Mirror of taskStopStopLossPrimer / canEndStopLoss"""
+    triggers = [s.address for s in _matching(state, needs_primer_reset)]
+    return _decision("taskStopStopLossPrimer", "endStopLossPrimer", triggers)
+
+
+def trigger_stop_loss(state: GuardState) -> Decision:
+    """Mirror of taskTriggerStopLoss / canExecuteStopLossPrimer"""
+    triggers = [s.address for s in _matching(state, needs_stop_loss)]
+    return _decision("taskTriggerStopLoss", "executeStopLoss", triggers)
+
+
+def can_unlock_loss(state: GuardState) -> Decision:
+    """Mirror of taskCanUnlockLoss / canUnlockStrategy
+
+    The guard doesn't skip removed strategies here, reaching a zero address
+    before a match makes the on chain check revert.
+    """
+    task = "taskCanUnlockLoss"
+    for s in state.strategies:
+        if s.address == ZERO:
+            return Decision(task, False, reverted=True)
+        excess_debt = get_excess_debt(s)
+        if (
+            excess_debt > 0
+            and not s.can_harvest_with_loss
+            and s.loss_start_block != 0
+            and s.loss_start_block + state.loss_block_threshold < state.block
+        ):
+            return Decision(
+                task, True, ("unlockLoss", s.address), s.address, (s.address,)
+            )
+        elif excess_debt == 0 and s.loss_start_block != 0:
+            return Decision(
+                task,
+                True,
+                ("resetLossStartBlock", s.address),
+                s.address,
+                (s.address,),
+            )
+    return Decision(task, False)
+
+
+def strategy_harvest(state: GuardState) -> Decision:
+    """Mirror of taskStrategyHarvest / canHarvest
+
+    harvest() acts on the first active strategy that can harvest, which isn't
+    necessarily one of the strategies that made canHarvest return true.
+    """
+    triggers = [s.address for s in _matching(state, needs_harvest)]
+    target = next((s.address for s in _live(state) if s.can_harvest and s.active), None)
+    return _decision("taskStrategyHarvest", "harvest", triggers, target)
+
+
+def strategy_bulk_harvest(state: GuardState) -> Decision:
+    """Mirror of taskStrategyBulkHarvest / canHarvest
+
+    bulkHarvest() acts on every strategy in triggers, the ones with excess debt
+    that aren't allowed to harvest with a loss get locked instead.
+    """
+    decision = strategy_harvest(state)
+    return _decision("taskStrategyBulkHarvest", "bulkHarvest", decision.triggers)
+
+
+def update_stop_loss_primer_indexes(state: GuardState) -> Decision:
+    """Mirror of taskUpdateStopLossPrimerIndexes / stopLossPrimerUpdates"""
+    return _indexed_decision(
+        "taskUpdateStopLossPrimerIndexes",
+        "setStopLossPrimerIndexes",
+        _matching(state, needs_primer),
+    )
+
+
+def stop_stop_loss_primer_indexes(state: GuardState) -> Decision:
+    """Mirror of taskStopStopLossPrimerIndexes / stopLossPrimerEnds"""
+    return _indexed_decision(
+        "taskStopStopLossPrimerIndexes",
+        "endStopLossPrimerIndexes",
+        _matching(state, needs_primer_reset),
+    )
+
+
+def trigger_stop_loss_indexes(state: GuardState) -> Decision:
+    """Mirror of taskTriggerStopLossIndexes / stopLossExecutions"""
+    return _indexed_decision(
+        "taskTriggerStopLossIndexes",
+        "executeStopLossIndexes",
+        _matching(state, needs_stop_loss),
+    )
+
+
+def strategy_harvest_indexes(state: GuardState) -> Decision:
+    """Mirror of taskStrategyHarvestIndexes / harvestableStrategies"""
+    return _indexed_decision(
+        "taskStrategyHarvestIndexes",
+        "bulkHarvestIndexes",
+        _matching(state, needs_harvest),
+    )
+
+
+TASKS = (
+    update_stop_loss_primer,
+    stop_stop_loss_primer,
+    can_unlock_loss,
+    trigger_stop_loss,
+    strategy_harvest,
+    strategy_bulk_harvest,
+    update_stop_loss_primer_indexes,
+    stop_stop_loss_primer_indexes,
+    trigger_stop_loss_indexes,
+    strategy_harvest_indexes,
+)
+
+
+def resolve(state: GuardState) -> Dict[str, Decision]:
+    """Evaluate all resolver tasks against a single read of guard state"""
+    decisions = [task(state) for task in TASKS]
+    return {decision.task: decision for decision in decisions}
+
+
+def main(guard, block=None, gas_price="0"):
+    state = GuardReader(GStrategyGuard.at(guard)).read(block, int(gas_price))
+    print(f"block {state.block}, strategies {len(state.strategies)}")
+    for task, decision in resolve(state).items():
+        print(
+            f"{task}: can exec {decision.can_exec}, \
+            payload: {decision.payload}, \
+            strategy: {decision.strategy}, \
+            triggers: {decision.triggers}, \
+            reverted: {decision.reverted}"
+        )
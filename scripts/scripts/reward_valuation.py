@@ -0,0 +1,183 @@
+import json
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+from brownie import Contract, ConvexStrategy, interface, web3
+
+from .abi_store import contract
+from .addresses import CVX_ADDRESS, USDC_ETH_V3_ADDRESS
+from .read_cache import ReadCache, cached_read
+
+ZERO = "0x0000000000000000000000000000000000000000"
+
+# ConvexStrategy constants
+DEFAULT_DECIMALS_FACTOR = 10**18
+MIN_REWARD_SELL_AMOUNT = 10**18
+MIN_WETH_SELL_AMOUNT = 10**16
+TOTAL_CLIFFS = 1000
+MAX_SUPPLY = 10**8 * DEFAULT_DECIMALS_FACTOR
+REDUCTION_PER_CLIFF = 10**5 * DEFAULT_DECIMALS_FACTOR
+CRV_ETH_INDEX = 1
+# USDC has 6 decimals, getPriceV3 scales its price to 18
+USDC_SCALE = 10**12
+
+
+class MarketState(NamedTuple):
+    """Inputs shared by the reward valuation of every strategy at a block"""
+
+    block: int
+    cvx_supply: int
+    sqrt_price_x96: int
+    # 3pool virtual price keyed by pool address
+    virtual_prices: Dict[str, int]
+
+
+class RewardValuation(NamedTuple):
+    """Mirror of ConvexStrategy._claimableRewards for a strategy"""
+
+    name: str
+    address: str
+    crv: int
+    cvx: int
+    crv_value: int
+    cvx_value: int
+    # value of the CRV and CVX rewards in the strategy asset (3crv)
+    value: int
+
+
+def _objects(values) -> np.ndarray:
+    return np.asarray([int(v) for v in values], dtype=object)
+
+
+def cvx_minted(crv, supply) -> np.ndarray:
+    """CVX minted for claiming crv at a CVX supply, vectorised over crv"""
+    crv = _objects(np.atleast_1d(crv))
+    cliff = supply // REDUCTION_PER_CLIFF
+    if cliff >= TOTAL_CLIFFS:
+        return np.zeros(len(crv), dtype=object)
+    cvx = crv * (TOTAL_CLIFFS - cliff) // TOTAL_CLIFFS
+    # supply cap check
+    return np.minimum(cvx, MAX_SUPPLY - supply)
+
+
+def eth_to_asset(amount, sqrt_price_x96, virtual_price) -> np.ndarray:
+    """Mirror of ConvexStrategy.getPriceV3, vectorised over amounts and pools"""
+    price = 2**192 * DEFAULT_DECIMALS_FACTOR // sqrt_price_x96**2
+    amount = _objects(np.atleast_1d(amount))
+    virtual_price = _objects(np.broadcast_to(virtual_price, amount.shape))
+    return amount * (price * USDC_SCALE // virtual_price)
+
+
+def claimable_value(crv_value, cvx_value, sqrt_price_x96, virtual_price):
+    """Value of the ETH the rewards sell for, 0 below MIN_WETH_SELL_AMOUNT"""
+    total = _objects(np.atleast_1d(crv_value)) + _objects(np.atleast_1d(cvx_value))
+    value = eth_to_asset(total, sqrt_price_x96, virtual_price)
+    return np.where(total > MIN_WETH_SELL_AMOUNT, value, 0)
+
+
+class RewardValuer:
+    """Values the claimable CRV and CVX rewards of many strategies at once
+
+    Per block the strategy configuration and the CVX supply and USDC/ETH
+    slot0 are read in one aggregated call, earned() of every strategy and the
+    3pool virtual prices in a second and the Curve quotes in a third, after
+    which the CVX mint and the valuation are evaluated as vectors over all
+    strategies. Additional reward tokens,
+    which rewards() adds on top, aren't valued.
+
+    Args:
+        strategies: mapping of strategy name to strategy address
+        cache: ReadCache shared with other readers of the same blocks
+    """
+
+    def __init__(self, strategies: Dict[str, str], cache: Optional[ReadCache] = None):
+        self.strategies = {
+            name: Contract.from_abi(name, address, ConvexStrategy.abi, persist=False)
+            for name, address in strategies.items()
+        }
+        self.cache = cache
+        self.cvx = contract(CVX_ADDRESS)
+        self.usdc_eth = interface.IUniV3_POOL(USDC_ETH_V3_ADDRESS)
+
+    def _read(self, calls, block):
+        return cached_read(self.cache, calls, block)
+
+    def read_config(self, block) -> Dict:
+        calls = {
+            "cvx_supply": (self.cvx.totalSupply, ()),
+            "slot0": (self.usdc_eth.slot0, ()),
+        }
+        for name, strategy in self.strategies.items():
+            calls[name, "investment"] = (strategy.getCurrentInvestment, ())
+            calls[name, "crv_pool"] = (strategy.crvEthPool, ())
+            calls[name, "cvx_pool"] = (strategy.cvxEthPool, ())
+            calls[name, "three_pool"] = (strategy.crv3pool, ())
+        return self._read(calls, block)
+
+    def value(self, block=None) -> List[RewardValuation]:
+        block = int(block) if block else web3.eth.block_number
+        config = self.read_config(block)
+        names = list(self.strategies)
+        three_pools = {str(config[name, "three_pool"]) for name in names}
+        calls = {
+            pool: (interface.ICurve3Pool(pool).get_virtual_price, ())
+            for pool in three_pools
+        }
+        for name in names:
+            investment = config[name, "investment"]
+            if investment and investment[3] != ZERO:
+                calls[name] = (
+                    interface.Rewards(investment[3]).earned,
+                    (self.strategies[name].address,),
+                )
+        earned = self._read(calls, block)
+        market = MarketState(
+            block,
+            int(config["cvx_supply"]),
+            int(config["slot0"][0]),
+            {pool: int(earned[pool]) for pool in three_pools},
+        )
+        crv = _objects(earned.get(name) or 0 for name in names)
+        cvx = cvx_minted(crv, market.cvx_supply)
+
+        quotes = {}
+        for i, name in enumerate(names):
+            for token, amount in (("crv", crv[i]), ("cvx", cvx[i])):
+                pool = config[name, f"{token}_pool"]
+                if amount > MIN_REWARD_SELL_AMOUNT and pool != ZERO:
+                    quotes[name, token] = (
+                        interface.ICurveRewards(pool).get_dy,
+                        (CRV_ETH_INDEX, 0, int(amount)),
+                    )
+        quoted = self._read(quotes, block) if quotes else {}
+        crv_value = _objects(quoted.get((name, "crv")) or 0 for name in names)
+        cvx_value = _objects(quoted.get((name, "cvx")) or 0 for name in names)
+        virtual_prices = [
+            market.virtual_prices[str(config[name, "three_pool"])] for name in names
+        ]
+        values = claimable_value(
+            crv_value, cvx_value, market.sqrt_price_x96, virtual_prices
+        )
+        return [
+            RewardValuation(
+                name,
+                self.strategies[name].address,
+                int(crv[i]),
+                int(cvx[i]),
+                int(crv_value[i]),
+                int(cvx_value[i]),
+                int(values[i]),
+            )
+            for i, name in enumerate(names)
+        ]
+
+
+def main(block=None):
+    with open("mainnet_fork_deployments.json") as json_file:
+        contract_data = json.load(json_file)
+    strategies = {k: v for k, v in contract_data.items() if "convex" in k}
+    for valuation in RewardValuer(strategies).value(block):
+        print(
+            f"{valuation.name}: {valuation.crv / 1e18:.2f} CRV, "
+            f"{valuation.cvx / 1e18:.2f} CVX, {valuation.value / 1e18:.2f} 3crv"
+        )
@@ -1,9 +1,11 @@
 import json
 import os
 from distutils.util import strtobool
+from typing import List, NamedTuple
 
 from brownie import (
     CurveOracle,
+    GLens,
     GMigration,
     GRouter,
     GTranche,
@@ -22,36 +24,44 @@ from brownie import (
 )
 from dotenv import load_dotenv
 
+from .abi_store import contract
 from .addresses import *
 from .curve_convex_pools import *
+from .deployer import DeploymentEngine, Manifest, Ref, call_step, deploy_step
+from .registry import Registry
 
 MAX_UINT256 = 2**256 - 1
 MIN_DELAY = 259200
 ZERO = "0x0000000000000000000000000000000000000000"
-
-dai_vault_adapter = Contract(DAI_VAULT_ADAPTOR_ADDRESS)
-usdc_vault_adapter = Contract(USDC_VAULT_ADAPTOR_ADDRESS)
-usdt_vault_adapter = Contract(USDT_VAULT_ADAPTOR_ADDRESS)
-
-dai_vault = Contract(dai_vault_adapter.vault())
-usdc_vault = Contract(usdc_vault_adapter.vault())
-usdt_vault = Contract(usdt_vault_adapter.vault())
-
-GPC = Contract(GPC_ADDRESS)
+MANIFEST = "mainnet_fork_deployments.manifest.json"
 
 load_dotenv()
 
 local = strtobool(os.getenv("env"))
 PUBLISH_SOURCE = strtobool(os.getenv("PUBLISH_SOURCE"))
+salt = 123456789
 
-gro_timelock_controller = Contract(TIMELOCK_ADDRESS)
-dai = MockDAI.at(DAI_ADDRESS)
-usdc = MockUSDC.at(USDC_ADDRESS)
-usdt = MockUSDT.at(USDT_ADDRESS)
+# contract and account handles, resolved the first time an entry point uses them
+handles = Registry()
+handles.register("dai_vault_adapter", lambda: contract(DAI_VAULT_ADAPTOR_ADDRESS))
+handles.register("usdc_vault_adapter", lambda: contract(USDC_VAULT_ADAPTOR_ADDRESS))
+handles.register("usdt_vault_adapter", lambda: contract(USDT_VAULT_ADAPTOR_ADDRESS))
 
-pwrd = SeniorTranche.at(PWRD_ADDRESS)  # admin.deploy(SeniorTranche, "senior", "snr")
-gvt = JuniorTranche.at(GVT_ADDRESS)  # admin.deploy(JuniorTranche, "junior", "jnr")
-salt = 123456789
+handles.register("dai_vault", lambda: contract(handles.dai_vault_adapter.vault()))
+handles.register("usdc_vault", lambda: contract(handles.usdc_vault_adapter.vault()))
+handles.register("usdt_vault", lambda: contract(handles.usdt_vault_adapter.vault()))
+
+handles.register("GPC", lambda: contract(GPC_ADDRESS))
+
+handles.register("gro_timelock_controller", lambda: contract(TIMELOCK_ADDRESS))
+handles.register("dai", lambda: MockDAI.at(DAI_ADDRESS))
+handles.register("usdc", lambda: MockUSDC.at(USDC_ADDRESS))
+handles.register("usdt", lambda: MockUSDT.at(USDT_ADDRESS))
+
+# admin.deploy(SeniorTranche, "senior", "snr")
+handles.register("pwrd", lambda: SeniorTranche.at(PWRD_ADDRESS))
+# admin.deploy(JuniorTranche, "junior", "jnr")
+handles.register("gvt", lambda: JuniorTranche.at(GVT_ADDRESS))
 
 
 def load_deployed_contracts():
@@ -65,31 +75,90 @@ def migration_data():
     contract_data = load_deployed_contracts()
 
     data_payload = {}
-    data_payload[1] = dai_vault_adapter.migrate.encode_input(
+    data_payload[1] = handles.dai_vault_adapter.migrate.encode_input(
         contract_data.get("GMigration", ZERO)
     )
-    data_payload[2] = usdc_vault_adapter.migrate.encode_input(
+    data_payload[2] = handles.usdc_vault_adapter.migrate.encode_input(
         contract_data.get("GMigration", ZERO)
     )
-    data_payload[3] = usdt_vault_adapter.migrate.encode_input(
+    data_payload[3] = handles.usdt_vault_adapter.migrate.encode_input(
         contract_data.get("GMigration", ZERO)
     )
-    data_payload[4] = gvt.addToWhitelist.encode_input(
+    data_payload[4] = handles.gvt.addToWhitelist.encode_input(
         contract_data.get("GTranche", ZERO)
     )
-    data_payload[5] = gvt.setController.encode_input(
+    data_payload[5] = handles.gvt.setController.encode_input(
         contract_data.get("GTranche", ZERO)
     )
-    data_payload[6] = pwrd.addToWhitelist.encode_input(
+    data_payload[6] = handles.pwrd.addToWhitelist.encode_input(
         contract_data.get("GTranche", ZERO)
     )
-    data_payload[7] = pwrd.setController.encode_input(
+    data_payload[7] = handles.pwrd.setController.encode_input(
         contract_data.get("GTranche", ZERO)
     )
 
     return contract_data, data_payload
 
 
+class TimelockBatch(NamedTuple):
+    targets: List[str]
+    values: List[int]
+    payloads: List[str]
+    predecessor: str
+    salt: int
+
+    def id(self):
+        return handles.gro_timelock_controller.hashOperationBatch(*self)
+
+
+def migration_batches():
+    """Timelock batches of the migration payloads
+
+    The vault migration targets (payloads 1-3) are executed before the
+    migration is run and the gvt/pwrd whitelist and controller updates
+    (payloads 4-7) after it. The second batch uses the first as its
+    predecessor so it can't be executed out of order.
+    """
+    contract_data, data_payload = migration_data()
+    vault_batch = TimelockBatch(
+        [
+            handles.dai_vault_adapter.address,
+            handles.usdc_vault_adapter.address,
+            handles.usdt_vault_adapter.address,
+        ],
+        [0, 0, 0],
+        [data_payload[1], data_payload[2], data_payload[3]],
+        ZERO,
+        salt,
+    )
+    token_batch = TimelockBatch(
+        [
+            handles.gvt.address,
+            handles.gvt.address,
+            handles.pwrd.address,
+            handles.pwrd.address,
+        ],
+        [0, 0, 0, 0],
+        [data_payload[4], data_payload[5], data_payload[6], data_payload[7]],
+        vault_batch.id(),
+        salt,
+    )
+    return contract_data, vault_batch, token_batch
+
+
+def execute_batch(batch, sender):
+    batch_id = batch.id()
+    if not handles.gro_timelock_controller.isOperationReady(batch_id):
+        raise Exception(f"timelock batch {batch_id} is not ready")
+    if (
+        batch.predecessor != ZERO
+        and not handles.gro_timelock_controller.isOperationDone(batch.predecessor)
+    ):
+        raise Exception(f"timelock batch {batch.predecessor} has not been executed")
+    print(f"execute timelock batch {batch_id}")
+    handles.gro_timelock_controller.executeBatch(*batch, {"from": sender})
+
+
 def load_account(local=False, account=None):
     if local:
         with open(f"./{account}") as keyfile:
@@ -102,11 +171,12 @@ def load_account(local=False, account=None):
         return accounts.at(os.getenv(account), force=True)
 
 
-admin = load_account(local, "deployer")
-bot = load_account(local, "bot")
+handles.register("admin", lambda: load_account(local, "deployer"))
+handles.register("bot", lambda: load_account(local, "bot"))
 
 
-def migrate(minThreeCrv, minShares):
+def migrate(minThreeCrv, minShares, batch="false"):
+    batch = strtobool(batch)
     timelock_admin = load_account(local, "timelock_admin")
 
     print(minThreeCrv, minShares)
@@ -119,74 +189,102 @@ def migrate(minThreeCrv, minShares):
 
     contract_data, data_payload = migration_data()
     print(data_payload)
+    if batch:
+        _, vault_batch, token_batch = migration_batches()
 
-    pwrd_init_factor = pwrd.factor()
-    pwrd_init_total_supply = pwrd.totalSupply()
-    pwrd_init_total_base = pwrd.totalSupplyBase()
-    gvt_init_factor = gvt.factor()
-    gvt_init_total_supply = gvt.totalSupply()
+    pwrd_init_factor = handles.pwrd.factor()
+    pwrd_init_total_supply = handles.pwrd.totalSupply()
+    pwrd_init_total_base = handles.pwrd.totalSupplyBase()
+    gvt_init_factor = handles.gvt.factor()
+    gvt_init_total_supply = handles.gvt.totalSupply()
 
     # send funds to gmigration
     totalAssets = [
-        dai_vault_adapter.totalAssets() / 10**18,
-        usdc_vault_adapter.totalAssets() / 10**6,
-        usdt_vault_adapter.totalAssets() / 10**6,
+        handles.dai_vault_adapter.totalAssets() / 10**18,
+        handles.usdc_vault_adapter.totalAssets() / 10**6,
+        handles.usdt_vault_adapter.totalAssets() / 10**6,
     ]
-    print("execute dai vault migration target")
-    gro_timelock_controller.execute(
-        dai_vault_adapter.address,
-        0,
-        data_payload[1],
-        ZERO,
-        salt,
-        {"from": timelock_admin.address},
-    )
-    print("execute usdc vault migration target")
-    gro_timelock_controller.execute(
-        usdc_vault_adapter.address,
-        0,
-        data_payload[2],
-        ZERO,
-        salt,
-        {"from": timelock_admin.address},
-    )
-    print("execute usdt vault migration target")
-    gro_timelock_controller.execute(
-        usdt_vault_adapter.address,
-        0,
-        data_payload[3],
-        ZERO,
-        salt,
-        {"from": timelock_admin.address},
-    )
+    if batch:
+        execute_batch(vault_batch, timelock_admin.address)
+    else:
+        print("execute dai vault migration target")
+        handles.gro_timelock_controller.execute(
+            handles.dai_vault_adapter.address,
+            0,
+            data_payload[1],
+            ZERO,
+            salt,
+            {"from": timelock_admin.address},
+        )
+        print("execute usdc vault migration target")
+        handles.gro_timelock_controller.execute(
+            handles.usdc_vault_adapter.address,
+            0,
+            data_payload[2],
+            ZERO,
+            salt,
+            {"from": timelock_admin.address},
+        )
+        print("execute usdt vault migration target")
+        handles.gro_timelock_controller.execute(
+            handles.usdt_vault_adapter.address,
+            0,
+            data_payload[3],
+            ZERO,
+            salt,
+            {"from": timelock_admin.address},
+        )
 
     # run migration
     gmigration = GMigration.at(contract_data.get("GMigration", ZERO))
     gtranche = GTranche.at(contract_data.get("GTranche", ZERO))
     print("set gtranche in migration")
-    gmigration.setGTranche(gtranche.address, {"from": admin.address})
+    gmigration.setGTranche(gtranche.address, {"from": handles.admin.address})
     print("perapre migration")
-    gmigration.prepareMigration(minThreeCrv, minShares, {"from": admin.address})
+    gmigration.prepareMigration(minThreeCrv, minShares, {"from": handles.admin.address})
     print("execute migration")
-    gtranche.migrateFromOldTranche({"from": admin.address})
+    gtranche.migrateFromOldTranche({"from": handles.admin.address})
 
     # whitelist GTranche on GTokens and set controller
-    print("execute gvt whitelist update")
-    gro_timelock_controller.execute(
-        gvt.address, 0, data_payload[4], ZERO, salt, {"from": admin.address}
-    )
-    print("execute gvt ownership change")
-    gro_timelock_controller.execute(
-        gvt.address, 0, data_payload[5], ZERO, salt, {"from": admin.address}
-    )
-    print("execute pwrd whitelist update")
-    gro_timelock_controller.execute(
-        pwrd.address, 0, data_payload[6], ZERO, salt, {"from": admin.address}
-    )
-    print("execute pwrd ownersup update")
-    gro_timelock_controller.execute(
-        pwrd.address, 0, data_payload[7], ZERO, salt, {"from": admin.address}
-    )
+    if batch:
+        execute_batch(token_batch, handles.admin.address)
+    else:
+        print("execute gvt whitelist update")
+        handles.gro_timelock_controller.execute(
+            handles.gvt.address,
+            0,
+            data_payload[4],
+            ZERO,
+            salt,
+            {"from": handles.admin.address},
+        )
+        print("execute gvt ownership change")
+        handles.gro_timelock_controller.execute(
+            handles.gvt.address,
+            0,
+            data_payload[5],
+            ZERO,
+            salt,
+            {"from": handles.admin.address},
+        )
+        print("execute pwrd whitelist update")
+        handles.gro_timelock_controller.execute(
+            handles.pwrd.address,
+            0,
+            data_payload[6],
+            ZERO,
+            salt,
+            {"from": handles.admin.address},
+        )
+        print("execute pwrd ownersup update")
+        handles.gro_timelock_controller.execute(
+            handles.pwrd.address,
+            0,
+            data_payload[7],
+            ZERO,
+            salt,
+            {"from": handles.admin.address},
+        )
     print(f"GTranche totalAssets {gtranche.tokenBalances(0)}")
     print(
         f"junior {gtranche.trancheBalances(False)/10**18}, \
@@ -213,84 +311,120 @@ def migrate(minThreeCrv, minShares):
         gvt init totalSupply {gvt_init_total_supply}"
     )
     print(
-        f"pwrd pps {pwrd.factor()} \
-        pwrd totalSupply {pwrd.totalSupply()} \
-        pwrd totalSupplyBase {pwrd.totalSupplyBase()}"
+        f"pwrd pps {handles.pwrd.factor()} \
+        pwrd totalSupply {handles.pwrd.totalSupply()} \
+        pwrd totalSupplyBase {handles.pwrd.totalSupplyBase()}"
     )
-    print(f"gvt pps {gvt.factor()} gvt totalSupply {gvt.totalSupply()}")
+    print(f"gvt pps {handles.gvt.factor()} gvt totalSupply {handles.gvt.totalSupply()}")
 
 
 def harvest_all():
 
-    dai_total_assets_init = dai_vault_adapter.totalAssets()
-    usdc_total_assets_init = usdc_vault_adapter.totalAssets()
-    usdt_total_assets_init = usdt_vault_adapter.totalAssets()
+    dai_total_assets_init = handles.dai_vault_adapter.totalAssets()
+    usdc_total_assets_init = handles.usdc_vault_adapter.totalAssets()
+    usdt_total_assets_init = handles.usdt_vault_adapter.totalAssets()
 
     print("update strategyDebt ratio for dai vault")
-    dai_vault.updateStrategyDebtRatio(DAI_STRATEGY_1, 0, {"from": admin.address})
-    dai_vault.updateStrategyDebtRatio(DAI_STRATEGY_2, 0, {"from": admin.address})
-    usdc_vault.updateStrategyDebtRatio(USDC_STRATEGY_1, 0, {"from": admin.address})
-    usdc_vault.updateStrategyDebtRatio(USDC_STRATEGY_2, 0, {"from": admin.address})
-    usdt_vault.updateStrategyDebtRatio(USDT_STRATEGY_1, 0, {"from": admin.address})
+    handles.dai_vault.updateStrategyDebtRatio(
+        DAI_STRATEGY_1, 0, {"from": handles.admin.address}
+    )
+    handles.dai_vault.updateStrategyDebtRatio(
+        DAI_STRATEGY_2, 0, {"from": handles.admin.address}
+    )
+    handles.usdc_vault.updateStrategyDebtRatio(
+        USDC_STRATEGY_1, 0, {"from": handles.admin.address}
+    )
+    handles.usdc_vault.updateStrategyDebtRatio(
+        USDC_STRATEGY_2, 0, {"from": handles.admin.address}
+    )
+    handles.usdt_vault.updateStrategyDebtRatio(
+        USDT_STRATEGY_1, 0, {"from": handles.admin.address}
+    )
 
     # set slippage for strategy to allow harvest
     print("set dai prim slippage")
-    dai_strategy_1 = Contract(DAI_STRATEGY_1)
-    dai_strategy_1.setSlippage(50, {"from": admin.address})
+    dai_strategy_1 = contract(DAI_STRATEGY_1)
+    dai_strategy_1.setSlippage(50, {"from": handles.admin.address})
     print("set dai sec slippage")
-    dai_strategy_2 = Contract(DAI_STRATEGY_2)
-    dai_strategy_2.setSlippage(50, {"from": admin.address})
+    dai_strategy_2 = contract(DAI_STRATEGY_2)
+    dai_strategy_2.setSlippage(50, {"from": handles.admin.address})
     print("set usdc prim slippage")
-    usdc_strategy_1 = Contract(USDC_STRATEGY_1)
-    usdc_strategy_1.setSlippage(50, {"from": admin.address})
+    usdc_strategy_1 = contract(USDC_STRATEGY_1)
+    usdc_strategy_1.setSlippage(50, {"from": handles.admin.address})
     print("set usdc sec slippage")
-    usdc_strategy_2 = Contract(USDC_STRATEGY_2)
-    usdc_strategy_2.setSlippage(50, {"from": admin.address})
+    usdc_strategy_2 = contract(USDC_STRATEGY_2)
+    usdc_strategy_2.setSlippage(50, {"from": handles.admin.address})
     print("set usdt prim slippage")
-    usdt_strategy_1 = Contract(USDT_STRATEGY_1)
-    usdt_strategy_1.setSlippage(50, {"from": admin.address})
+    usdt_strategy_1 = contract(USDT_STRATEGY_1)
+    usdt_strategy_1.setSlippage(50, {"from": handles.admin.address})
 
     # Harvest all strategies to get funds into Vyper Vaults
     print("harvest dai prim")
-    dai_vault_adapter.strategyHarvest(0, {"from": bot.address})
+    handles.dai_vault_adapter.strategyHarvest(0, {"from": handles.bot.address})
     print("harvest dai sec")
-    dai_vault_adapter.strategyHarvest(1, {"from": bot.address})
+    handles.dai_vault_adapter.strategyHarvest(1, {"from": handles.bot.address})
     print("harvest usdc prim")
-    usdc_vault_adapter.strategyHarvest(0, {"from": bot.address})
+    handles.usdc_vault_adapter.strategyHarvest(0, {"from": handles.bot.address})
     print("harvest usdc sec")
-    usdc_vault_adapter.strategyHarvest(1, {"from": bot.address})
+    handles.usdc_vault_adapter.strategyHarvest(1, {"from": handles.bot.address})
     print("harvest usdt prim")
-    usdt_vault_adapter.strategyHarvest(0, {"from": bot.address})
+    handles.usdt_vault_adapter.strategyHarvest(0, {"from": handles.bot.address})
 
     # withdraw all funds to adaptor
     print("withdraw to dai adapter")
-    print(f"dai vault totalAssets {dai.balanceOf(dai_vault_adapter.vault())}")
-    dai_vault_adapter.withdrawToAdapter(
-        dai.balanceOf(dai_vault_adapter.vault()), 0, {"from": bot.address}
+    print(
+        f"dai vault totalAssets {handles.dai.balanceOf(handles.dai_vault_adapter.vault())}"
+    )
+    handles.dai_vault_adapter.withdrawToAdapter(
+        handles.dai.balanceOf(handles.dai_vault_adapter.vault()),
+        0,
+        {"from": handles.bot.address},
     )
     print("withdraw to usdc adapter")
-    print(f"usdc vault totalAssets {usdc.balanceOf(usdc_vault_adapter.vault())}")
-    usdc_vault_adapter.withdrawToAdapter(
-        usdc.balanceOf(usdc_vault_adapter.vault()), 0, {"from": bot.address}
+    print(
+        f"usdc vault totalAssets {handles.usdc.balanceOf(handles.usdc_vault_adapter.vault())}"
+    )
+    handles.usdc_vault_adapter.withdrawToAdapter(
+        handles.usdc.balanceOf(handles.usdc_vault_adapter.vault()),
+        0,
+        {"from": handles.bot.address},
     )
     print("withdraw to usdt adapter")
-    print(f"usdt vault totalAssets {usdt.balanceOf(usdt_vault_adapter.vault())}")
-    usdt_vault_adapter.withdrawToAdapter(
-        usdt.balanceOf(usdt_vault_adapter.vault()), 0, {"from": bot.address}
+    print(
+        f"usdt vault totalAssets {handles.usdt.balanceOf(handles.usdt_vault_adapter.vault())}"
+    )
+    handles.usdt_vault_adapter.withdrawToAdapter(
+        handles.usdt.balanceOf(handles.usdt_vault_adapter.vault()),
+        0,
+        {"from": handles.bot.address},
     )
     print(
         f"dai init {dai_total_assets_init / 10**18}, \
-        dai final {dai_vault_adapter.totalAssets() / 10**18}"
+        dai final {handles.dai_vault_adapter.totalAssets() / 10**18}"
     )
     print(
         f"usdc init {usdc_total_assets_init / 10**6}, \
-        usdc final {usdc_vault_adapter.totalAssets() / 10**6}"
+        usdc final {handles.usdc_vault_adapter.totalAssets() / 10**6}"
     )
     print(
         f"usdt init {usdt_total_assets_init / 10**6}, \
-        usdt final {usdt_vault_adapter.totalAssets() / 10**6}"
+        usdt final {handles.usdt_vault_adapter.totalAssets() / 10**6}"
+    )
+    handles.GPC.pause({"from": handles.bot})
+
+
+def schedule_migration_batch():
+    _, vault_batch, token_batch = migration_batches()
+    timelock_admin = load_account(local, "timelock_admin")
+
+    print(f"schedule vault migration targets as batch {vault_batch.id()}")
+    handles.gro_timelock_controller.scheduleBatch(
+        *vault_batch, MIN_DELAY, {"from": timelock_admin.address}
+    )
+    print(f"schedule gtranche gvt/pwrd permissions as batch {token_batch.id()}")
+    handles.gro_timelock_controller.scheduleBatch(
+        *token_batch, MIN_DELAY, {"from": timelock_admin.address}
     )
-    GPC.pause({"from": bot})
 
 
 def schedule_migration():
@@ -299,8 +433,8 @@ def schedule_migration():
     timelock_admin = load_account(local, "timelock_admin")
 
     print("set migration target for dai vault")
-    gro_timelock_controller.schedule(
-        dai_vault_adapter.address,
+    handles.gro_timelock_controller.schedule(
+        handles.dai_vault_adapter.address,
         0,
         data_payload[1],
         ZERO,
@@ -309,8 +443,8 @@ def schedule_migration():
         {"from": timelock_admin.address},
     )
     print("set migration target for usdc vault")
-    gro_timelock_controller.schedule(
-        usdc_vault_adapter.address,
+    handles.gro_timelock_controller.schedule(
+        handles.usdc_vault_adapter.address,
         0,
         data_payload[2],
         ZERO,
@@ -319,8 +453,8 @@ def schedule_migration():
         {"from": timelock_admin.address},
     )
     print("set migration target for usdt vault")
-    gro_timelock_controller.schedule(
-        usdt_vault_adapter.address,
+    handles.gro_timelock_controller.schedule(
+        handles.usdt_vault_adapter.address,
         0,
         data_payload[3],
         ZERO,
@@ -330,114 +464,131 @@ def schedule_migration():
     )
 
     print("move gtranche to gvt whitelist")
-    gro_timelock_controller.schedule(
-        gvt.address, 0, data_payload[4], ZERO, salt, MIN_DELAY, {"from": timelock_admin.address}
+    handles.gro_timelock_controller.schedule(
+        handles.gvt.address,
+        0,
+        data_payload[4],
+        ZERO,
+        salt,
+        MIN_DELAY,
+        {"from": timelock_admin.address},
     )
     print("move gtranche to gvt ownership")
-    gro_timelock_controller.schedule(
-        gvt.address, 0, data_payload[5], ZERO, salt, MIN_DELAY, {"from": timelock_admin.address}
+    handles.gro_timelock_controller.schedule(
+        handles.gvt.address,
+        0,
+        data_payload[5],
+        ZERO,
+        salt,
+        MIN_DELAY,
+        {"from": timelock_admin.address},
     )
     print("move gtranche to pwrd whitelist")
-    gro_timelock_controller.schedule(
-        pwrd.address, 0, data_payload[6], ZERO, salt, MIN_DELAY, {"from": timelock_admin.address}
+    handles.gro_timelock_controller.schedule(
+        handles.pwrd.address,
+        0,
+        data_payload[6],
+        ZERO,
+        salt,
+        MIN_DELAY,
+        {"from": timelock_admin.address},
     )
     print("move gtranche to pwrd ownership")
-    gro_timelock_controller.schedule(
-        pwrd.address, 0, data_payload[7], ZERO, salt, MIN_DELAY, {"from": timelock_admin.address}
-    )
-
-
-def deploy():
-    # setup contract
-
-    # deploy GVault
-    print("deploying GVault...")
-    gro_vault = admin.deploy(
-        GVault, THREE_POOL_TOKEN_ADDRESS, publish_source=PUBLISH_SOURCE
-    )
-    print(f"...deployed at {gro_vault.address}")
-
-    print("deploying GMigration...")
-    gmigration = admin.deploy(GMigration, gro_vault, publish_source=PUBLISH_SOURCE)
-    print(f"...deployed at {gmigration.address}")
-
-    # deploy curve Oracle
-    print("deploying curve_oracle...")
-    curve_oracle = admin.deploy(CurveOracle, publish_source=PUBLISH_SOURCE)
-    print(f"...deployed at {curve_oracle.address}")
-    # deploy gtranche
-    print("deploying GTranche...")
-    gtranche = admin.deploy(
-        GTranche,
-        [gro_vault],
-        [gvt, pwrd],
-        curve_oracle,
-        gmigration.address,
-        publish_source=PUBLISH_SOURCE,
-    )
-    print(f"...deployed at {gtranche.address}")
-
-    # deploy router oracle
-    print("deploying router oracle...")
-    router_oracle = admin.deploy(
-        RouterOracle, CHAINLINK_AGG_ADDRESSES, publish_source=PUBLISH_SOURCE
-    )
-    print(f"...deployed at {router_oracle.address}")
-
-    # deploy GRouter
-    print("deploying gro_router...")
-    gro_router = admin.deploy(
-        GRouter,
-        gtranche,
-        gro_vault,
-        router_oracle,
-        THREE_POOL_ADDRESS,
-        THREE_POOL_TOKEN_ADDRESS,
-        publish_source=PUBLISH_SOURCE,
-    )
-    print(f"...deployed at {gro_router.address}")
-
-    # deploy pnl
-    print("deploying pnl...")
-    pnl = admin.deploy(PnLFixedRate, gtranche, publish_source=PUBLISH_SOURCE)
-    print(f"...deployed at {pnl.address}")
-
-    # add pnl to tranche
-    print("add pnl to tranche...")
-    gtranche.setPnL(pnl)
-
-    # add pnl to tranche
-    print("deploy strategies...")
-    snl = test_snl(admin)
-    strategy_frax = setup_frax_strategy(admin, gro_vault, snl)
-    print(strategy_frax)
-    strategy_mim = setup_mim_strategy(admin, gro_vault, snl)
-    print(strategy_mim)
-    strategy_ousd = setup_ousd_strategy(admin, gro_vault, snl)
-    print(strategy_ousd)
-    strategy_tusd = setup_tusd_strategy(admin, gro_vault, snl)
-    print(strategy_tusd)
-    strategy_gusd = setup_gusd_strategy(admin, gro_vault, snl)
-    print(strategy_gusd)
+    handles.gro_timelock_controller.schedule(
+        handles.pwrd.address,
+        0,
+        data_payload[7],
+        ZERO,
+        salt,
+        MIN_DELAY,
+        {"from": timelock_admin.address},
+    )
+
+
+# deployed strategy name => convex pool, see the setup_*_strategy helpers
+STRATEGY_POOLS = {
+    "convexFrax": "FRAX",
+    "convexMim": "LUSD",
+    "convexOusd": "OUSD",
+    "convexTusd": "TUSD",
+    "convexGusd": "GUSD",
+}
+
+
+def deployment_steps():
+    """Dependency graph of the protocol deployment"""
+    steps = [
+        deploy_step("GVault", GVault, THREE_POOL_TOKEN_ADDRESS),
+        deploy_step("GMigration", GMigration, Ref("GVault")),
+        deploy_step("CurveOracle", CurveOracle),
+        deploy_step(
+            "GTranche",
+            GTranche,
+            [Ref("GVault")],
+            [handles.gvt, handles.pwrd],
+            Ref("CurveOracle"),
+            Ref("GMigration"),
+        ),
+        deploy_step("RouterOracle", RouterOracle, CHAINLINK_AGG_ADDRESSES),
+        deploy_step(
+            "GRouter",
+            GRouter,
+            Ref("GTranche"),
+            Ref("GVault"),
+            Ref("RouterOracle"),
+            THREE_POOL_ADDRESS,
+            THREE_POOL_TOKEN_ADDRESS,
+        ),
+        deploy_step("PnL", PnLFixedRate, Ref("GTranche")),
+        call_step("GTranche.setPnL", Ref("GTranche"), "setPnL", Ref("PnL")),
+        deploy_step("StopLossLogic", StopLossLogic),
+        deploy_step("GLens", GLens),
+    ]
+    for name, pool in STRATEGY_POOLS.items():
+        steps += strategy_steps(
+            name,
+            handles.admin,
+            convex_pools[pool]["pid"],
+            convex_pools[pool]["LP_TOKEN"],
+            "GVault",
+            "StopLossLogic",
+            2000,
+        )
+    return steps
+
+
+def deploy(resume="true"):
+    # finished steps are recorded as they are mined, so a failed or partial
+    # deployment picks up where it stopped when rerun
+    manifest = Manifest(MANIFEST) if strtobool(resume) else None
+    print("deploying...")
+    engine = DeploymentEngine(
+        handles.admin, deployment_steps(), PUBLISH_SOURCE, manifest
+    )
+    addresses = engine.run()
     print("done")
 
     deployments = {
-        "GRouter": gro_router.address,
-        "RouterOracle": router_oracle.address,
-        "GTranche": gtranche.address,
-        "CurveOracle": curve_oracle.address,
-        "GVault": gro_vault.address,
-        "PnL": pnl.address,
-        "GMigration": gmigration.address,
-        "StopLossLogic": snl.address,
-        "convexFrax": strategy_frax.address,
-        "convexMim": strategy_mim.address,
-        "convexGusd": strategy_gusd.address,
-        "convexOusd": strategy_ousd.address,
-        "convexTusd": strategy_tusd.address,
-        "pwrd": pwrd.address,
-        "gvt": gvt.address,
+        name: addresses[name]
+        for name in [
+            "GRouter",
+            "RouterOracle",
+            "GTranche",
+            "CurveOracle",
+            "GVault",
+            "PnL",
+            "GMigration",
+            "StopLossLogic",
+            "GLens",
+            "convexFrax",
+            "convexMim",
+            "convexGusd",
+            "convexOusd",
+            "convexTusd",
+        ]
     }
+    deployments["pwrd"] = handles.pwrd.address
+    deployments["gvt"] = handles.gvt.address
 
     with open("mainnet_fork_deployments.json", "w") as write_file:
         json.dump(deployments, write_file, indent=4)
@@ -449,4 +600,4 @@ def deploy_strategy(debt_ratio, pid):
     contract_data = load_deployed_contracts()
     gVault = GVault.at(contract_data["GVault"])
     snl = StopLossLogic.at(contract_data["StopLossLogic"])
-    setup_strategy(admin, gVault, snl, pid, pool_info[0], debt_ratio)
+    setup_strategy(handles.admin, gVault, snl, pid, pool_info[0], debt_ratio)
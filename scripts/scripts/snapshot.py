@@ -0,0 +1,88 @@
+from typing import Dict, List, NamedTuple, Optional
+
+from brownie import Contract, ConvexStrategy, web3
+
+from .read_cache import ReadCache, cached_read
+
+
+class StrategySnapshot(NamedTuple):
+    """State of a single strategy, read in one multicall at a pinned block"""
+
+    name: str
+    address: str
+    block: int
+    can_harvest: bool
+    estimated_total_assets: int
+    active: bool
+    debt_ratio: int
+    last_report: int
+    total_debt: int
+    total_gain: int
+    total_loss: int
+    excess_debt: int
+    credit_available: int
+
+    @property
+    def pnl(self) -> int:
+        return self.estimated_total_assets - self.total_debt
+
+
+def strategy_handles(strategies: Dict[str, str]) -> Dict[str, Contract]:
+    """Build strategy contract objects without a bytecode lookup per address
+
+    Args:
+        strategies: mapping of strategy name to strategy address
+    """
+    return {
+        name: Contract.from_abi(name, address, ConvexStrategy.abi, persist=False)
+        for name, address in strategies.items()
+    }
+
+
+def read_snapshots(
+    vault, strategies, block=None, cache: Optional[ReadCache] = None
+) -> List[StrategySnapshot]:
+    """Read the harvest state of all strategies in a single aggregated call
+
+    Args:
+        vault: GVault the strategies report to
+        strategies: mapping of strategy name to strategy address
+        block: block to read state at, defaults to the latest block
+        cache: ReadCache shared with other readers of the same blocks
+    """
+    block = int(block) if block else web3.eth.block_number
+    handles = strategy_handles(strategies)
+    calls = {}
+    for name, strat in handles.items():
+        calls[name, 0] = (strat.canHarvest, ())
+        calls[name, 1] = (strat.estimatedTotalAssets, ())
+        calls[name, 2] = (vault.strategies, (strat.address,))
+        calls[name, 3] = (vault.excessDebt, (strat.address,))
+        calls[name, 4] = (vault.creditAvailable, (strat.address,))
+    results = cached_read(cache, calls, block)
+    pending = {name: tuple(results[name, i] for i in range(5)) for name in handles}
+
+    # failed calls resolve to None, treat these as empty values
+    snapshots = []
+    for name, (can_harvest, assets, params, excess, credit) in pending.items():
+        active, debt_ratio, last_report, debt, gain, loss = (
+            params or (False,) + (0,) * 5
+        )
+        snapshots.append(
+            StrategySnapshot(
+                name=name,
+                address=handles[name].address,
+                block=block,
+                can_harvest=bool(can_harvest),
+                estimated_total_assets=int(assets or 0),
+                active=bool(active),
+                debt_ratio=int(debt_ratio),
+                last_report=int(last_report),
+                total_debt=int(debt),
+                total_gain=int(gain),
+                total_loss=int(loss),
+                excess_debt=int(excess[0]) if excess else 0,
+                credit_available=int(credit or 0),
+            )
+        )
+    return snapshots
@@ -0,0 +1,276 @@
+import json
+import sqlite3
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from brownie import Contract, ConvexStrategy, StopLossLogic, interface, multicall, web3
+
+from .addresses import convex_pools
+
+ZERO = "0x0000000000000000000000000000000000000000"
+
+# StopLossLogic constants
+CRV_IDX = 1
+META_IDX = 0
+DEFAULT_DECIMALS_FACTOR = 10**18
+PERCENTAGE_DECIMAL_FACTOR = 10**4
+
+# equilibrium used for pools that aren't tracked by StopLossLogic
+DEFAULT_EQUILIBRIUM = 10**18
+
+
+class HealthSample(NamedTuple):
+    """StopLossLogic health metric of a metapool at a block"""
+
+    block: int
+    timestamp: int
+    name: str
+    pool: str
+    dy: Optional[int]
+    equilibrium: int
+    dy_diff: Optional[int]
+    trail: Optional[int]
+    # 0 when the pool isn't tracked, stopLossCheck never trips in that case
+    health_threshold: int
+    tripped: bool
+
+
+class HealthAlert(NamedTuple):
+    sample: HealthSample
+    reason: str
+
+
+def threshold_check(dy, equilibrium, health_threshold):
+    """Mirror of StopLossLogic._thresholdCheck, returns (dy_diff, trail, tripped)"""
+    dy_diff = dy * PERCENTAGE_DECIMAL_FACTOR // equilibrium
+    trail = abs(dy_diff - PERCENTAGE_DECIMAL_FACTOR)
+    tripped = health_threshold != 0 and trail > health_threshold
+    return dy_diff, trail, tripped
+
+
+class HealthStore:
+    """Local time series store of health samples backed by sqlite"""
+
+    def __init__(self, path="stop_loss_health.db"):
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS health (
+                block INTEGER,
+                timestamp INTEGER,
+                name TEXT,
+                pool TEXT,
+                dy TEXT,
+                equilibrium TEXT,
+                dy_diff INTEGER,
+                trail INTEGER,
+                health_threshold INTEGER,
+                tripped INTEGER,
+                PRIMARY KEY (name, block)
+            )"""
+        )
+
+    def write(self, samples: List[HealthSample]):
+        # uint256 values don't fit in sqlite integers, store them as text
+        self.db.executemany(
+            "INSERT OR REPLACE INTO health VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    s.block,
+                    s.timestamp,
+                    s.name,
+                    s.pool,
+                    None if s.dy is None else str(s.dy),
+                    str(s.equilibrium),
+                    s.dy_diff,
+                    s.trail,
+                    s.health_threshold,
+                    int(s.tripped),
+                )
+                for s in samples
+            ],
+        )
+        self.db.commit()
+
+    def series(self, name, from_block=0) -> List[tuple]:
+        """(block, trail) pairs for a pool or strategy"""
+        return self.db.execute(
+            "SELECT block, trail FROM health WHERE name = ? AND block >= ? "
+            "ORDER BY block",
+            (name, from_block),
+        ).fetchall()
+
+
+class StopLossMonitor:
+    """Reads get_dy for every tracked metapool once per block
+
+    Watches the metapools listed in convex_pools and the metapools of the
+    deployed strategies. All get_dy calls and strategy stop loss settings are
+    read in one aggregated call per block.
+
+    Args:
+        strategies: mapping of strategy name to deployed ConvexStrategy address
+        pools: mapping of pool name to metapool address
+        alert_rate: trail change, in bps per block, that raises an alert
+        headroom: share of the health threshold at which to start alerting
+    """
+
+    def __init__(self, strategies, pools, store=None, alert_rate=5, headroom=0.75):
+        self.pools = pools
+        self.strategies = {
+            name: Contract.from_abi(name, address, ConvexStrategy.abi, persist=False)
+            for name, address in strategies.items()
+        }
+        # strategy name => (meta pool, stop loss logic) handles
+        self.strategy_pools = {}
+        for name, strategy in self.strategies.items():
+            self._set_strategy_pool(name, strategy.getMetaPool())
+        self.store = store
+        self.alert_rate = alert_rate
+        self.headroom = headroom
+        self.last = {}
+
+    def _set_strategy_pool(self, name, pool):
+        stop_loss = self.strategies[name].stopLossLogic()
+        if stop_loss != ZERO:
+            stop_loss = Contract.from_abi(
+                "StopLossLogic", stop_loss, StopLossLogic.abi, persist=False
+            )
+        else:
+            stop_loss = None
+        self.strategy_pools[name] = (interface.ICurveMeta(pool), stop_loss)
+
+    def read(self, block=None) -> List[HealthSample]:
+        block = int(block) if block else web3.eth.block_number
+        timestamp = web3.eth.get_block(block).timestamp
+        pool_handles = {
+            name: interface.ICurveMeta(pool) for name, pool in self.pools.items()
+        }
+        with multicall(block_identifier=block):
+            pool_dy = {
+                name: pool.get_dy(META_IDX, CRV_IDX, DEFAULT_DECIMALS_FACTOR)
+                for name, pool in pool_handles.items()
+            }
+            strategy_reads = {
+                name: (
+                    pool.get_dy(META_IDX, CRV_IDX, DEFAULT_DECIMALS_FACTOR),
+                    stop_loss.strategyData(self.strategies[name].address)
+                    if stop_loss
+                    else None,
+                    self.strategies[name].getMetaPool(),
+                )
+                for name, (pool, stop_loss) in self.strategy_pools.items()
+            }
+
+        samples = [
+            self._sample(block, timestamp, name, pool_handles[name].address, dy)
+            for name, dy in pool_dy.items()
+        ]
+        for name, (dy, strategy_data, meta_pool) in strategy_reads.items():
+            pool = self.strategy_pools[name][0].address
+            equilibrium, health_threshold = strategy_data or (DEFAULT_EQUILIBRIUM, 0)
+            samples.append(
+                self._sample(
+                    block, timestamp, name, pool, dy, equilibrium, health_threshold
+                )
+            )
+            # the strategy moved to a new pool, follow it from the next block
+            if meta_pool and meta_pool != pool:
+                self._set_strategy_pool(name, meta_pool)
+        return samples
+
+    def _sample(
+        self,
+        block,
+        timestamp,
+        name,
+        pool,
+        dy,
+        equilibrium=DEFAULT_EQUILIBRIUM,
+        health_threshold=0,
+    ):
+        # failed reads (missing pool, old style pools) resolve to None
+        dy_diff = trail = None
+        tripped = False
+        if dy is not None and equilibrium:
+            dy_diff, trail, tripped = threshold_check(
+                int(dy), int(equilibrium), int(health_threshold)
+            )
+        return HealthSample(
+            block,
+            timestamp,
+            name,
+            pool,
+            None if dy is None else int(dy),
+            int(equilibrium),
+            dy_diff,
+            trail,
+            int(health_threshold),
+            tripped,
+        )
+
+    def alerts(self, samples: List[HealthSample]) -> List[HealthAlert]:
+        """Compare samples against the previous block and raise alerts"""
+        alerts = []
+        for sample in samples:
+            if sample.trail is None:
+                continue
+            previous = self.last.get(sample.name)
+            self.last[sample.name] = sample
+            if sample.tripped:
+                alerts.append(HealthAlert(sample, "health threshold broken"))
+                continue
+            if (
+                sample.health_threshold
+                and sample.trail >= sample.health_threshold * self.headroom
+            ):
+                alerts.append(HealthAlert(sample, "approaching health threshold"))
+            if previous is not None and sample.block > previous.block:
+                rate = (sample.trail - previous.trail) / (sample.block - previous.block)
+                if rate >= self.alert_rate:
+                    alerts.append(
+                        HealthAlert(sample, f"trail moving {rate:.1f} bps per block")
+                    )
+        return alerts
+
+    def tick(self, block=None) -> List[HealthAlert]:
+        samples = self.read(block)
+        if self.store is not None:
+            self.store.write(samples)
+        return self.alerts(samples)
+
+    def run(self, max_blocks=None, poll_interval=1.0):
+        """Stream health samples for every new block"""
+        block_filter = web3.eth.filter("latest")
+        processed = 0
+        block = web3.eth.block_number
+        while True:
+            for alert in self.tick(block):
+                sample = alert.sample
+                print(
+                    f"block {sample.block} {sample.name}: {alert.reason}, \
+                    trail: {sample.trail}, threshold: {sample.health_threshold}"
+                )
+            processed += 1
+            if max_blocks and processed >= max_blocks:
+                return
+            while not block_filter.get_new_entries():
+                time.sleep(poll_interval)
+            block = web3.eth.block_number
+
+
+def metapools() -> Dict[str, str]:
+    """Metapools of the convex pools, old style pools with a separate LP token
+    don't expose get_dy on the token and show up as missing reads
+    """
+    return {name: pool["LP_TOKEN"] for name, pool in convex_pools.items()}
+
+
+def main(db="stop_loss_health.db", poll_interval="1", alert_rate="5"):
+    with open("mainnet_fork_deployments.json") as json_file:
+        contract_data = json.load(json_file)
+    strategies = {k: v for k, v in contract_data.items() if "convex" in k}
+    monitor = StopLossMonitor(
+        strategies, metapools(), HealthStore(db), alert_rate=float(alert_rate)
+    )
+    print(f"monitoring {', '.join(list(monitor.pools) + list(strategies))}")
+    monitor.run(poll_interval=float(poll_interval))
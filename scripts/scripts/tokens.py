@@ -1,19 +1,20 @@
 import eth_abi
-from brownie import Contract, web3
+from brownie import web3
 
+from .abi_store import contract
 from .addresses import *
 
 
 def usdc():
-    return Contract(USDC_ADDRESS)
+    return contract(USDC_ADDRESS)
 
 
 def usdt():
-    return Contract(USDT_ADDRESS)
+    return contract(USDT_ADDRESS)
 
 
 def dai():
-    return Contract(DAI_ADDRESS)
+    return contract(DAI_ADDRESS)
 
 
 def mint_dai(account, amount):
@@ -47,15 +48,15 @@ def mint_usdt(account, amount):
 
 
 def E_CRV():
-    return Contract(E_CRV_ADDRESS)
+    return contract(E_CRV_ADDRESS)
 
 
 def FRAX_CRV():
-    return Contract(FRAX_CRV_ADDRESS)
+    return contract(FRAX_CRV_ADDRESS)
 
 
 def MIM_CRV():
-    return Contract(MIM_CRV_ADDRESS)
+    return contract(MIM_CRV_ADDRESS)
 
 
 def mint_3crv(address, amount):
@@ -0,0 +1,451 @@
+import time
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+
+from . import pnl_model
+from .pnl_model import (
+    DEFAULT_DECIMALS,
+    DEFAULT_RATE,
+    DEFAULT_UTILISATION_THRESHOLD,
+    sdiv,
+)
+
+# GTranche / TokenCalculations constants
+JUNIOR = 0
+SENIOR = 1
+BASE = 10**18
+DEFAULT_FACTOR = 10**18
+INIT_BASE_JUNIOR = 5 * 10**15
+INIT_BASE_SENIOR = 10 * 10**18
+MIN_DEPOSIT = 10**18
+MAX_UINT256 = 2**256 - 1
+# PnL utilisation breakpoint for the junior share of senior profits
+PNL_CURVE_BREAKPOINT = 8000
+
+
+def _zeros(paths):
+    return np.zeros(paths, dtype=object)
+
+
+def _full(paths, value):
+    return np.full(paths, value, dtype=object)
+
+
+def apply_factor(amount, factor, base):
+    """Mirror of TokenCalculations.applyFactor, rounds up from half of BASE"""
+    if base:
+        numerator, denominator = amount * factor, BASE
+    else:
+        numerator, denominator = amount * BASE, factor
+    safe = np.where(denominator == 0, 1, denominator)
+    resultant = numerator // safe
+    return resultant + (numerator % safe >= 5 * 10**17)
+
+
+def token_factor(supply_base, assets, tranche):
+    """Mirror of TokenCalculations.factor"""
+    initial = INIT_BASE_SENIOR if tranche == SENIOR else INIT_BASE_JUNIOR
+    factor = np.where(
+        assets > 0, supply_base * BASE // np.where(assets > 0, assets, 1), 0
+    )
+    return np.where(supply_base == 0, initial, factor)
+
+
+def utilisation(junior, senior):
+    """Tranche utilisation in bps as GTranche.updateDistribution computes it"""
+    ratio = np.where(
+        junior > 0,
+        senior * DEFAULT_DECIMALS // np.where(junior > 0, junior, 1),
+        MAX_UINT256,
+    )
+    return np.where(senior == 0, 0, ratio)
+
+
+class PnLModel:
+    """Vectorised mirror of the PnL contract
+
+    State is kept per path as a dict of arrays so the simulator can commit it
+    only for paths whose transaction doesn't revert.
+    """
+
+    def initial_state(self, paths) -> Dict:
+        return {"junior_loss": _zeros(paths)}
+
+    def distribute_loss(self, state, amount, junior, senior, timestamp, threshold):
+        wiped = amount > junior
+        return np.where(wiped, junior, amount), np.where(wiped, amount - junior, 0)
+
+    def distribute_profit(self, state, amount, junior, senior, timestamp, threshold):
+        junior_loss = state["junior_loss"]
+        util = sdiv(senior * DEFAULT_DECIMALS, junior + 1)
+        shared = (amount > junior_loss) & (util < DEFAULT_DECIMALS)
+        remaining = amount - junior_loss
+        senior_profit = sdiv(remaining * util, DEFAULT_DECIMALS + util)
+        junior_profit = junior_loss + remaining - senior_profit
+        util = np.where(
+            util < PNL_CURVE_BREAKPOINT,
+            sdiv(util * 3, 8) + 3000,
+            (util - PNL_CURVE_BREAKPOINT) * 2 + 6000,
+        )
+        from_senior = sdiv(senior_profit * util, 10000)
+        return (
+            np.where(shared, junior_profit + from_senior, amount),
+            np.where(shared, senior_profit - from_senior, 0),
+        )
+
+    def distribute_assets(
+        self, state, loss, amount, junior, senior, timestamp, threshold
+    ):
+        """Mirror of PnL.distributeAssets, returns the amounts and the new state"""
+        args = (state, amount, junior, senior, timestamp, threshold)
+        loss_amounts = self.distribute_loss(*args)
+        profit_amounts = self.distribute_profit(*args)
+        amounts = tuple(
+            np.where(loss, l, p) for l, p in zip(loss_amounts, profit_amounts)
+        )
+        junior_loss = state["junior_loss"]
+        cleared = (profit_amounts[1] > 0) | (profit_amounts[0] >= junior_loss)
+        junior_loss = np.where(
+            loss,
+            junior_loss + loss_amounts[0],
+            np.where(cleared, 0, junior_loss - profit_amounts[0]),
+        )
+        return amounts, {"junior_loss": junior_loss}
+
+
+class FixedRatePnLModel(PnLModel):
+    """Vectorised mirror of the PnLFixedRate contract, built on pnl_model"""
+
+    def __init__(self, rate=DEFAULT_RATE, start=0):
+        self.rate = rate
+        self.start = start
+
+    def initial_state(self, paths) -> Dict:
+        return {
+            "rate": _full(paths, self.rate),
+            "pending_rate": _zeros(paths),
+            "last_distribution": _full(paths, self.start),
+        }
+
+    def distribute_loss(self, state, amount, junior, senior, timestamp, threshold):
+        time_diff = timestamp - state["last_distribution"]
+        return pnl_model.distribute_loss(
+            amount, junior, senior, state["rate"], time_diff
+        )
+
+    def distribute_profit(self, state, amount, junior, senior, timestamp, threshold):
+        time_diff = timestamp - state["last_distribution"]
+        return pnl_model.distribute_profit(
+            amount, junior, senior, state["rate"], time_diff, threshold
+        )
+
+    def distribute_assets(
+        self, state, loss, amount, junior, senior, timestamp, threshold
+    ):
+        args = (state, amount, junior, senior, timestamp, threshold)
+        loss_amounts = self.distribute_loss(*args)
+        profit_amounts = self.distribute_profit(*args)
+        amounts = tuple(
+            np.where(loss, l, p) for l, p in zip(loss_amounts, profit_amounts)
+        )
+        pending = state["pending_rate"]
+        return amounts, {
+            "rate": np.where(pending > 0, pending, state["rate"]),
+            "pending_rate": _zeros(len(pending)),
+            "last_distribution": _full(len(pending), timestamp),
+        }
+
+    def set_rate(self, state, rate):
+        """Mirror of PnLFixedRate.setRate, applied on the next distribution"""
+        state["pending_rate"] = _full(len(state["pending_rate"]), rate)
+
+
+class TrancheSimulator:
+    """Batch simulation of GTranche balances over many independent paths
+
+    The underlying yield tokens are tracked by their unified value (the
+    common denominator GTranche prices the tranches in), deposits and
+    withdrawals are expressed in that denominator as well. A transaction
+    that would revert on chain leaves its path untouched.
+
+    Args:
+        pnl: PnLModel or FixedRatePnLModel
+        paths: number of paths simulated side by side
+        utilisation_threshold: GTranche.utilisationThreshold
+        start: timestamp the simulation starts at
+    """
+
+    def __init__(
+        self,
+        pnl: PnLModel,
+        paths: int,
+        utilisation_threshold=DEFAULT_UTILISATION_THRESHOLD,
+        start=0,
+    ):
+        self.pnl = pnl
+        self.paths = paths
+        self.utilisation_threshold = utilisation_threshold
+        self.timestamp = start
+        self.assets = _zeros(paths)
+        self.balances = [_zeros(paths), _zeros(paths)]
+        self.supply = [_zeros(paths), _zeros(paths)]
+        self.pnl_state = pnl.initial_state(paths)
+
+    def _distribution(self):
+        """Mirror of pnlDistribution, (balances, profit, loss, new pnl state)"""
+        junior, senior = self.balances
+        last_total = junior + senior
+        loss = last_total > self.assets
+        amount = np.where(loss, last_total - self.assets, self.assets - last_total)
+        amounts, state = self.pnl.distribute_assets(
+            self.pnl_state,
+            loss,
+            amount,
+            junior,
+            senior,
+            self.timestamp,
+            self.utilisation_threshold,
+        )
+        sign = np.where(loss, -1, 1)
+        balances = [junior + sign * amounts[0], senior + sign * amounts[1]]
+        profit = np.where(loss, 0, amount)
+        return balances, profit, np.where(loss, amount, 0), state
+
+    def pnl_distribution(self):
+        """Balances with unrealised profit and loss distributed, as a view"""
+        balances, profit, loss, _ = self._distribution()
+        return balances, profit, loss
+
+    def _commit(self, accepted, balances, supply, assets, state):
+        for tranche in (JUNIOR, SENIOR):
+            self.balances[tranche] = np.where(
+                accepted, balances[tranche], self.balances[tranche]
+            )
+            self.supply[tranche] = np.where(
+                accepted, supply[tranche], self.supply[tranche]
+            )
+        self.assets = np.where(accepted, assets, self.assets)
+        for key, value in state.items():
+            self.pnl_state[key] = np.where(accepted, value, self.pnl_state[key])
+
+    def accrue(self, value_change):
+        """Change in value of the underlying yield tokens, e.g. harvests"""
+        self.assets = self.assets + np.asarray(value_change, dtype=object)
+
+    def deposit(self, tranche, value, mask=None):
+        """Mirror of GTranche.deposit for a deposit worth value
+
+        Returns the mask of paths that accepted the deposit.
+        """
+        value = np.broadcast_to(np.asarray(value, dtype=object), (self.paths,))
+        mask = value > 0 if mask is None else mask & (value > 0)
+        balances, _, _, state = self._distribution()
+        factor = token_factor(self.supply[tranche], balances[tranche], tranche)
+        balances[tranche] = balances[tranche] + value
+        util = utilisation(*balances)
+        accepted = mask & (value >= MIN_DEPOSIT)
+        if tranche == SENIOR:
+            accepted &= util <= self.utilisation_threshold
+        supply = list(self.supply)
+        supply[tranche] = supply[tranche] + apply_factor(value, factor, True)
+        self._commit(accepted, balances, supply, self.assets + value, state)
+        return accepted
+
+    def withdraw(self, tranche, amount, mask=None, by_value=False):
+        """Mirror of GTranche.withdraw for an amount of tranche tokens
+
+        Senior tokens are worth one unit each, junior amounts are tranche
+        token base units. With by_value, junior amounts are values that are
+        converted to tranche tokens at the price before the withdrawal.
+        Returns the accepted paths and the value withdrawn.
+        """
+        amount = np.broadcast_to(np.asarray(amount, dtype=object), (self.paths,))
+        mask = amount > 0 if mask is None else mask & (amount > 0)
+        balances, _, _, state = self._distribution()
+        factor = token_factor(self.supply[tranche], balances[tranche], tranche)
+        if tranche == SENIOR:
+            value = amount
+        else:
+            if by_value:
+                amount = amount * factor // DEFAULT_FACTOR
+            value = np.minimum(
+                amount * DEFAULT_FACTOR // np.where(factor > 0, factor, 1),
+                balances[JUNIOR],
+            )
+        burnt = apply_factor(value, factor, True)
+        accepted = mask & (factor > 0) & (value <= balances[tranche])
+        accepted &= burnt <= self.supply[tranche]
+        balances[tranche] = balances[tranche] - value
+        if tranche == JUNIOR:
+            accepted &= utilisation(*balances) <= self.utilisation_threshold
+        supply = list(self.supply)
+        supply[tranche] = supply[tranche] - burnt
+        self._commit(accepted, balances, supply, self.assets - value, state)
+        return accepted, np.where(accepted, value, 0)
+
+    def _price_per_share(self, tranche, balances):
+        if tranche == SENIOR:
+            return _full(self.paths, BASE)
+        factor = token_factor(self.supply[tranche], balances[tranche], tranche)
+        return np.where(factor > 0, apply_factor(BASE, factor, False), 0)
+
+    def price_per_share(self, tranche):
+        """Mirror of GTranche.getPricePerShare"""
+        return self._price_per_share(tranche, self.pnl_distribution()[0])
+
+    def utilisation(self):
+        """Mirror of GTranche.utilisation"""
+        junior, senior = self.pnl_distribution()[0]
+        return utilisation(junior, senior)
+
+
+class Step(NamedTuple):
+    """Inputs of a simulation step, values are arrays over paths or scalars
+
+    Flows are in the common denominator, positive for deposits and negative
+    for withdrawals.
+    """
+
+    timestamp: int
+    value_change: object = 0
+    junior_flow: object = 0
+    senior_flow: object = 0
+
+
+SERIES = [
+    "junior",
+    "senior",
+    "utilisation",
+    "junior_price",
+    "profit",
+    "loss",
+    "rejected",
+]
+
+
+def simulate(sim: TrancheSimulator, steps: List[Step]) -> Dict[str, np.ndarray]:
+    """Run steps through the simulator, returns series of shape (steps, paths)
+
+    Within a step the yield is accrued first, then the junior flow and the
+    senior flow are sent as separate transactions. Senior deposits are sent
+    last so that they see the junior deposits of the same step.
+    """
+    series = {key: [] for key in SERIES}
+    for step in steps:
+        sim.timestamp = step.timestamp
+        sim.accrue(step.value_change)
+        rejected = np.zeros(sim.paths, dtype=int)
+        for tranche, flow in ((JUNIOR, step.junior_flow), (SENIOR, step.senior_flow)):
+            flow = np.broadcast_to(np.asarray(flow, dtype=object), (sim.paths,))
+            deposits = flow > 0
+            withdrawals = flow < 0
+            if deposits.any():
+                rejected += deposits & ~sim.deposit(
+                    tranche, np.where(deposits, flow, 0)
+                )
+            if withdrawals.any():
+                accepted, _ = sim.withdraw(
+                    tranche, np.where(withdrawals, -flow, 0), by_value=True
+                )
+                rejected += withdrawals & ~accepted
+        balances, profit, loss = sim.pnl_distribution()
+        junior, senior = balances
+        series["junior"].append(junior)
+        series["senior"].append(senior)
+        series["utilisation"].append(utilisation(junior, senior))
+        series["junior_price"].append(sim._price_per_share(JUNIOR, balances))
+        series["profit"].append(profit)
+        series["loss"].append(loss)
+        series["rejected"].append(rejected)
+    return {key: np.array(values) for key, values in series.items()}
+
+
+def event_steps(events) -> List[Step]:
+    """Steps of a single path from a stream of tranche events
+
+    Args:
+        events: (timestamp, kind, tranche, value) tuples ordered by time,
+            kind is one of yield, deposit or withdraw and tranche is JUNIOR or
+            SENIOR (ignored for yield events)
+    """
+    steps = {}
+    for timestamp, kind, tranche, value in events:
+        step = steps.get(timestamp, Step(timestamp))
+        if kind == "yield":
+            step = step._replace(value_change=step.value_change + value)
+        else:
+            flow = value if kind == "deposit" else -value
+            field = "senior_flow" if tranche == SENIOR else "junior_flow"
+            step = step._replace(**{field: getattr(step, field) + flow})
+        steps[timestamp] = step
+    return [steps[timestamp] for timestamp in sorted(steps)]
+
+
+def synthetic_steps(
+    paths,
+    days,
+    seed=0,
+    apy=0.05,
+    volatility=0.02,
+    flow=100_000 * 10**18,
+    start=0,
+) -> List[Step]:
+    """Daily steps with random yields and deposit/withdrawal flows
+
+    Yields are drawn in bps of a nominal tranche size of 100 flows, flows
+    are uniform up to flow in either direction.
+    """
+    rng = np.random.default_rng(seed)
+    nominal = 100 * flow
+    steps = []
+    for day in range(days):
+        daily = rng.normal(apy / 365, volatility / np.sqrt(365), paths)
+        value_change = (
+            np.round(daily * 10**6).astype(np.int64).astype(object) * nominal
+        ) // 10**6
+        junior = rng.uniform(-0.5, 1, paths)
+        senior = rng.uniform(-0.5, 1, paths)
+        steps.append(
+            Step(
+                start + (day + 1) * 86400,
+                value_change,
+                (np.round(junior * 10**6).astype(np.int64).astype(object) * flow)
+                // 10**6,
+                (np.round(senior * 10**6).astype(np.int64).astype(object) * flow)
+                // 10**6,
+            )
+        )
+    return steps
+
+
+def seed_simulator(sim: TrancheSimulator, junior, senior):
+    """Open every path with a junior and a senior deposit"""
+    sim.deposit(JUNIOR, junior)
+    sim.deposit(SENIOR, senior)
+    return sim
+
+
+def main(paths="1000", days="365", fixed_rate="true", threshold="10000"):
+    """Simulate synthetic yield and flow paths and print summary statistics"""
+    paths, days = int(paths), int(days)
+    pnl = FixedRatePnLModel() if fixed_rate.lower() in ("true", "1") else PnLModel()
+    sim = seed_simulator(
+        TrancheSimulator(pnl, paths, int(threshold)),
+        10_000_000 * 10**18,
+        5_000_000 * 10**18,
+    )
+    steps = synthetic_steps(paths, days)
+    start = time.perf_counter()
+    series = simulate(sim, steps)
+    elapsed = time.perf_counter() - start
+    print(f"{paths} paths over {days} days in {elapsed:.2f}s")
+    for key in ["junior", "senior", "junior_price"]:
+        final = series[key][-1].astype(float) / 1e18
+        print(
+            f"{key}: mean {final.mean():,.4f}, "
+            f"p5 {np.percentile(final, 5):,.4f}, p95 {np.percentile(final, 95):,.4f}"
+        )
+    final_util = series["utilisation"][-1].astype(float)
+    print(f"utilisation: mean {final_util.mean():.0f} bps")
+    print(f"rejected transactions: {int(series['rejected'].sum())}")
@@ -26,4 +26,18 @@ contract RouterTest is Test, BaseSetup {
         amounts[0] = 100E18;
         assertEq(curveOracle.getTotalValue(amounts), (100E18 * vp) / 1E18);
     }
+
+    function testGetPriceContext() public {
+        uint256[] memory prices = curveOracle.getPriceContext();
+        assertEq(prices.length, 1);
+        assertEq(prices[0], curveOracle.getVirtualPrice());
+        assertEq(
+            (amount * prices[0]) / 1E18,
+            curveOracle.getSinglePrice(0, amount, true)
+        );
+        assertEq(
+            (amount * 1E18) / prices[0],
+            curveOracle.getTokenAmount(0, amount, false)
+        );
+    }
 }
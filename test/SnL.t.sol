@@ -394,6 +394,111 @@ contract SnLTest is BaseSetup {
         vm.stopPrank();
     }
 
+    function testGuardBulkHarvestAllStrategies() public {
+        uint256 shares = genThreeCrv(1E26, alice);
+        vm.startPrank(alice);
+        THREE_POOL_TOKEN.transfer(address(fraxStrategy), HARVEST_MIN);
+        THREE_POOL_TOKEN.transfer(address(mimStrategy), HARVEST_MIN);
+        THREE_POOL_TOKEN.transfer(address(musdStrategy), HARVEST_MIN);
+        vm.stopPrank();
+
+        vm.warp(block.timestamp + MIN_REPORT_DELAY);
+        assertTrue(guard.canHarvest());
+
+        vm.prank(BASED_ADDRESS);
+        assertEq(guard.bulkHarvest(), 3);
+
+        assertFalse(fraxStrategy.canHarvest());
+        assertFalse(mimStrategy.canHarvest());
+        assertFalse(musdStrategy.canHarvest());
+        assertFalse(guard.canHarvest());
+    }
+
+    function testGuardBulkHarvestIndexes() public {
+        uint256 shares = genThreeCrv(1E26, alice);
+        vm.startPrank(alice);
+        THREE_POOL_TOKEN.transfer(address(fraxStrategy), HARVEST_MIN);
+        THREE_POOL_TOKEN.transfer(address(mimStrategy), HARVEST_MIN);
+        THREE_POOL_TOKEN.transfer(address(musdStrategy), HARVEST_MIN);
+        vm.stopPrank();
+
+        vm.warp(block.timestamp + MIN_REPORT_DELAY);
+
+        uint256[] memory indexes = new uint256[](2);
+        // musd strategy and an index past the end of the queue
+        indexes[0] = 1;
+        indexes[1] = 10;
+        vm.prank(BASED_ADDRESS);
+        assertEq(guard.bulkHarvestIndexes(indexes), 1);
+
+        assertFalse(musdStrategy.canHarvest());
+        assertTrue(fraxStrategy.canHarvest());
+        assertTrue(mimStrategy.canHarvest());
+        assertTrue(guard.canHarvest());
+    }
+
+    function testGuardBulkHarvestIsolatesFailures() public {
+        uint256 shares = genThreeCrv(1E26, alice);
+        vm.startPrank(alice);
+        THREE_POOL_TOKEN.transfer(address(fraxStrategy), HARVEST_MIN);
+        THREE_POOL_TOKEN.transfer(address(mimStrategy), HARVEST_MIN);
+        THREE_POOL_TOKEN.transfer(address(musdStrategy), HARVEST_MIN);
+        vm.stopPrank();
+
+        vm.warp(block.timestamp + MIN_REPORT_DELAY);
+        // harvesting the mim strategy through the guard now reverts
+        vm.prank(BASED_ADDRESS);
+        mimStrategy.revokeKeeper(address(guard));
+
+        vm.prank(BASED_ADDRESS);
+        assertEq(guard.bulkHarvest(), 2);
+
+        assertFalse(fraxStrategy.canHarvest());
+        assertFalse(musdStrategy.canHarvest());
+        assertTrue(mimStrategy.canHarvest());
+    }
+
+    function testGuardBulkHarvestLocksStrategyWithLoss() public {
+        uint256 amountToSwap = 10000000000e18;
+        genStable(amountToSwap, frax, alice);
+
+        // Swap frax to 3crv to incur loss on strategy
+        vm.startPrank(alice);
+        IERC20(frax).approve(frax_lp, type(uint256).max);
+        ICurveMeta(frax_lp).exchange(0, 1, amountToSwap, 0);
+        vm.stopPrank();
+
+        vm.prank(BASED_ADDRESS);
+        assertEq(guard.bulkHarvest(), 0);
+        (, bool canHarvestWithLoss, uint256 lossStartBlock, , ) = guard
+            .strategyCheck(address(fraxStrategy));
+        assertFalse(canHarvestWithLoss);
+        assertEq(lossStartBlock, block.number);
+        assertFalse(guard.canHarvest());
+
+        // Locked strategies are skipped until their loss is unlocked
+        vm.roll(block.number + guard.LOSS_BLOCK_THRESHOLD() + 1);
+        vm.prank(BASED_ADDRESS);
+        assertEq(guard.bulkHarvest(), 0);
+
+        vm.startPrank(BASED_ADDRESS);
+        guard.unlockLoss(address(fraxStrategy));
+        assertEq(guard.bulkHarvest(), 1);
+        vm.stopPrank();
+        (, canHarvestWithLoss, lossStartBlock, , ) = guard.strategyCheck(
+            address(fraxStrategy)
+        );
+        assertFalse(canHarvestWithLoss);
+        assertEq(lossStartBlock, 0);
+    }
+
+    function testGuardBulkHarvestNotKeeper() public {
+        vm.expectRevert(abi.encodeWithSelector(GuardErrors.NotKeeper.selector));
+        guard.bulkHarvest();
+        vm.expectRevert(abi.encodeWithSelector(GuardErrors.NotKeeper.selector));
+        guard.bulkHarvestIndexes(new uint256[](0));
+    }
+
     // Stop loss
     function test_guard_should_return_false_multiple_strategies_no_threshold_broken_stop_loss()
         public
@@ -451,6 +556,118 @@ contract SnLTest is BaseSetup {
         vm.stopPrank();
     }
 
+    function testGuardStopLossPrimerIndexes() public {
+        manipulatePool(false, 500, frax_lp, frax);
+        manipulatePool(false, 5000, mim_lp, mim);
+
+        uint256[] memory indexes = guard.stopLossPrimerUpdates();
+        assertEq(indexes.length, 2);
+        assertEq(indexes[0], 0);
+        assertEq(indexes[1], 2);
+        assertEq(guard.stopLossPrimerEnds().length, 0);
+        assertEq(guard.stopLossExecutions().length, 0);
+
+        // Both primers are set in a single call
+        vm.prank(BASED_ADDRESS);
+        guard.setStopLossPrimerIndexes(indexes);
+
+        assertTrue(!guard.canUpdateStopLoss());
+        assertEq(guard.stopLossPrimerUpdates().length, 0);
+        (, , , , uint64 primerTimestamp) = guard.strategyCheck(
+            address(fraxStrategy)
+        );
+        assertEq(primerTimestamp, block.timestamp);
+        (, , , , primerTimestamp) = guard.strategyCheck(address(mimStrategy));
+        assertEq(primerTimestamp, block.timestamp);
+
+        vm.warp(block.timestamp + MIN_REPORT_DELAY);
+        assertEq(guard.stopLossExecutions().length, 2);
+    }
+
+    function testGuardStopLossIndexesSkipStrategiesThatDontNeedIt() public {
+        manipulatePool(false, 500, frax_lp, frax);
+
+        uint256[] memory indexes = new uint256[](3);
+        // frax strategy, musd strategy within threshold and an index past the
+        // end of the queue
+        indexes[0] = 0;
+        indexes[1] = 1;
+        indexes[2] = 10;
+        vm.startPrank(BASED_ADDRESS);
+        guard.setStopLossPrimerIndexes(indexes);
+        (, , , , uint64 primerTimestamp) = guard.strategyCheck(
+            address(musdStrategy)
+        );
+        assertEq(primerTimestamp, 0);
+        (, , , , primerTimestamp) = guard.strategyCheck(address(fraxStrategy));
+        assertEq(primerTimestamp, block.timestamp);
+
+        // Primer hasn't expired, nothing is executed
+        guard.executeStopLossIndexes(indexes);
+        assertTrue(!fraxStrategy.stop());
+        (, , , , primerTimestamp) = guard.strategyCheck(address(fraxStrategy));
+        assertEq(primerTimestamp, block.timestamp);
+        vm.stopPrank();
+    }
+
+    function testGuardStopLossIndexesIsolateFailures() public {
+        manipulatePool(false, 500, frax_lp, frax);
+        manipulatePool(false, 5000, mim_lp, mim);
+
+        uint256[] memory indexes = guard.stopLossPrimerUpdates();
+        vm.prank(BASED_ADDRESS);
+        guard.setStopLossPrimerIndexes(indexes);
+        vm.warp(block.timestamp + MIN_REPORT_DELAY);
+
+        // the stop loss of the mim strategy now reverts
+        vm.prank(BASED_ADDRESS);
+        mimStrategy.revokeKeeper(address(guard));
+
+        vm.prank(BASED_ADDRESS);
+        guard.executeStopLossIndexes(indexes);
+
+        // the frax stop loss went through or counted an attempt
+        assertTrue(fraxStrategy.stop() || fraxStrategy.stopLossAttempts() > 0);
+        assertTrue(!mimStrategy.stop());
+        assertEq(mimStrategy.stopLossAttempts(), 0);
+        (bool active, , , , uint64 primerTimestamp) = guard.strategyCheck(
+            address(mimStrategy)
+        );
+        assertTrue(active);
+        assertTrue(primerTimestamp != 0);
+        // mim is still due, frax too if its stop loss needs another attempt
+        uint256 due = fraxStrategy.stop() ? 1 : 2;
+        assertEq(guard.stopLossExecutions().length, due);
+    }
+
+    function testGuardHarvestableStrategies() public {
+        uint256 shares = genThreeCrv(1E26, alice);
+        vm.startPrank(alice);
+        THREE_POOL_TOKEN.transfer(address(fraxStrategy), HARVEST_MIN);
+        THREE_POOL_TOKEN.transfer(address(mimStrategy), HARVEST_MIN);
+        vm.stopPrank();
+
+        vm.warp(block.timestamp + MIN_REPORT_DELAY);
+        uint256[] memory indexes = guard.harvestableStrategies();
+        assertEq(indexes.length, 2);
+        assertEq(indexes[0], 0);
+        assertEq(indexes[1], 2);
+
+        vm.prank(BASED_ADDRESS);
+        assertEq(guard.bulkHarvestIndexes(indexes), 2);
+        assertEq(guard.harvestableStrategies().length, 0);
+    }
+
+    function testGuardStopLossIndexesNotKeeper() public {
+        uint256[] memory indexes = new uint256[](0);
+        vm.expectRevert(abi.encodeWithSelector(GuardErrors.NotKeeper.selector));
+        guard.setStopLossPrimerIndexes(indexes);
+        vm.expectRevert(abi.encodeWithSelector(GuardErrors.NotKeeper.selector));
+        guard.endStopLossPrimerIndexes(indexes);
+        vm.expectRevert(abi.encodeWithSelector(GuardErrors.NotKeeper.selector));
+        guard.executeStopLossIndexes(indexes);
+    }
+
     function test_guard_should_reset_stop_loss_primer_if_returned_within_threshold()
         public
     {
@@ -0,0 +1,288 @@
+import json
+import os
+from distutils.util import strtobool
+from pathlib import Path
+
+import eth_abi
+import pytest
+from brownie import web3
+from conftest import *
+
+# Gas used per entry point in canonical scenarios, checked against the
+# committed baseline. Run with GAS_BASELINE_UPDATE=true to record a new one.
+
+BASELINE_PATH = Path(__file__).parent / "gas_baseline.json"
+# allowed increase over the baseline, in percent
+GAS_THRESHOLD = float(os.getenv("GAS_THRESHOLD", "2"))
+UPDATE_BASELINE = strtobool(os.getenv("GAS_BASELINE_UPDATE", "false"))
+
+VAULT_DEPOSIT = 1000 * 10**6
+
+
+def gas_regression(scenario, gas_used, baseline, threshold=GAS_THRESHOLD):
+    """Error message if gas_used is over the baseline plus threshold percent
+
+    Scenarios without a baseline must be skipped by the caller, see check.
+    """
+    expected = baseline[scenario]
+    limit = expected * (100 + threshold) / 100
+    if gas_used <= limit:
+        return None
+    change = (gas_used - expected) * 100 / expected
+    return f"{scenario}: {gas_used} gas, {change:.2f}% over the baseline of {expected}"
+
+
+@pytest.fixture(scope="module")
+def gas_report():
+    with open(BASELINE_PATH) as baseline_file:
+        baseline = json.load(baseline_file)
+    measured = {}
+    yield baseline, measured
+
+    for scenario, gas_used in sorted(measured.items()):
+        print(f"{scenario}: {gas_used} (baseline {baseline.get(scenario)})")
+    if UPDATE_BASELINE:
+        baseline.update(measured)
+        with open(BASELINE_PATH, "w") as baseline_file:
+            json.dump(baseline, baseline_file, indent=4, sort_keys=True)
+            baseline_file.write("\n")
+
+
+def check(scenario, value, baseline):
+    """Fail on a regression over the baseline, skip scenarios without one
+
+    A skip rather than a failure keeps a checkout without recorded baselines
+    runnable while still reporting every scenario that isn't checked.
+    """
+    if UPDATE_BASELINE:
+        return
+    if baseline.get(scenario) is None:
+        pytest.skip(
+            f"{scenario}: no baseline, record one with GAS_BASELINE_UPDATE=true"
+        )
+    regression = gas_regression(scenario, value, baseline)
+    assert regression is None, regression
+
+
+@pytest.fixture(scope="function")
+def record_gas(gas_report):
+    baseline, measured = gas_report
+
+    def record(scenario, tx):
+        measured[scenario] = tx.gas_used
+        check(scenario, tx.gas_used, baseline)
+
+    return record
+
+
+def storage_ops(tx, address):
+    """Number of SLOAD and SSTORE operations executed by the contract at address"""
+    counts = {"SLOAD": 0, "SSTORE": 0}
+    for step in tx.trace:
+        if step["op"] in counts and step["address"] == address:
+            counts[step["op"]] += 1
+    return counts
+
+
+# storage slots of a GVault StrategyParams entry, six before it was packed
+STRATEGY_PARAMS_SLOTS = 2
+# storage slots searched for the GVault strategies mapping
+MAX_MAPPING_SLOT = 64
+
+
+def strategy_params_base(vault, strategy):
+    """Storage slot of the packed StrategyParams of strategy
+
+    The slot of the strategies mapping isn't known to the test, the entry is
+    found by matching the first packed slot against the strategies getter.
+    """
+    active, debt_ratio, last_report, total_debt, _, _ = vault.strategies(strategy)
+    packed = int(active) | debt_ratio << 8 | last_report << 24 | total_debt << 88
+    for slot in range(MAX_MAPPING_SLOT):
+        base = int.from_bytes(
+            web3.keccak(
+                eth_abi.encode_abi(["address", "uint256"], (strategy.address, slot))
+            ),
+            "big",
+        )
+        if int(web3.eth.get_storage_at(vault.address, base).hex(), 16) == packed:
+            return base
+    return None
+
+
+def check_strategy_params_slots(tx, vault, strategies):
+    """Check that tx only touched the packed StrategyParams slots of strategies"""
+    keys = {
+        int(step["stack"][-1], 16)
+        for step in tx.trace
+        if step["op"] in ("SLOAD", "SSTORE") and step["address"] == vault.address
+    }
+    for strategy in strategies:
+        base = strategy_params_base(vault, strategy)
+        assert base is not None, f"no packed StrategyParams of {strategy}"
+        # the layout before packing had six slots, look past the packed two
+        offsets = {key - base for key in keys if 0 <= key - base < 6}
+        assert offsets, f"no StrategyParams access of {strategy}"
+        assert max(offsets) < STRATEGY_PARAMS_SLOTS, offsets
+
+
+@pytest.fixture(scope="function")
+def record_storage_ops(gas_report):
+    """Record the storage operations of a contract, checked like gas used"""
+    baseline, measured = gas_report
+
+    def record(scenario, tx, address):
+        counts = {f"{scenario} {op}": n for op, n in storage_ops(tx, address).items()}
+        measured.update(counts)
+        for name, count in counts.items():
+            check(name, count, baseline)
+
+    return record
+
+
+@pytest.fixture(scope="function")
+def vault_approve(mock_gro_vault_usdc, mock_usdc, alice, bob):
+    for account in [alice, bob]:
+        mock_usdc.approve(mock_gro_vault_usdc, MAX_UINT256, {"from": account})
+
+
+# GVAULT
+
+
+def test_vault_deposit_empty(mock_gro_vault_usdc, alice, vault_approve, record_gas):
+    tx = mock_gro_vault_usdc.deposit(VAULT_DEPOSIT, alice, {"from": alice})
+    record_gas("GVault.deposit empty vault", tx)
+
+
+def test_vault_deposit(mock_gro_vault_usdc, alice, bob, vault_approve, record_gas):
+    mock_gro_vault_usdc.deposit(VAULT_DEPOSIT, bob, {"from": bob})
+    tx = mock_gro_vault_usdc.deposit(VAULT_DEPOSIT, alice, {"from": alice})
+    record_gas("GVault.deposit", tx)
+
+
+def test_vault_withdraw_idle(mock_gro_vault_usdc, alice, vault_approve, record_gas):
+    mock_gro_vault_usdc.deposit(VAULT_DEPOSIT, alice, {"from": alice})
+    tx = mock_gro_vault_usdc.withdraw(VAULT_DEPOSIT / 2, alice, alice, {"from": alice})
+    record_gas("GVault.withdraw idle assets", tx)
+
+
+def test_vault_redeem_idle(mock_gro_vault_usdc, alice, vault_approve, record_gas):
+    mock_gro_vault_usdc.deposit(VAULT_DEPOSIT, alice, {"from": alice})
+    shares = mock_gro_vault_usdc.balanceOf(alice)
+    tx = mock_gro_vault_usdc.redeem(shares / 2, alice, alice, {"from": alice})
+    record_gas("GVault.redeem idle assets", tx)
+
+
+def test_vault_redeem_full_queue(
+    mock_gro_vault_usdc,
+    admin,
+    alice,
+    fill_queue,
+    vault_approve,
+    record_gas,
+    record_storage_ops,
+):
+    # every strategy holds 10% of the assets, a full redeem empties the queue
+    mock_gro_vault_usdc.deposit(10 * VAULT_DEPOSIT, alice, {"from": alice})
+    for strategy in fill_queue:
+        strategy.runHarvest({"from": admin})
+    shares = mock_gro_vault_usdc.balanceOf(alice)
+    tx = mock_gro_vault_usdc.redeem(shares, alice, alice, {"from": alice})
+    check_strategy_params_slots(tx, mock_gro_vault_usdc, fill_queue)
+    record_storage_ops("GVault.redeem 5 strategies", tx, mock_gro_vault_usdc.address)
+    record_gas("GVault.redeem 5 strategies", tx)
+
+
+def test_vault_report_credit(
+    mock_gro_vault_usdc,
+    admin,
+    alice,
+    primary_mock_strategy,
+    vault_approve,
+    record_gas,
+    record_storage_ops,
+):
+    mock_gro_vault_usdc.deposit(VAULT_DEPOSIT, alice, {"from": alice})
+    tx = primary_mock_strategy.runHarvest({"from": admin})
+    check_strategy_params_slots(tx, mock_gro_vault_usdc, [primary_mock_strategy])
+    record_storage_ops("GVault.report credit", tx, mock_gro_vault_usdc.address)
+    record_gas("GVault.report credit", tx)
+
+
+def test_vault_report_profit(
+    mock_gro_vault_usdc,
+    mock_usdc,
+    admin,
+    alice,
+    primary_mock_strategy,
+    vault_approve,
+    record_gas,
+    record_storage_ops,
+):
+    mock_gro_vault_usdc.deposit(VAULT_DEPOSIT, alice, {"from": alice})
+    primary_mock_strategy.runHarvest({"from": admin})
+    # send funds to the strategy to simulate rewards
+    mock_usdc.transfer(primary_mock_strategy, VAULT_DEPOSIT / 10, {"from": alice})
+    tx = primary_mock_strategy.runHarvest({"from": admin})
+    check_strategy_params_slots(tx, mock_gro_vault_usdc, [primary_mock_strategy])
+    record_storage_ops("GVault.report profit", tx, mock_gro_vault_usdc.address)
+    record_gas("GVault.report profit", tx)
+
+
+# GTRANCHE
+
+
+def tranche_deposits(tranche, tokens, user):
+    amount = LARGE_NUMBER * 10 ** tokens[0].decimals()
+    setup_token(tokens[0], amount, user, tranche)
+    junior = tranche.deposit(
+        amount / 2, 0, JUNIOR_TRANCHE, user.address, {"from": user.address}
+    )
+    senior = tranche.deposit(
+        amount / 4, 0, SENIOR_TRANCHE, user.address, {"from": user.address}
+    )
+    return junior, senior
+
+
+def test_tranche_deposit(tranche_fixed_rate, tokens, users, record_gas):
+    junior, senior = tranche_deposits(tranche_fixed_rate, tokens, users[0])
+    record_gas("GTranche.deposit junior", junior)
+    record_gas("GTranche.deposit senior", senior)
+
+
+def test_tranche_withdraw(tranche_fixed_rate, tokens, gTokens, users, record_gas):
+    user = users[0]
+    tranche_deposits(tranche_fixed_rate, tokens, user)
+    senior = tranche_fixed_rate.withdraw(
+        gTokens[SENIOR_TRANCHE_ID].balanceOf(user.address) / 2,
+        0,
+        SENIOR_TRANCHE,
+        user.address,
+        {"from": user.address},
+    )
+    record_gas("GTranche.withdraw senior", senior)
+    # small enough to stay within the utilisation threshold
+    junior = tranche_fixed_rate.withdraw(
+        gTokens[JUNIOR_TRANCHE_ID].balanceOf(user.address) / 10,
+        0,
+        JUNIOR_TRANCHE,
+        user.address,
+        {"from": user.address},
+    )
+    record_gas("GTranche.withdraw junior", junior)
+
+
+# GROUTER
+
+
+@pytest.mark.usefixtures("load_up_three_pool")
+def test_router_deposit_withdraw(
+    gro_zapper, mock_dai, alice, junior_tranche_token, record_gas
+):
+    mock_dai.approve(gro_zapper.address, MAX_UINT256, {"from": alice})
+    tx = gro_zapper.deposit(1000 * 10**18, 0, False, 9900, {"from": alice})
+    record_gas("GRouter.deposit", tx)
+    junior_tranche_token.approve(gro_zapper.address, MAX_UINT256, {"from": alice})
+    junior_balance = junior_tranche_token.balanceOf(alice)
+    tx = gro_zapper.withdraw(junior_balance, 0, False, 0, {"from": alice})
+    record_gas("GRouter.withdraw", tx)
@@ -0,0 +1,110 @@
+import csv
+import os
+from itertools import product
+
+import pytest
+from conftest import *
+
+# Gas cost surface of GVault withdrawals that have to be covered from the
+# strategy queue. Sweeps the number of strategies in the queue, how debt is
+# spread over them and the share of assets kept in the vault as reserves.
+
+SURFACE_PATH = os.getenv("WITHDRAW_GAS_SURFACE", "withdraw_gas_surface.csv")
+PERCENTAGE_DECIMAL_FACTOR = 10_000
+DEPOSIT = 100_000 * 10**6
+
+QUEUE_DEPTHS = [1, 2, 3, 4, 5]
+DISTRIBUTIONS = ["equal", "front", "back"]
+# share of assets not allocated to strategies, in bps
+RESERVES = [0, 500, 1000, 2500, 5000]
+# share of the vault withdrawn, in bps
+WITHDRAWALS = [5000, 10000]
+
+# single strategy queues only have one distribution
+SCENARIOS = [
+    (depth, distribution, reserve, withdrawal)
+    for depth, distribution, reserve, withdrawal in product(
+        QUEUE_DEPTHS, DISTRIBUTIONS, RESERVES, WITHDRAWALS
+    )
+    if depth > 1 or distribution == "equal"
+]
+
+SURFACE_FIELDS = [
+    "depth",
+    "distribution",
+    "reserve",
+    "withdrawal",
+    "strategies_touched",
+    "gas_used",
+]
+
+
+def debt_ratios(depth, distribution, reserve):
+    """Debt ratios of the strategies in queue order
+
+    equal spreads debt evenly, front halves the allocation for every next
+    strategy and back is front in reverse, so withdrawals have to walk past
+    small strategies first.
+    """
+    allocated = PERCENTAGE_DECIMAL_FACTOR - reserve
+    if distribution == "equal":
+        weights = [1] * depth
+    else:
+        weights = [2 ** (depth - i - 1) for i in range(depth)]
+        if distribution == "back":
+            weights.reverse()
+    ratios = [allocated * weight // sum(weights) for weight in weights]
+    # rounding leftovers go to the largest strategy
+    largest = weights.index(max(weights))
+    ratios[largest] += allocated - sum(ratios)
+    return ratios
+
+
+@pytest.fixture(scope="module")
+def gas_surface():
+    rows = []
+    yield rows
+    with open(SURFACE_PATH, "w", newline="") as surface_file:
+        writer = csv.DictWriter(surface_file, fieldnames=SURFACE_FIELDS)
+        writer.writeheader()
+        writer.writerows(sorted(rows, key=lambda row: [row[f] for f in SURFACE_FIELDS]))
+    print(f"withdrawal gas surface written to {SURFACE_PATH}")
+
+
+@pytest.mark.parametrize("depth,distribution,reserve,withdrawal", SCENARIOS)
+def test_withdraw_gas(
+    mock_gro_vault_usdc,
+    mock_usdc,
+    admin,
+    alice,
+    next_mock_strategy,
+    gas_surface,
+    depth,
+    distribution,
+    reserve,
+    withdrawal,
+):
+    mock_usdc.approve(mock_gro_vault_usdc, MAX_UINT256, {"from": alice})
+    mock_gro_vault_usdc.deposit(DEPOSIT, alice, {"from": alice})
+    strategies = []
+    for ratio in debt_ratios(depth, distribution, reserve):
+        strategy = next_mock_strategy()
+        mock_gro_vault_usdc.addStrategy(strategy.address, ratio, {"from": admin})
+        strategies.append(strategy)
+    # pull each strategy's share of the assets out of the vault
+    for strategy in strategies:
+        strategy.runHarvest({"from": admin})
+
+    assets = DEPOSIT * withdrawal // PERCENTAGE_DECIMAL_FACTOR
+    tx = mock_gro_vault_usdc.withdraw(assets, alice, alice, {"from": alice})
+    touched = tx.events.count("LogWithdrawalFromStrategy")
+    gas_surface.append(
+        {
+            "depth": depth,
+            "distribution": distribution,
+            "reserve": reserve,
+            "withdrawal": withdrawal,
+            "strategies_touched": touched,
+            "gas_used": tx.gas_used,
+        }
+    )
@@ -1,3 +1,4 @@
+from nodes import *
 from oracle import *
 from strategy import *
 from tokens import *
@@ -5,10 +6,47 @@ from tranche import *
 from user import *
 from utils import *
 from vault import *
+from zapper import *
+
+# node ports handed out to xdist workers by the master
+_node_ports = set()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # runs on the xdist master, each worker gets a port nothing listens on yet
+    # so that it launches its own node instead of attaching to another one
+    port = free_ports(1, network_port() + 1, _node_ports)[0]
+    _node_ports.add(port)
+    node.workerinput["node_port"] = port
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # before brownie sets up the worker and offsets the port by the worker index
+    if hasattr(config, "workerinput"):
+        set_worker_port(config.workerinput)
+
+
+@pytest.fixture(scope="module")
+def module_isolation():
+    # brownie resets the chain around every module, which throws away the
+    # session deployments. isolate reverts every test instead, this override
+    # keeps xdist workers running since brownie requires the fixture on them.
+    yield
 
 
 @pytest.fixture(scope="function", autouse=True)
-def isolate(fn_isolation):
-    # perform a chain rewind after completing each test, to ensure proper isolation
-    # https://eth-brownie.readthedocs.io/en/v1.10.3/tests-pytest-intro.html#isolation-fixtures
-    pass
+def isolate(
+    module_isolation,
+    mint_mock_token,
+    gro_vault,
+    mock_gro_vault_curve,
+    mock_gro_vault_usdc,
+):
+    # the shared contracts are deployed once per session, every test runs on a
+    # snapshot taken after them and is rolled back when it completes. brownie's
+    # fn_isolation can't be used here, it resets the chain for every module.
+    snapshot_id = evm_snapshot()
+    yield
+    evm_revert(snapshot_id)
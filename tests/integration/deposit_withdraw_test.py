@@ -3,7 +3,6 @@ import eth_abi
 import pytest
 from brownie import (
     ZERO_ADDRESS,
-    Contract,
     ConvexStrategy,
     GRouter,
     GTranche,
@@ -17,12 +16,9 @@ from brownie import (
 )
 from conftest import *
 
-# RUN TESTS IN THIS FILE ON MAINNET FORK
-
+from scripts.scripts.abi_store import contract
 
-@pytest.fixture(autouse=True)
-def isolation(fn_isolation):
-    pass
+# RUN TESTS IN THIS FILE ON MAINNET FORK
 
 
 @pytest.fixture(scope="function")
@@ -97,7 +93,7 @@ def gro_zapper(admin, gtranche, gro_vault, zapper_oracle):
 
 @pytest.fixture(scope="function")
 def curve_pool_frax():
-    yield Contract("0xd632f22692FaC7611d2AA1C0D552930D43CAEd3B")
+    yield contract("0xd632f22692FaC7611d2AA1C0D552930D43CAEd3B")
 
 
 def deploy_pnl(admin, tranche):
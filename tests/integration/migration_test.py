@@ -1,12 +1,13 @@
 import math
 
 import pytest
-from brownie import Contract
 from brownie import GMigration
 from brownie import GTranche
 from brownie import GVault
 from conftest import *
 
+from scripts.scripts.abi_store import contract
+
 # RUN TESTS IN THIS FILE ON MAINNET FORK
 
 # Constants
@@ -27,42 +28,42 @@ COFFEE = "0xc0ffEeDfb871B8019c5d288B4dc8E6ac42d5F655"
 
 @pytest.fixture(scope="function", autouse=True)
 def dai_vault():
-    yield Contract(DAI_VAULT_ADAPTOR)
+    yield contract(DAI_VAULT_ADAPTOR)
 
 
 @pytest.fixture(scope="function", autouse=True)
 def usdc_vault():
-    yield Contract(USDC_VAULT_ADAPTOR)
+    yield contract(USDC_VAULT_ADAPTOR)
 
 
 @pytest.fixture(scope="function", autouse=True)
 def usdt_vault():
-    yield Contract(USDT_VAULT_ADAPTOR)
+    yield contract(USDT_VAULT_ADAPTOR)
 
 
 @pytest.fixture(scope="function", autouse=True)
 def pwrd():
-    yield Contract(PWRD)
+    yield contract(PWRD)
 
 
 @pytest.fixture(scope="function", autouse=True)
 def gvt():
-    yield Contract(GVT)
+    yield contract(GVT)
 
 
 @pytest.fixture(scope="function", autouse=True)
 def dai_token():
-    yield Contract(DAI)
+    yield contract(DAI)
 
 
 @pytest.fixture(scope="function", autouse=True)
 def usdc_token():
-    yield Contract(USDC)
+    yield contract(USDC)
 
 
 @pytest.fixture(scope="function", autouse=True)
 def usdt_token():
-    yield Contract(USDT)
+    yield contract(USDT)
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -93,7 +94,7 @@ def gtranche(admin, gvault, gvt, pwrd, oracle, gmigration):
 
 
 def force_slippage(strategy):
-    strat = Contract(strategy)
+    strat = contract(strategy)
     strat.setSlippage(250, {"from": BASED})
 
 
@@ -124,7 +125,7 @@ def test_migration(
     # make sure we can withdraw
     for vault in [dai_vault, usdc_vault, usdt_vault]:
         for i in range(5):
-            strategy = Contract(vault.vault()).withdrawalQueue(i)
+            strategy = contract(vault.vault()).withdrawalQueue(i)
             if strategy == ZERO_ADDRESS:
                 break
             force_slippage(strategy)
@@ -164,7 +165,7 @@ def test_migration(
     assert usdc_token.balanceOf(gmigration) > expected_usdc
     assert usdt_token.balanceOf(gmigration) > expected_usdt
 
-    three_pool = Contract(THREE_POOL)
+    three_pool = contract(THREE_POOL)
     three_crv_amount = three_pool.calc_token_amount(
         [
             dai_token.balanceOf(gmigration),
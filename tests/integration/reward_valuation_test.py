@@ -0,0 +1,50 @@
+import pytest
+from brownie import ConvexStrategy, chain
+from conftest import *
+
+from scripts.scripts.read_cache import ReadCache
+from scripts.scripts.reward_valuation import RewardValuer
+
+# RUN TESTS IN THIS FILE ON MAINNET FORK
+
+FRAX_PID = 32
+MIM_PID = 40
+
+
+@pytest.fixture(scope="function")
+def convex_strategies(admin, gro_vault, E_CRV, alice):
+    strategies = {}
+    for name, pid, pool in [
+        ("convexFrax", FRAX_PID, "0xd632f22692FaC7611d2AA1C0D552930D43CAEd3B"),
+        ("convexMim", MIM_PID, "0x5a6A4D54456819380173272A5E8E9B9904BdF41B"),
+    ]:
+        strategy = admin.deploy(ConvexStrategy, gro_vault, admin, pid, pool)
+        strategy.setKeeper(admin, {"from": admin})
+        gro_vault.addStrategy(strategy.address, 5000, {"from": admin})
+        strategies[name] = strategy
+    mint_3crv(alice, 2_000_000 * 10**18)
+    E_CRV.approve(gro_vault, MAX_UINT256, {"from": alice})
+    gro_vault.deposit(2_000_000 * 10**18, alice, {"from": alice})
+    for strategy in strategies.values():
+        strategy.runHarvest({"from": admin})
+    # accrue CRV rewards
+    chain.sleep(14 * 86400)
+    chain.mine()
+    return strategies
+
+
+def test_valuation_matches_strategy_rewards(convex_strategies):
+    cache = ReadCache()
+    valuer = RewardValuer(
+        {name: strategy.address for name, strategy in convex_strategies.items()},
+        cache,
+    )
+    block = chain.height
+    valuations = valuer.value(block)
+    for valuation in valuations:
+        strategy = convex_strategies[valuation.name]
+        assert valuation.crv > 0
+        assert valuation.value == strategy.rewards(block_identifier=block)
+    # a second valuation of the block is served from the cache
+    assert valuer.value(block) == valuations
+    assert cache.stats()["hits"] >= cache.stats()["misses"]
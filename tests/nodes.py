@@ -0,0 +1,57 @@
+import socket
+from typing import List
+
+from brownie._config import CONFIG
+
+LOCALHOST = "127.0.0.1"
+# highest port probed when looking for free ports
+MAX_PORT = 65535
+
+
+def network_id(network=None) -> str:
+    return network or CONFIG.argv["network"] or CONFIG.settings["networks"]["default"]
+
+
+def network_port(network=None) -> int:
+    return int(CONFIG.networks[network_id(network)]["cmd_settings"]["port"])
+
+
+def worker_index(workerid: str) -> int:
+    """Index of an xdist worker, gw3 => 3"""
+    return int("".join(i for i in workerid if i.isdigit()))
+
+
+def port_free(port: int) -> bool:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        try:
+            sock.bind((LOCALHOST, port))
+        except OSError:
+            return False
+    return True
+
+
+def free_ports(count: int, start: int, taken=()) -> List[int]:
+    """First count ports from start that nothing listens on and aren't taken"""
+    ports = []
+    port = start
+    while len(ports) < count:
+        if port > MAX_PORT:
+            raise RuntimeError(f"no free port left above {start}")
+        if port not in taken and port_free(port):
+            ports.append(port)
+        port += 1
+    return ports
+
+
+def set_worker_port(workerinput):
+    """Point the worker's network at the node port picked by the master
+
+    brownie launches one node per worker at the configured port plus the
+    worker index, and attaches to whatever already listens there. The port is
+    set so that offset lands on the free port allocated to this worker.
+    """
+    port = workerinput.get("node_port")
+    if port is None:
+        return
+    settings = CONFIG.networks[network_id(workerinput.get("network"))]
+    settings["cmd_settings"]["port"] = port - worker_index(workerinput["workerid"])
@@ -1,6 +1,8 @@
 import eth_abi
 import pytest
-from brownie import Contract, MockDAI, MockUSDC, MockUSDT, VyperMock3CRV, web3
+from brownie import MockDAI, MockUSDC, MockUSDT, VyperMock3CRV, web3
+
+from scripts.scripts.abi_store import contract
 
 USDC_ADDRESS = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
 USDT_ADDRESS = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
@@ -9,60 +11,60 @@ E_CRV_ADDRESS = "0x6c3F90f043a72FA612cbac8115EE7e52BDe6E490"
 FRAX_CRV_ADDRESS = "0xd632f22692FaC7611d2AA1C0D552930D43CAEd3B"
 
 
-@pytest.fixture(scope="function", autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def mock_dai(admin, alice):
     _mock_dai = admin.deploy(MockDAI)
     yield _mock_dai
 
 
-@pytest.fixture(scope="function", autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def mock_usdc(admin, alice):
     _mock_usdc = admin.deploy(MockUSDC)
     yield _mock_usdc
 
 
-@pytest.fixture(scope="function", autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def mock_usdt(admin, alice):
     _mock_usdt = admin.deploy(MockUSDT)
     yield _mock_usdt
 
 
-@pytest.fixture(scope="function", autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def mock_three_crv(admin):
     three_crv = admin.deploy(VyperMock3CRV, "3CRV", "3CRV", 18, 0)
     yield three_crv
 
 
-@pytest.fixture(scope="function", autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def mint_mock_token(mock_dai, mock_usdc, mock_usdt, admin, alice, bob):
     for account in [admin, alice, bob]:
         for token in [mock_dai, mock_usdc, mock_usdt]:
             token.faucet({"from": account})
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def usdc(admin):
-    yield Contract(USDC_ADDRESS)
+    yield contract(USDC_ADDRESS)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def usdt(admin):
-    yield Contract(USDT_ADDRESS)
+    yield contract(USDT_ADDRESS)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def dai(admin):
-    yield Contract(DAI_ADDRESS)
+    yield contract(DAI_ADDRESS)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def E_CRV(admin):
-    yield Contract(E_CRV_ADDRESS)
+    yield contract(E_CRV_ADDRESS)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def FRAX_CRV(admin):
-    yield Contract(FRAX_CRV_ADDRESS)
+    yield contract(FRAX_CRV_ADDRESS)
 
 
 def mint_dai(account, amount):
@@ -0,0 +1,112 @@
+import pytest
+from brownie import ZERO_ADDRESS, MockDAI, MockERC4626, MockUSDC
+from utils import evm_revert, evm_snapshot
+
+from scripts.scripts.deployer import (
+    DeploymentEngine,
+    DeploymentError,
+    Manifest,
+    Ref,
+    call_step,
+    create_address,
+    dependencies,
+    deploy_step,
+)
+
+
+def test_create_address():
+    address = create_address("0x6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0", 0)
+    assert address.lower() == "0xcd234a471b72ba2f1ccf0a70fcaba648a5eecd8d"
+
+
+def test_dependencies_from_refs_and_after():
+    steps = [
+        deploy_step("token", MockDAI),
+        deploy_step("vault", MockERC4626, Ref("token"), "vault", "v", 18),
+        call_step("mint", Ref("token"), "mint", Ref("vault"), 1, after=("vault",)),
+    ]
+    assert dependencies(steps) == {
+        "token": (),
+        "vault": ("token",),
+        "mint": ("token", "vault"),
+    }
+
+
+def test_dependencies_rejects_cycles_and_unknown_steps():
+    with pytest.raises(DeploymentError):
+        dependencies([call_step("a", Ref("b"), "f"), call_step("b", Ref("a"), "f")])
+    with pytest.raises(DeploymentError):
+        dependencies([call_step("a", Ref("missing"), "f")])
+
+
+def test_engine_pipelines_independent_steps(admin):
+    steps = [
+        deploy_step("dai", MockDAI),
+        deploy_step("usdc", MockUSDC),
+        call_step("mint", Ref("dai"), "mint", admin, 100, gas_limit=100_000),
+        call_step("mintUsdc", Ref("usdc"), "mint", admin, 200),
+    ]
+    nonce = admin.nonce
+    engine = DeploymentEngine(admin, steps)
+
+    addresses = engine.run()
+
+    assert addresses["dai"] == create_address(admin.address, nonce)
+    assert addresses["usdc"] == create_address(admin.address, nonce + 1)
+    # both deployments go out before anything waits, the mint with an explicit
+    # gas limit doesn't wait for its deployment to be mined
+    assert [engine.receipts[name].nonce for name in ["dai", "usdc", "mint"]] == [
+        nonce,
+        nonce + 1,
+        nonce + 2,
+    ]
+    assert engine.contract("dai").balanceOf(admin) == 100
+    assert engine.contract("usdc").balanceOf(admin) == 200
+
+
+def test_engine_resumes_from_manifest(admin, tmp_path):
+    path = str(tmp_path / "manifest.json")
+    steps = [
+        deploy_step("dai", MockDAI),
+        call_step("mint", Ref("dai"), "mint", admin, 100),
+    ]
+    first = DeploymentEngine(admin, steps, manifest=Manifest(path)).run()
+    nonce = admin.nonce
+
+    # nothing changed, nothing is sent
+    engine = DeploymentEngine(admin, steps, manifest=Manifest(path))
+    assert engine.run() == first
+    assert engine.skipped == {"dai", "mint"}
+    assert admin.nonce == nonce
+
+    # a changed call is sent again, the deployment is kept
+    steps[1] = call_step("mint", Ref("dai"), "mint", admin, 50)
+    engine = DeploymentEngine(admin, steps, manifest=Manifest(path))
+    assert engine.run() == first
+    assert engine.skipped == {"dai"}
+    assert engine.contract("dai").balanceOf(admin) == 150
+
+
+def test_engine_reruns_calls_on_redeployed_contracts(admin, tmp_path):
+    path = str(tmp_path / "manifest.json")
+    steps = [
+        deploy_step("dai", MockDAI),
+        call_step("mint", Ref("dai"), "mint", admin, 100),
+    ]
+    snapshot_id = evm_snapshot()
+    first = DeploymentEngine(admin, steps, manifest=Manifest(path)).run()
+
+    # a fork reset replays the deployer nonces, dai is redeployed at the same
+    # address and the mint matches its recorded digest
+    evm_revert(snapshot_id)
+    engine = DeploymentEngine(admin, steps, manifest=Manifest(path))
+    assert engine.run() == first
+    assert engine.skipped == set()
+    assert engine.contract("dai").balanceOf(admin) == 100
+
+
+def test_manifest_is_kept_per_chain(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    Manifest(path, chain="1:0xaa").record("dai", "digest", "0x01", ZERO_ADDRESS)
+    assert Manifest(path, chain="1:0xaa").get("dai", "digest")
+    assert Manifest(path, chain="1:0xbb").get("dai", "digest") is None
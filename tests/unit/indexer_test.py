@@ -0,0 +1,96 @@
+import json
+
+import pytest
+from brownie import chain
+from conftest import *
+
+from scripts.scripts.indexer import INITIAL_CHUNK, EventStore, Indexer, get_logs
+
+
+@pytest.fixture(scope="function", autouse=True)
+def approve(mock_gro_vault_usdc, mock_usdc, alice):
+    mock_usdc.approve(mock_gro_vault_usdc, MAX_UINT256, {"from": alice})
+
+
+@pytest.fixture(scope="function")
+def vault_events(
+    mock_gro_vault_usdc, primary_mock_strategy, secondary_mock_strategy, alice, admin
+):
+    """Deposit, harvest into the strategies and withdraw back through them"""
+
+    def generate():
+        mock_gro_vault_usdc.deposit(1000 * 1e6, alice, {"from": alice})
+        primary_mock_strategy.runHarvest({"from": admin})
+        secondary_mock_strategy.runHarvest({"from": admin})
+        mock_gro_vault_usdc.redeem(
+            mock_gro_vault_usdc.balanceOf(alice), alice, alice, {"from": alice}
+        )
+
+    return generate
+
+
+def test_indexer_reruns_fetch_new_blocks(mock_gro_vault_usdc, vault_events):
+    start = chain.height
+    vault_events()
+    queried = []
+
+    def fetch(address, topics, from_block, to_block):
+        queried.append((from_block, to_block))
+        return get_logs(address, topics, from_block, to_block)
+
+    store = EventStore(":memory:")
+    indexer = Indexer({"GVault": mock_gro_vault_usdc.address}, store, start, 0, fetch)
+    assert indexer.run()["GVault"] > 0
+    assert store.cursor(mock_gro_vault_usdc.address) == chain.height
+    reports = store.rows("LogStrategyHarvestReport")
+    assert len(reports) == 2
+    assert len(store.rows("LogStrategyTotalChanges")) == 2
+    assert len(store.rows("LogWithdrawalFromStrategy")) > 0
+
+    # nothing new, nothing fetched and nothing written
+    queried.clear()
+    assert indexer.run() == {"GVault": 0}
+    assert queried == []
+
+    last = chain.height
+    vault_events()
+    indexer.run()
+    assert queried[0][0] == last + 1
+    assert len(store.rows("LogStrategyHarvestReport")) == 4
+    # rerunning from an older cursor doesn't duplicate events
+    indexer.start_block = start
+    store.db.execute("DELETE FROM cursors")
+    indexer.run()
+    assert len(store.rows("LogStrategyHarvestReport")) == 4
+
+
+def test_indexer_shrinks_refused_ranges(mock_gro_vault_usdc, vault_events):
+    start = chain.height
+    vault_events()
+
+    def fetch(address, topics, from_block, to_block):
+        if to_block - from_block > 1:
+            raise ValueError("query returned more than 10000 results")
+        return get_logs(address, topics, from_block, to_block)
+
+    store = EventStore(":memory:")
+    indexer = Indexer({"GVault": mock_gro_vault_usdc.address}, store, start, 0, fetch)
+    indexer.run()
+    assert len(store.rows("LogStrategyHarvestReport")) == 2
+    assert indexer.chunks["GVault"] < INITIAL_CHUNK
+
+
+def test_indexer_tranche_events(tokens, users, tranche):
+    start = chain.height
+    setup_tranche(tokens, LARGE_NUMBER, users[:1], tranche)
+    store = EventStore(":memory:")
+    Indexer({"GTranche": tranche.address}, store, start, 0).run()
+    balances = store.rows("LogNewTrancheBalance")
+    assert len(balances) == 2
+    assert len(store.rows("LogNewPnL")) == 2
+    # uint256 arrays are stored as json lists of decimal strings
+    junior, senior = json.loads(balances[-1][4])
+    assert [int(junior), int(senior)] == [
+        tranche.trancheBalances(0),
+        tranche.trancheBalances(1),
+    ]
@@ -0,0 +1,73 @@
+import asyncio
+
+from brownie import chain
+
+from scripts.scripts.keeper import Keeper
+
+MAX_REPORT_DELAY = 604800
+
+
+def test_keeper_harvests_strategy_on_trigger(
+    bot, mock_gro_vault_usdc, primary_mock_strategy
+):
+    keeper = Keeper(mock_gro_vault_usdc, {"mock": primary_mock_strategy.address}, bot)
+    last_report = mock_gro_vault_usdc.strategies(primary_mock_strategy)[2]
+    chain.sleep(MAX_REPORT_DELAY + 1)
+    chain.mine()
+
+    asyncio.run(keeper.run(max_blocks=1, poll_interval=0))
+
+    assert mock_gro_vault_usdc.strategies(primary_mock_strategy)[2] > last_report
+    assert keeper.nonce == bot.nonce
+
+
+def test_keeper_skips_strategy_without_trigger(
+    bot, mock_gro_vault_usdc, primary_mock_strategy
+):
+    keeper = Keeper(mock_gro_vault_usdc, {"mock": primary_mock_strategy.address}, bot)
+    last_report = mock_gro_vault_usdc.strategies(primary_mock_strategy)[2]
+    nonce = bot.nonce
+
+    asyncio.run(keeper.run(max_blocks=1, poll_interval=0))
+
+    assert mock_gro_vault_usdc.strategies(primary_mock_strategy)[2] == last_report
+    assert bot.nonce == nonce
+
+
+def test_keeper_assigns_sequential_nonces(
+    bot, mock_gro_vault_usdc, primary_mock_strategy, secondary_mock_strategy
+):
+    keeper = Keeper(
+        mock_gro_vault_usdc,
+        {
+            "primary": primary_mock_strategy.address,
+            "secondary": secondary_mock_strategy.address,
+        },
+        bot,
+    )
+    nonce = bot.nonce
+    chain.sleep(MAX_REPORT_DELAY + 1)
+    chain.mine()
+
+    asyncio.run(keeper.run(max_blocks=1, poll_interval=0))
+
+    assert sorted(tx.nonce for tx in keeper.in_flight.values()) == [nonce, nonce + 1]
+    assert bot.nonce == nonce + 2
+
+
+def test_keeper_drops_reads_of_reorged_blocks(
+    bot, mock_gro_vault_usdc, primary_mock_strategy
+):
+    keeper = Keeper(mock_gro_vault_usdc, {"mock": primary_mock_strategy.address}, bot)
+    block = chain.height
+
+    async def tick(block_hash):
+        keeper.queue = asyncio.Queue()
+        await keeper.tick(block, block_hash)
+        return keeper.cache.misses
+
+    misses = asyncio.run(tick("0xa"))
+    # the same block is served from the cache
+    assert asyncio.run(tick("0xa")) == misses
+    # a block replacing it at the same height is read again
+    assert asyncio.run(tick("0xb")) == 2 * misses
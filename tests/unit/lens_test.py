@@ -0,0 +1,74 @@
+import pytest
+from brownie import GLens, chain
+from conftest import *
+
+from scripts.scripts.lens import LensClient, StrategyState
+from scripts.scripts.read_cache import ReadCache
+
+
+@pytest.fixture(scope="function")
+def lens(admin):
+    return admin.deploy(GLens)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def invested(
+    mock_gro_vault_usdc,
+    mock_usdc,
+    primary_mock_strategy,
+    secondary_mock_strategy,
+    alice,
+    admin,
+    tokens,
+    users,
+    tranche,
+):
+    mock_usdc.approve(mock_gro_vault_usdc, MAX_UINT256, {"from": alice})
+    setup_tranche(tokens, LARGE_NUMBER, users[:1], tranche)
+    mock_gro_vault_usdc.deposit(1000 * 1e6, alice, {"from": alice})
+    primary_mock_strategy.runHarvest({"from": admin})
+    secondary_mock_strategy.runHarvest({"from": admin})
+    # unrealised profit for the tranche to distribute
+    mock_usdc.transfer(primary_mock_strategy, 10 * 1e6, {"from": alice})
+    primary_mock_strategy.runHarvest({"from": admin})
+    chain.sleep(3600)
+    chain.mine()
+
+
+def test_lens_matches_direct_calls(lens, tranche, mock_gro_vault_usdc):
+    vault = mock_gro_vault_usdc
+    block = chain.height
+    state = LensClient(lens, tranche, vault).read(block)
+    assert state.block == block
+    assert state.timestamp == chain[block].timestamp
+
+    balances, profit, loss = tranche.pnlDistribution()
+    assert state.tranche.pnl_balances == tuple(balances)
+    assert (state.tranche.profit, state.tranche.loss) == (profit, loss)
+    assert state.tranche.utilisation == tranche.utilisation()
+    assert state.tranche.utilisation_threshold == tranche.utilisationThreshold()
+    for i in range(2):
+        assert state.tranche.tranche_balances[i] == tranche.trancheBalances(i)
+        assert state.tranche.factors[i] == tranche.factor(i)
+        assert state.tranche.price_per_share[i] == tranche.getPricePerShare(i)
+        assert state.tranche.total_supply[i] == tranche.totalSupply(i)
+
+    assert state.vault.total_assets == vault.totalAssets()
+    assert state.vault.realized_total_assets == vault.realizedTotalAssets()
+    assert state.vault.price_per_share == vault.getPricePerShare()
+    assert state.vault.total_supply == vault.totalSupply()
+    assert state.vault.locked_profit == vault.lockedProfit()
+    assert len(state.vault.strategies) == vault.getNoOfStrategies()
+    for i, strategy in enumerate(state.vault.strategies):
+        address = vault.withdrawalQueueAt(i)
+        assert strategy == StrategyState(address, *vault.strategies(address))
+
+
+def test_lens_read_is_cached_per_block(lens, tranche, mock_gro_vault_usdc):
+    cache = ReadCache()
+    client = LensClient(lens, tranche, mock_gro_vault_usdc, cache)
+    block = chain.height
+    state = client.read(block)
+    assert client.read(block) == state
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
@@ -0,0 +1,112 @@
+import pytest
+from brownie import chain
+from conftest import *
+
+from scripts.scripts.pps_sampler import (
+    FIELDS,
+    PriceSample,
+    PriceSampler,
+    SampleCache,
+    apy,
+    interpolate,
+)
+
+
+def make_sample(block, timestamp, value):
+    return PriceSample(block, timestamp, *[value] * len(FIELDS))
+
+
+def test_interpolate_fills_gaps():
+    samples = {0: make_sample(0, 0, 100), 10: make_sample(10, 120, 200), 15: None}
+    series = interpolate([0, 5, 10, 15], samples)
+    # the trailing gap has no upper neighbour and is dropped
+    assert [s.block for s in series] == [0, 5, 10]
+    assert series[1] == make_sample(5, 60, 150)._replace(interpolated=True)
+
+
+def test_cache_skips_interpolated_samples():
+    cache = SampleCache(":memory:")
+    big = 10**30
+    cache.write(
+        [make_sample(1, 12, big), make_sample(2, 24, 1)._replace(interpolated=True)]
+    )
+    assert cache.read([1, 2, 3]) == {1: make_sample(1, 12, big)}
+
+
+def test_apy():
+    series = [make_sample(0, 0, 100), make_sample(1, 31556952 // 2, 110)]
+    assert apy(series, "vault_pps") == pytest.approx(0.21)
+
+
+@pytest.fixture(scope="function")
+def sampled_blocks(
+    mock_gro_vault_usdc,
+    mock_usdc,
+    primary_mock_strategy,
+    alice,
+    admin,
+    tokens,
+    users,
+    tranche,
+):
+    mock_usdc.approve(mock_gro_vault_usdc, MAX_UINT256, {"from": alice})
+    setup_tranche(tokens, LARGE_NUMBER, users[:1], tranche)
+    mock_gro_vault_usdc.deposit(1000 * 1e6, alice, {"from": alice})
+    primary_mock_strategy.runHarvest({"from": admin})
+    blocks = []
+    for _ in range(5):
+        # simulate strategy profits between samples
+        mock_usdc.transfer(primary_mock_strategy, 10 * 1e6, {"from": alice})
+        primary_mock_strategy.runHarvest({"from": admin})
+        chain.sleep(86400)
+        chain.mine(3)
+        blocks.append(chain.height)
+    return blocks
+
+
+def direct_sample(tranche, vault, block):
+    return make_sample(block, chain[block].timestamp, 0)._replace(
+        junior_pps=tranche.getPricePerShare(0, block_identifier=block),
+        senior_pps=tranche.getPricePerShare(1, block_identifier=block),
+        junior_factor=tranche.factor(0, block_identifier=block),
+        senior_factor=tranche.factor(1, block_identifier=block),
+        vault_pps=vault.getPricePerShare(block_identifier=block),
+        vault_total_assets=vault.totalAssets(block_identifier=block),
+    )
+
+
+@pytest.mark.parametrize("batch_size", [0, 7, 500])
+def test_sampler_matches_direct_calls(
+    tranche, mock_gro_vault_usdc, sampled_blocks, batch_size
+):
+    sampler = PriceSampler(
+        tranche, mock_gro_vault_usdc, SampleCache(":memory:"), batch_size
+    )
+    samples = sampler.read(sampled_blocks)
+    for block in sampled_blocks:
+        assert samples[block] == direct_sample(tranche, mock_gro_vault_usdc, block)
+    if batch_size == 500:
+        assert sampler.requests == 1
+    # cached blocks aren't requested again
+    requests = sampler.requests
+    sampler.read(sampled_blocks)
+    assert sampler.requests == requests
+
+
+def test_sampler_series_interpolates_failed_reads(
+    tranche, mock_gro_vault_usdc, sampled_blocks
+):
+    first, last = sampled_blocks[0], sampled_blocks[-1]
+    middle = (first + last) // 2
+    width = len(FIELDS) + 1
+
+    def post(payload):
+        # drop the responses of the middle block
+        responses = sampler._post(payload)
+        return [r for r in responses if not width <= r["id"] < 2 * width]
+
+    sampler = PriceSampler(tranche, mock_gro_vault_usdc, post=post)
+    series = sampler.series(first, last, middle - first)
+    assert [s.block for s in series] == [first, middle, last]
+    assert [s.interpolated for s in series] == [False, True, False]
+    assert series[0].vault_pps <= series[1].vault_pps <= series[2].vault_pps
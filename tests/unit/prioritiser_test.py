@@ -0,0 +1,81 @@
+from scripts.scripts.prioritiser import Prices, plan_harvests, value_candidates
+from scripts.scripts.snapshot import StrategySnapshot
+
+# ETH at 2000 USD and 3crv at 1.02 USD
+PRICES = Prices(
+    eth_usd_price=2000 * 10**8, eth_usd_decimals=8, virtual_price=102 * 10**16
+)
+GAS_PRICE = 50 * 10**9
+
+
+def make_snapshot(name, profit, credit=0, excess_debt=0):
+    debt = 1_000_000 * 10**18
+    return StrategySnapshot(
+        name=name,
+        address=name,
+        block=1,
+        can_harvest=True,
+        estimated_total_assets=debt + profit,
+        active=True,
+        debt_ratio=5000,
+        last_report=0,
+        total_debt=debt,
+        total_gain=0,
+        total_loss=0,
+        excess_debt=excess_debt,
+        credit_available=credit,
+    )
+
+
+def test_candidates_are_valued_like_the_guard():
+    snapshot = make_snapshot("a", 1000 * 10**18, credit=500 * 10**18)
+    (candidate,) = value_candidates([snapshot], {"a": 1_000_000}, PRICES, GAS_PRICE)
+    assert candidate.profit == 1500 * 10**18
+    assert candidate.profit_usd == 1530 * 10**18
+    # 1M gas at 50 gwei is 0.05 ETH
+    assert candidate.gas_cost_usd == 100 * 10**18
+    assert candidate.net_usd == 1430 * 10**18
+
+
+def test_candidates_without_gas_estimate_are_dropped():
+    snapshot = make_snapshot("a", 1000 * 10**18)
+    assert value_candidates([snapshot], {"a": None}, PRICES, GAS_PRICE) == []
+
+
+def test_plan_ranks_by_net_value_within_budget():
+    snapshots = [
+        make_snapshot("small", 200 * 10**18),
+        make_snapshot("large", 5000 * 10**18),
+        make_snapshot("medium", 1000 * 10**18),
+        make_snapshot("loss", -1000 * 10**18),
+    ]
+    gas = {"small": 1_000_000, "large": 2_000_000, "medium": 2_500_000, "loss": 1}
+    candidates = value_candidates(snapshots, gas, PRICES, GAS_PRICE)
+
+    plan = plan_harvests(candidates, gas_budget=3_500_000)
+
+    # the loss is realised first, medium doesn't fit after large, small still does
+    assert [c.snapshot.name for c in plan] == ["loss", "large", "small"]
+    assert plan_harvests(candidates, gas_budget=0) == []
+
+
+def test_plan_puts_debt_triggered_harvests_first():
+    snapshots = [
+        make_snapshot("profit", 5000 * 10**18),
+        make_snapshot("excess", 0, excess_debt=2000 * 10**18),
+        make_snapshot("below", 0, excess_debt=100 * 10**18),
+    ]
+    gas = {"profit": 1_000_000, "excess": 2_000_000, "below": 1_000_000}
+    candidates = value_candidates(
+        snapshots, gas, PRICES, GAS_PRICE, debt_threshold=500 * 10**18
+    )
+    excess = candidates[1]
+    assert excess.debt_triggered and excess.net_usd < 0
+    assert excess.excess_debt == 2000 * 10**18
+
+    # excess debt under the threshold is left to the profit ranking, where it
+    # doesn't pay for its gas
+    plan = plan_harvests(candidates, gas_budget=10_000_000)
+    assert [c.snapshot.name for c in plan] == ["excess", "profit"]
+    plan = plan_harvests(candidates, gas_budget=2_000_000)
+    assert [c.snapshot.name for c in plan] == ["excess"]
@@ -0,0 +1,117 @@
+from contextlib import nullcontext
+
+import pytest
+from brownie import chain
+from conftest import *
+
+from scripts.scripts import read_cache
+from scripts.scripts.read_cache import ReadCache
+from scripts.scripts.snapshot import read_snapshots
+
+
+class FakeCall:
+    """View method stand in that counts how often it's called"""
+
+    def __init__(self, address, signature, value):
+        self._address = address
+        self.signature = signature
+        self.value = value
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.value(*args) if callable(self.value) else self.value
+
+
+@pytest.fixture
+def no_multicall(monkeypatch):
+    monkeypatch.setattr(read_cache, "multicall", lambda **kwargs: nullcontext())
+
+
+def test_cache_hits_within_block(no_multicall):
+    cache = ReadCache()
+    assets = FakeCall("0xAbC", "0x01", 10)
+    params = FakeCall("0xabc", "0x02", lambda address: address)
+    assert cache.call(assets, block=1) == 10
+    assert cache.call(assets, block=1) == 10
+    # addresses are keyed case insensitive, args are part of the key
+    assert cache.call(params, "0xDEF", block=1) == "0xDEF"
+    assert cache.call(params, "0xdef", block=1) == "0xDEF"
+    assert cache.call(params, "0x123", block=1) == "0x123"
+    assert (assets.calls, params.calls) == (1, 2)
+    assert cache.call(assets, block=2) == 10
+    assert assets.calls == 2
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["blocks"]) == (2, 4, 2)
+
+
+def test_cache_skips_failed_calls(no_multicall):
+    cache = ReadCache()
+    failing = FakeCall("0xabc", "0x01", None)
+    cache.call(failing, block=1)
+    cache.call(failing, block=1)
+    assert failing.calls == 2
+
+
+def test_cache_evicts_least_recent_blocks(no_multicall):
+    cache = ReadCache(max_blocks=2)
+    method = FakeCall("0xabc", "0x01", 1)
+    for block in [1, 2, 1, 3]:
+        cache.call(method, block=block)
+    # block 1 was used more recently than block 2
+    assert list(cache.blocks) == [1, 3]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_drops_reorged_blocks(no_multicall):
+    cache = ReadCache()
+    method = FakeCall("0xabc", "0x01", 1)
+    cache.new_block(5, "0xa")
+    for block in [4, 5, 6]:
+        cache.call(method, block=block)
+    # the chain reorged to a different block 5
+    cache.new_block(5, "0xb")
+    assert list(cache.blocks) == [4]
+    cache.call(method, block=5)
+    cache.new_block(5, "0xb")
+    assert list(cache.blocks) == [4, 5]
+
+
+def test_cache_drops_deep_reorgs(no_multicall):
+    cache = ReadCache()
+    method = FakeCall("0xabc", "0x01", 1)
+    canonical = {3: "0x3", 4: "0x4", 5: "0x5", 6: "0x6"}
+    for block, block_hash in canonical.items():
+        cache.new_block(block, block_hash, canonical.get(block - 1))
+        cache.call(method, block=block)
+    # blocks 5 and 6 were replaced, the new head 7 builds on the new block 6
+    canonical.update({5: "0x5b", 6: "0x6b"})
+    checked = []
+
+    def get_hash(block):
+        checked.append(block)
+        return canonical[block]
+
+    cache.new_block(7, "0x7b", canonical[6], get_hash)
+    assert list(cache.blocks) == [3, 4]
+    # the parent hash covers block 6, the walk stops at the first match
+    assert checked == [5, 4]
+    # a head on the known chain doesn't fetch any hashes
+    cache.new_block(8, "0x8b", "0x7b", get_hash)
+    assert checked == [5, 4]
+
+
+def test_snapshots_share_cached_reads(
+    mock_gro_vault_usdc, primary_mock_strategy, secondary_mock_strategy
+):
+    strategies = {
+        "primary": primary_mock_strategy.address,
+        "secondary": secondary_mock_strategy.address,
+    }
+    block = chain.height
+    cache = ReadCache()
+    first = read_snapshots(mock_gro_vault_usdc, strategies, block, cache)
+    assert cache.stats()["misses"] == 10
+    assert read_snapshots(mock_gro_vault_usdc, strategies, block, cache) == first
+    assert cache.stats()["hits"] == 10
+    assert read_snapshots(mock_gro_vault_usdc, strategies, block) == first
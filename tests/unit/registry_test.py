@@ -0,0 +1,21 @@
+import pytest
+
+from scripts.scripts.registry import Registry
+
+
+def test_handles_resolve_once_on_first_use():
+    calls = []
+    handles = Registry()
+    handles.register("vault", lambda: calls.append("vault") or "0xvault")
+    handles.register("strategy", lambda: calls.append("strategy") or "0xstrategy")
+    assert calls == []
+
+    assert handles.vault == "0xvault"
+    assert handles.vault == "0xvault"
+    assert calls == ["vault"]
+    assert handles.resolved() == ["vault"]
+
+
+def test_unknown_handle():
+    with pytest.raises(AttributeError):
+        Registry().missing
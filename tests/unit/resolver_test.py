@@ -0,0 +1,204 @@
+from scripts.scripts.resolver import (
+    ZERO,
+    GuardState,
+    GuardStrategy,
+    can_unlock_loss,
+    resolve,
+    strategy_bulk_harvest,
+    strategy_harvest,
+    strategy_harvest_indexes,
+)
+
+BLOCK = 1000
+TIMESTAMP = 1_650_000_000
+STRATEGY_A = "0x0000000000000000000000000000000000000001"
+STRATEGY_B = "0x0000000000000000000000000000000000000002"
+
+
+def make_strategy(index, address, **kwargs):
+    fields = dict(
+        index=index,
+        address=address,
+        active=True,
+        can_harvest_with_loss=False,
+        loss_start_block=0,
+        time_limit=3600,
+        primer_timestamp=0,
+        can_stop_loss=False,
+        can_harvest=False,
+        estimated_total_assets=1_000_000 * 10**18,
+        total_debt=1_000_000 * 10**18,
+        excess_debt=0,
+        credit_available=0,
+    )
+    fields.update(kwargs)
+    return GuardStrategy(**fields)
+
+
+def make_state(strategies, gas_price=0):
+    return GuardState(
+        block=BLOCK,
+        timestamp=TIMESTAMP,
+        gas_price=gas_price,
+        gas_threshold=3_000_000,
+        debt_threshold=20_000 * 10**18,
+        loss_block_threshold=25,
+        eth_usd_price=2000 * 10**8,
+        eth_usd_decimals=8,
+        virtual_price=10**18,
+        strategies=strategies,
+    )
+
+
+def test_stop_loss_tasks_refer_to_first_strategy():
+    state = make_state(
+        [
+            make_strategy(0, ZERO),
+            make_strategy(1, STRATEGY_A, can_stop_loss=True),
+            make_strategy(
+                2,
+                STRATEGY_B,
+                can_stop_loss=True,
+                primer_timestamp=TIMESTAMP - 3600,
+            ),
+        ]
+    )
+    decisions = resolve(state)
+
+    primer = decisions["taskUpdateStopLossPrimer"]
+    assert primer.can_exec
+    assert primer.payload == ("setStopLossPrimer",)
+    assert primer.strategy == STRATEGY_A
+    assert not decisions["taskStopStopLossPrimer"].can_exec
+    stop_loss = decisions["taskTriggerStopLoss"]
+    assert stop_loss.can_exec
+    assert stop_loss.strategy == STRATEGY_B
+
+
+def test_stop_loss_waits_for_time_limit():
+    state = make_state(
+        [
+            make_strategy(
+                0, STRATEGY_A, can_stop_loss=True, primer_timestamp=TIMESTAMP - 3599
+            )
+        ]
+    )
+    assert not resolve(state)["taskTriggerStopLoss"].can_exec
+
+
+def test_unlock_loss_after_block_threshold():
+    locked = dict(estimated_total_assets=0, loss_start_block=BLOCK - 25)
+    state = make_state([make_strategy(0, STRATEGY_A, **locked)])
+    assert not can_unlock_loss(state).can_exec
+
+    locked["loss_start_block"] = BLOCK - 26
+    decision = can_unlock_loss(make_state([make_strategy(0, STRATEGY_A, **locked)]))
+    assert decision.can_exec
+    assert decision.payload == ("unlockLoss", STRATEGY_A)
+
+
+def test_unlock_loss_resets_recovered_strategy():
+    state = make_state([make_strategy(0, STRATEGY_A, loss_start_block=BLOCK)])
+    decision = can_unlock_loss(state)
+    assert decision.payload == ("resetLossStartBlock", STRATEGY_A)
+
+
+def test_unlock_loss_reverts_on_removed_strategy():
+    state = make_state(
+        [make_strategy(0, ZERO), make_strategy(1, STRATEGY_A, loss_start_block=1)]
+    )
+    decision = can_unlock_loss(state)
+    assert decision.reverted
+    assert not decision.can_exec
+
+
+def test_harvest_profit_against_gas_cost():
+    # 3M gas at 100 gwei with ETH at 2000 USD costs 600 USD
+    profit = dict(can_harvest=True, credit_available=600 * 10**18)
+    state = make_state(
+        [make_strategy(0, STRATEGY_A, **profit)], gas_price=100 * 10**9
+    )
+    assert not strategy_harvest(state).can_exec
+
+    profit["credit_available"] += 1
+    state = make_state(
+        [make_strategy(0, STRATEGY_A, **profit)], gas_price=100 * 10**9
+    )
+    decision = strategy_harvest(state)
+    assert decision.can_exec
+    assert decision.strategy == STRATEGY_A
+
+
+def test_harvest_skips_locked_strategy():
+    state = make_state(
+        [
+            make_strategy(
+                0,
+                STRATEGY_A,
+                can_harvest=True,
+                excess_debt=30_000 * 10**18,
+                loss_start_block=BLOCK,
+            ),
+            make_strategy(1, STRATEGY_B, can_harvest=True, credit_available=1),
+        ]
+    )
+    decision = strategy_harvest(state)
+    assert decision.triggers == (STRATEGY_B,)
+    # harvest() itself acts on the first harvestable strategy
+    assert decision.strategy == STRATEGY_A
+
+
+def test_bulk_harvest_acts_on_all_triggers():
+    state = make_state(
+        [
+            make_strategy(
+                0,
+                STRATEGY_A,
+                can_harvest=True,
+                excess_debt=30_000 * 10**18,
+                loss_start_block=BLOCK,
+            ),
+            make_strategy(1, STRATEGY_B, can_harvest=True, credit_available=1),
+            make_strategy(2, ZERO, can_harvest=True, credit_available=1),
+        ]
+    )
+    decision = strategy_bulk_harvest(state)
+    assert decision.can_exec
+    assert decision.payload == ("bulkHarvest",)
+    assert decision.triggers == (STRATEGY_B,)
+    assert decision.strategy == STRATEGY_B
+
+
+def test_indexed_tasks_target_every_trigger_by_position():
+    state = make_state(
+        [
+            make_strategy(0, STRATEGY_A, can_stop_loss=True),
+            make_strategy(1, ZERO, can_stop_loss=True),
+            make_strategy(2, STRATEGY_B, can_stop_loss=True, credit_available=1),
+        ]
+    )
+    decisions = resolve(state)
+    primer = decisions["taskUpdateStopLossPrimerIndexes"]
+    assert primer.payload == ("setStopLossPrimerIndexes", (0, 2))
+    assert primer.triggers == (STRATEGY_A, STRATEGY_B)
+    # the single strategy task reports the same triggers
+    assert decisions["taskUpdateStopLossPrimer"].triggers == primer.triggers
+    assert not decisions["taskTriggerStopLossIndexes"].can_exec
+
+
+def test_harvest_indexes_skip_locked_strategy():
+    state = make_state(
+        [
+            make_strategy(
+                0,
+                STRATEGY_A,
+                can_harvest=True,
+                excess_debt=30_000 * 10**18,
+                loss_start_block=BLOCK,
+            ),
+            make_strategy(1, STRATEGY_B, can_harvest=True, credit_available=1),
+        ]
+    )
+    decision = strategy_harvest_indexes(state)
+    assert decision.payload == ("bulkHarvestIndexes", (1,))
+    assert decision.strategy == STRATEGY_B
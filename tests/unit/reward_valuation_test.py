@@ -0,0 +1,61 @@
+import pytest
+
+from scripts.scripts.reward_valuation import (
+    MAX_SUPPLY,
+    MIN_WETH_SELL_AMOUNT,
+    REDUCTION_PER_CLIFF,
+    TOTAL_CLIFFS,
+    claimable_value,
+    cvx_minted,
+    eth_to_asset,
+)
+
+# sqrtPriceX96 of the USDC/ETH pool at 1250 USDC per ETH
+SQRT_PRICE_X96 = 2240910838991445596749277529098326
+VIRTUAL_PRICE = 102 * 10**16
+
+
+def mint_reference(crv, supply):
+    """Line by line transcription of the CVX mint in _claimableRewards"""
+    cliff = supply // REDUCTION_PER_CLIFF
+    cvx = 0
+    if cliff < TOTAL_CLIFFS:
+        reduction = TOTAL_CLIFFS - cliff
+        cvx = crv * reduction // TOTAL_CLIFFS
+        amt_till_max = MAX_SUPPLY - supply
+        if cvx > amt_till_max:
+            cvx = amt_till_max
+    return cvx
+
+
+@pytest.mark.parametrize(
+    "supply",
+    [0, 75_123_456 * 10**18, MAX_SUPPLY - 10**18, MAX_SUPPLY, MAX_SUPPLY + 1],
+)
+def test_cvx_minted_matches_cliff_schedule(supply):
+    crv = [0, 10**18, 12_345 * 10**18, 10**6 * 10**18]
+    minted = cvx_minted(crv, supply)
+    assert list(minted) == [mint_reference(amount, supply) for amount in crv]
+
+
+def test_eth_to_asset_matches_get_price_v3():
+    price = 2**192 * 10**18 // SQRT_PRICE_X96**2
+    expected = 10**18 * (price * 10**12 // VIRTUAL_PRICE)
+    assert eth_to_asset(10**18, SQRT_PRICE_X96, VIRTUAL_PRICE)[0] == expected
+    # roughly 1250 USD worth of 3crv
+    assert 1200 < expected / 1e18 < 1250
+
+
+def test_claimable_value_below_weth_minimum():
+    values = claimable_value(
+        [MIN_WETH_SELL_AMOUNT, MIN_WETH_SELL_AMOUNT, 0],
+        [0, 1, 0],
+        SQRT_PRICE_X96,
+        [VIRTUAL_PRICE] * 3,
+    )
+    assert values[0] == 0
+    assert (
+        values[1]
+        == eth_to_asset(MIN_WETH_SELL_AMOUNT + 1, SQRT_PRICE_X96, VIRTUAL_PRICE)[0]
+    )
+    assert values[2] == 0
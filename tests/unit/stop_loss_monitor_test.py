@@ -0,0 +1,50 @@
+from scripts.scripts.stop_loss_monitor import (
+    HealthSample,
+    HealthStore,
+    StopLossMonitor,
+    threshold_check,
+)
+
+
+def make_sample(block, trail, health_threshold=400):
+    return HealthSample(
+        block,
+        block * 12,
+        "convexMim",
+        "pool",
+        0,
+        10**18,
+        0,
+        trail,
+        health_threshold,
+        False,
+    )
+
+
+def test_threshold_check_matches_stop_loss_logic():
+    assert threshold_check(10**18, 10**18, 400) == (10_000, 0, False)
+    assert threshold_check(96 * 10**16, 10**18, 400) == (9_600, 400, False)
+    assert threshold_check(9599 * 10**14, 10**18, 400) == (9_599, 401, True)
+    # stopLossCheck returns false for strategies without a threshold
+    assert threshold_check(5 * 10**17, 10**18, 0) == (5_000, 5_000, False)
+
+
+def test_alerts_on_rate_of_change_and_headroom():
+    monitor = StopLossMonitor({}, {}, alert_rate=5, headroom=0.75)
+    assert monitor.alerts([make_sample(1, 10)]) == []
+    (alert,) = monitor.alerts([make_sample(3, 20)])
+    assert alert.reason == "trail moving 5.0 bps per block"
+    reasons = [a.reason for a in monitor.alerts([make_sample(4, 300)])]
+    assert reasons == [
+        "approaching health threshold",
+        "trail moving 280.0 bps per block",
+    ]
+    reasons = [a.reason for a in monitor.alerts([make_sample(5, 301)])]
+    assert reasons == ["approaching health threshold"]
+
+
+def test_store_keeps_series_per_block():
+    store = HealthStore(":memory:")
+    store.write([make_sample(1, 10), make_sample(2, 12)])
+    store.write([make_sample(2, 15)])
+    assert store.series("convexMim") == [(1, 10), (2, 15)]
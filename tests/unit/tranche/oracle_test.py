@@ -21,3 +21,12 @@ def test_get_single_price(admin, mockOracle):
 def test_get_total_value(admin, mockOracle):
     vp = mockOracle.getVirtualPrice()
     assert mockOracle.getTotalValue([LARGE_NUMBER]) == LARGE_NUMBER * vp / 1e18
+
+
+def test_get_price_context(admin, mockOracle):
+    mockOracle.setPrice(1.02e18)
+    prices = mockOracle.getPriceContext()
+    assert prices == [mockOracle.getVirtualPrice()]
+    assert LARGE_NUMBER * prices[0] // 1e18 == mockOracle.getSinglePrice(
+        TOKEN_IDS[0], LARGE_NUMBER, DEPOSIT
+    )
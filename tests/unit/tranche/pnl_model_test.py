@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+from brownie import chain
+from conftest import *
+
+from scripts.scripts.pnl_model import (
+    DEFAULT_DECIMALS,
+    DEFAULT_RATE,
+    YEAR_IN_SECONDS,
+    distribute_assets,
+    distribute_loss,
+    distribute_profit,
+    random_scenarios,
+)
+
+# number of model scenarios checked against the contract
+SAMPLE_SIZE = 20
+
+
+def solidity_div(a, b):
+    quotient = abs(a) // abs(b)
+    return -quotient if (a < 0) != (b < 0) else quotient
+
+
+def reference(loss, amount, junior, senior, rate, time_diff, threshold):
+    """Line by line transcription of PnLFixedRate for a single scenario"""
+    senior_profit = solidity_div(
+        senior * rate * time_diff, DEFAULT_DECIMALS * YEAR_IN_SECONDS
+    )
+    if loss:
+        if amount + senior_profit > junior:
+            return junior, amount - junior
+        return amount + senior_profit, -senior_profit
+    utilisation = solidity_div(senior * DEFAULT_DECIMALS, junior + 1)
+    if utilisation < threshold:
+        if junior < senior_profit - amount:
+            return -junior, amount + junior
+        return amount - senior_profit, senior_profit
+    return amount, 0
+
+
+def scaled(scenarios):
+    # move balances to 18 decimals, out of the int64 range
+    return {
+        key: value.astype(object) * 10**18
+        if key in ("amount", "junior", "senior")
+        else value
+        for key, value in scenarios.items()
+    }
+
+
+def test_model_fixed_rate_profit():
+    senior = 1000 * 10**18
+    junior, senior_profit = distribute_profit(
+        10**18, 2000 * 10**18, senior, DEFAULT_RATE, YEAR_IN_SECONDS
+    )
+    # 2% of the senior balance over a year
+    assert senior_profit == 20 * 10**18
+    assert junior == 10**18 - 20 * 10**18
+
+
+def test_model_profit_over_utilisation_threshold():
+    junior, senior = distribute_profit(
+        10**18, 1000 * 10**18, 1000 * 10**18, DEFAULT_RATE, YEAR_IN_SECONDS, 5000
+    )
+    assert (junior, senior) == (10**18, 0)
+
+
+def test_model_loss_wipes_junior():
+    junior, senior = distribute_loss(
+        150 * 10**18, 100 * 10**18, 1000 * 10**18, DEFAULT_RATE, 0
+    )
+    assert (junior, senior) == (100 * 10**18, 50 * 10**18)
+
+
+@pytest.mark.parametrize("threshold", [5000, 10000])
+def test_model_matches_reference(threshold):
+    scenarios = random_scenarios(2000, seed=threshold)
+    for inputs in [scenarios, scaled(scenarios)]:
+        junior, senior = distribute_assets(**inputs, utilisation_threshold=threshold)
+        for i in range(len(junior)):
+            expected = reference(
+                *[int(inputs[key][i]) for key in inputs], threshold=threshold
+            )
+            assert (int(junior[i]), int(senior[i])) == expected
+
+
+def test_model_dtype():
+    # whole unit balances run in int64, 18 decimal balances need python ints
+    scenarios = random_scenarios(100)
+    assert distribute_assets(**scenarios)[0].dtype == np.int64
+    assert distribute_assets(**scaled(scenarios))[0].dtype == object
+
+
+@pytest.mark.parametrize("rate", [DEFAULT_RATE, 1000, DEFAULT_DECIMALS])
+def test_model_matches_contract(
+    admin, users, tokens, tranche_fixed_rate, get_pnl_fixed_rate, rate
+):
+    pnl = get_pnl_fixed_rate
+    if rate != DEFAULT_RATE:
+        pnl.setRate(rate, {"from": admin})
+        # the pending rate is applied on the next distribution
+        setup_tranche(tokens, LARGE_NUMBER, users, tranche_fixed_rate)
+    chain.sleep(30 * 86400)
+    chain.mine()
+    block = chain[-1]
+    current_rate, _, last_distribution = pnl.fixedRate()
+    assert current_rate == rate
+    threshold = tranche_fixed_rate.utilisationThreshold()
+
+    scenarios = scaled(random_scenarios(SAMPLE_SIZE, seed=rate))
+    scenarios["rate"] = rate
+    scenarios["time_diff"] = block.timestamp - last_distribution
+    junior, senior = distribute_assets(**scenarios, utilisation_threshold=threshold)
+    for i in range(SAMPLE_SIZE):
+        method = pnl.distributeLoss if scenarios["loss"][i] else pnl.distributeProfit
+        balances = [int(scenarios["junior"][i]), int(scenarios["senior"][i])]
+        expected = method(
+            int(scenarios["amount"][i]), balances, block_identifier=block.number
+        )
+        assert [int(junior[i]), int(senior[i])] == list(expected)
@@ -0,0 +1,198 @@
+import numpy as np
+import pytest
+from brownie import PnL
+from conftest import *
+
+from scripts.scripts.pnl_model import DEFAULT_RATE, YEAR_IN_SECONDS, random_scenarios
+from scripts.scripts.tranche_sim import (
+    BASE,
+    INIT_BASE_JUNIOR,
+    JUNIOR,
+    SENIOR,
+    FixedRatePnLModel,
+    PnLModel,
+    Step,
+    TrancheSimulator,
+    event_steps,
+    seed_simulator,
+    simulate,
+    synthetic_steps,
+)
+
+UNIT = 10**18
+# number of model steps checked against the contract
+SAMPLE_SIZE = 20
+
+
+def profit_reference(amount, junior, senior, junior_loss):
+    """Line by line transcription of PnL.distributeProfit"""
+    utilisation = (senior * 10000) // (junior + 1)
+    if amount > junior_loss and utilisation < 10000:
+        amount -= junior_loss
+        senior_profit = amount * utilisation // (10000 + utilisation)
+        junior_profit = junior_loss + amount - senior_profit
+        if utilisation < 8000:
+            utilisation = utilisation * 3 // 8 + 3000
+        else:
+            utilisation = (utilisation - 8000) * 2 + 6000
+        from_senior = senior_profit * utilisation // 10000
+        return junior_profit + from_senior, senior_profit - from_senior
+    return amount, 0
+
+
+def simulator(pnl=None, paths=1, junior=1000 * UNIT, senior=500 * UNIT, **kwargs):
+    return seed_simulator(
+        TrancheSimulator(pnl or PnLModel(), paths, **kwargs), junior, senior
+    )
+
+
+def test_sim_initial_deposits():
+    sim = simulator()
+    (junior, senior), _, _ = sim.pnl_distribution()
+    assert (junior[0], senior[0]) == (1000 * UNIT, 500 * UNIT)
+    assert sim.supply[JUNIOR][0] == 1000 * INIT_BASE_JUNIOR
+    assert sim.price_per_share(JUNIOR)[0] == BASE * BASE // INIT_BASE_JUNIOR
+    assert sim.price_per_share(SENIOR)[0] == BASE
+    assert sim.utilisation()[0] == 5000
+
+
+def test_sim_profit_distribution():
+    sim = simulator()
+    sim.accrue(100 * UNIT)
+    (junior, senior), profit, loss = sim.pnl_distribution()
+    junior_profit, senior_profit = profit_reference(
+        100 * UNIT, 1000 * UNIT, 500 * UNIT, 0
+    )
+    assert (profit[0], loss[0]) == (100 * UNIT, 0)
+    assert junior[0] == 1000 * UNIT + junior_profit
+    assert senior[0] == 500 * UNIT + senior_profit
+
+
+def test_sim_junior_loss_recovered_first():
+    sim = simulator()
+    sim.accrue(-50 * UNIT)
+    # realise the loss through an interaction
+    sim.deposit(JUNIOR, UNIT)
+    assert sim.pnl_state["junior_loss"][0] == 50 * UNIT
+    sim.accrue(30 * UNIT)
+    (junior, senior), _, _ = sim.pnl_distribution()
+    assert (junior[0], senior[0]) == (981 * UNIT, 500 * UNIT)
+
+
+def test_sim_senior_deposit_over_threshold_rejected():
+    sim = simulator()
+    accepted = sim.deposit(SENIOR, 600 * UNIT)
+    assert not accepted[0]
+    assert sim.balances[SENIOR][0] == 500 * UNIT
+    assert sim.assets[0] == 1500 * UNIT
+
+
+def test_sim_deposit_below_minimum_rejected():
+    sim = simulator()
+    assert not sim.deposit(JUNIOR, UNIT - 1)[0]
+
+
+def test_sim_loss_wipes_junior():
+    sim = simulator()
+    sim.accrue(-1200 * UNIT)
+    (junior, senior), _, loss = sim.pnl_distribution()
+    assert (junior[0], senior[0], loss[0]) == (0, 300 * UNIT, 1200 * UNIT)
+    assert sim.price_per_share(JUNIOR)[0] == 0
+    accepted, _ = sim.withdraw(JUNIOR, UNIT)
+    assert not accepted[0]
+
+
+def test_sim_withdraw_by_value():
+    sim = simulator()
+    sim.accrue(100 * UNIT)
+    accepted, value = sim.withdraw(JUNIOR, 100 * UNIT, by_value=True)
+    assert accepted[0]
+    # rounding of the token amount may cost a wei
+    assert 100 * UNIT - value[0] <= 1
+    accepted, value = sim.withdraw(SENIOR, 100 * UNIT)
+    assert (accepted[0], value[0]) == (True, 100 * UNIT)
+
+
+def test_sim_junior_withdraw_over_threshold_rejected():
+    sim = simulator(senior=900 * UNIT)
+    accepted, value = sim.withdraw(JUNIOR, 200 * UNIT, by_value=True)
+    assert not accepted[0]
+    assert value[0] == 0
+    assert sim.balances[JUNIOR][0] == 1000 * UNIT
+
+
+def test_sim_fixed_rate():
+    sim = simulator(FixedRatePnLModel())
+    sim.timestamp = YEAR_IN_SECONDS
+    (junior, senior), _, _ = sim.pnl_distribution()
+    senior_profit = 500 * UNIT * DEFAULT_RATE // 10000
+    assert (junior[0], senior[0]) == (
+        1000 * UNIT - senior_profit,
+        500 * UNIT + senior_profit,
+    )
+    # distributions restart the clock and apply pending rates
+    sim.pnl.set_rate(sim.pnl_state, 1000)
+    sim.deposit(JUNIOR, UNIT)
+    assert sim.pnl_state["last_distribution"][0] == YEAR_IN_SECONDS
+    assert sim.pnl_state["rate"][0] == 1000
+
+
+def test_sim_paths_are_independent():
+    sim = simulator(paths=3)
+    sim.accrue(np.array([0, 10 * UNIT, -10 * UNIT], dtype=object))
+    accepted = sim.deposit(SENIOR, np.array([600, 400, 510], dtype=object) * UNIT)
+    assert list(accepted) == [False, True, False]
+    assert list(sim.balances[SENIOR] == 500 * UNIT) == [True, False, True]
+
+
+def test_sim_event_steps():
+    steps = event_steps(
+        [
+            (10, "deposit", JUNIOR, 5 * UNIT),
+            (10, "yield", None, UNIT),
+            (20, "withdraw", SENIOR, 2 * UNIT),
+            (20, "withdraw", JUNIOR, UNIT),
+        ]
+    )
+    assert steps == [
+        Step(10, UNIT, 5 * UNIT, 0),
+        Step(20, 0, -UNIT, -2 * UNIT),
+    ]
+
+
+@pytest.mark.parametrize("pnl", [PnLModel, FixedRatePnLModel])
+def test_sim_series_conserve_assets(pnl):
+    paths, days = 50, 30
+    sim = simulator(pnl(), paths, 10_000_000 * UNIT, 5_000_000 * UNIT)
+    series = simulate(sim, synthetic_steps(paths, days, seed=1))
+    assert series["junior"].shape == (days, paths)
+    # the tranches always split the full value of the underlying
+    total = series["junior"][-1] + series["senior"][-1]
+    assert (total == sim.assets).all()
+    assert (series["junior_price"] > 0).all()
+
+
+def test_pnl_model_matches_contract(admin):
+    # admin stands in for the tranche so distributeAssets can be called directly
+    pnl = admin.deploy(PnL, admin)
+    model = PnLModel()
+    state = model.initial_state(1)
+    scenarios = random_scenarios(SAMPLE_SIZE, seed=2)
+    for i in range(SAMPLE_SIZE):
+        loss = bool(scenarios["loss"][i])
+        amount, junior, senior = (
+            int(scenarios[key][i]) * UNIT for key in ("amount", "junior", "senior")
+        )
+        method = pnl.distributeLoss if loss else pnl.distributeProfit
+        expected = method(amount, [junior, senior])
+        amounts, state = model.distribute_assets(
+            state,
+            np.array([loss]),
+            *(np.array([value], dtype=object) for value in (amount, junior, senior)),
+            0,
+            0,
+        )
+        assert [int(amounts[0][0]), int(amounts[1][0])] == list(expected)
+        # carry the junior loss forward on both sides
+        pnl.distributeAssets(loss, amount, [junior, senior], {"from": admin})
+        assert pnl.juniorLoss() == state["junior_loss"][0]
@@ -1,105 +1,9 @@
 import pytest
-from brownie import (
-    ZERO_ADDRESS,
-    GRouter,
-    GVault,
-    MockCurveOracle,
-    MockGToken,
-    MockGTranche,
-    MockZapperOracle,
-    StableSwap3Pool,
-)
+from brownie import ZERO_ADDRESS, GVault
 from conftest import *
 
-
-@pytest.fixture(scope="function", autouse=True)
-def mock_three_pool(admin, mock_dai, mock_usdc, mock_usdt, mock_three_crv):
-    three_pool = admin.deploy(
-        StableSwap3Pool,
-        admin,
-        [mock_dai.address, mock_usdc.address, mock_usdt.address],
-        mock_three_crv.address,
-        100,
-        4000000,
-        0,
-    )
-    mock_three_crv.set_minter(three_pool.address, {"from": admin})
-    yield three_pool
-
-
-@pytest.fixture(scope="function", autouse=True)
-def mock_curve_oracle(admin):
-    mock_curve_oracle = admin.deploy(MockCurveOracle)
-    yield mock_curve_oracle
-
-
-@pytest.fixture(scope="function", autouse=True)
-def junior_tranche_token(admin):
-    junior_tranche_token = admin.deploy(MockGToken, "JUNIOR", "GVT")
-    yield junior_tranche_token
-
-
-@pytest.fixture(scope="function", autouse=True)
-def senior_tranche_token(admin):
-    senior_tranche_token = admin.deploy(MockGToken, "SENIOR", "PWRD")
-    yield senior_tranche_token
-
-
-@pytest.fixture(scope="function", autouse=True)
-def mock_gtranche(
-    admin,
-    mock_gro_vault_curve,
-    junior_tranche_token,
-    senior_tranche_token,
-    mock_curve_oracle,
-):
-    mock_gtranche = admin.deploy(
-        MockGTranche,
-        [mock_gro_vault_curve.address],
-        [junior_tranche_token, senior_tranche_token],
-        mock_curve_oracle.address,
-    )
-    yield mock_gtranche
-
-
-@pytest.fixture(scope="function", autouse=True)
-def mock_zapper_oracle(admin, mock_dai, mock_usdc, mock_usdt):
-    mock_zapper_oracle = admin.deploy(
-        MockZapperOracle,
-        [mock_dai.address, mock_usdc.address, mock_usdt.address],
-    )
-    yield mock_zapper_oracle
-
-
-@pytest.fixture(scope="function", autouse=True)
-def gro_zapper(
-    admin,
-    mock_gtranche,
-    mock_gro_vault_curve,
-    mock_zapper_oracle,
-    mock_three_pool,
-    mock_three_crv,
-):
-    gro_zapper = admin.deploy(
-        GRouter,
-        mock_gtranche.address,
-        mock_gro_vault_curve.address,
-        mock_zapper_oracle.address,
-        mock_three_pool.address,
-        mock_three_crv.address,
-    )
-    yield gro_zapper
-
-
-@pytest.fixture(scope="function", autouse=True)
-def load_up_three_pool(mock_dai, mock_usdc, mock_usdt, mock_three_pool, accounts):
-    mock_dai.faucet({"from": accounts[9]})
-    mock_usdc.faucet({"from": accounts[9]})
-    mock_usdt.faucet({"from": accounts[9]})
-    mock_dai.approve(mock_three_pool.address, MAX_UINT256, {"from": accounts[9]})
-    mock_usdc.approve(mock_three_pool.address, MAX_UINT256, {"from": accounts[9]})
-    mock_usdt.approve(mock_three_pool.address, MAX_UINT256, {"from": accounts[9]})
-    mock_three_pool.add_liquidity([1e22, 1e10, 1e10], 0, {"from": accounts[9]})
+# the zapper fixtures live in tests/zapper.py, every test needs 3pool liquidity
+pytestmark = pytest.mark.usefixtures("load_up_three_pool")
 
 
 # Test that user can deposit  and withdraw via the Zapper
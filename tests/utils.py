@@ -1,6 +1,7 @@
 from typing import List
 
-from brownie import web3
+from brownie import chain, web3
+from brownie.network.state import _notify_registry
 
 MAX_UINT256 = 2**256 - 1
 YEAR_IN_SECONDS = 31556952
@@ -12,6 +13,22 @@ def move_time(add_time):
     web3.provider.make_request("evm_mine", [])
 
 
+# Raw snapshots rather than chain.snapshot and chain.revert: brownie only keeps
+# one snapshot, and the deployer tests take one inside the per-test isolate
+# snapshot. After a raw revert brownie's view of the chain is resynced by hand:
+# chain.sleep(0) reloads its time offset from the node, and _notify_registry
+# drops the reverted transactions from the history and the deployed contract
+# containers, as chain.revert does internally.
+def evm_snapshot() -> str:
+    return web3.provider.make_request("evm_snapshot", [])["result"]
+
+
+def evm_revert(snapshot_id: str):
+    web3.provider.make_request("evm_revert", [snapshot_id])
+    chain.sleep(0)
+    _notify_registry()
+
+
 def error_string(custom_error: str) -> str:
     expected_revert_string = "typed error: " + web3.keccak(text=custom_error)[:4].hex()
     return expected_revert_string